@@ -0,0 +1,351 @@
+"""
+Benchmarks de desempenho das funções numéricas do pacote.
+
+Mede o tempo de cada ponto de entrada público para tamanhos de entrada
+crescentes (potências de 10), calcula a vazão e ajusta uma curva de
+complexidade t ~ c * n^k por mínimos quadrados em escala log-log.
+Os resultados são salvos em JSON e podem ser comparados com uma execução
+anterior para detectar regressões de desempenho.
+
+Uso:
+    python benchmarks/benchmark.py --tamanho-maximo 1e6 --saida atual.json
+    python benchmarks/benchmark.py --saida novo.json --comparar atual.json
+"""
+
+import argparse
+import json
+import math
+import platform
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+import numpy as np
+
+import cb2325numericag8
+from cb2325numericag8.aproximacao.minimos_quadrados import AproximacaoPolinomial
+from cb2325numericag8.aproximacao.regressao_linear import ajuste_linear
+from cb2325numericag8.erros.erros import erro_absoluto, erro_relativo, erro_quadratico_medio
+from cb2325numericag8.integracao.integracao import integral, integral_lote
+from cb2325numericag8.interpolacao.interpolador_hermite import InterpoladorHermite
+from cb2325numericag8.interpolacao.interpolador_linear_por_partes import InterpolacaoLinearPorPartes
+from cb2325numericag8.interpolacao.interpolador_polinomial import InterpoladorPolinomial
+from cb2325numericag8.raizes.raizes import raiz, raiz_lote
+from cb2325numericag8.utils.kahan import soma_kahan
+
+# Tempo mínimo de cada medição; chamadas mais rápidas são repetidas.
+TEMPO_MINIMO = 0.02
+
+
+def _preparar_integral(metodo):
+    def preparar(n):
+        return lambda: integral(np.sin, 0.0, np.pi, n=n, metodo=metodo)
+    return preparar
+
+
+def _preparar_integral_lote(n):
+    # O tamanho é o número de intervalos integrados com 20 nós de Gauss cada.
+    limites_b = np.linspace(1.0, 4.0, n)
+    return lambda: integral_lote(np.sin, 0.0, limites_b, metodo="Gauss")
+
+
+def _preparar_raiz(metodo):
+    # O tamanho é o número de equações x^3 - c = 0 resolvidas em sequência.
+    def preparar(n):
+        constantes = np.linspace(1.0, 8.0, n)
+
+        def executar():
+            for c in constantes:
+                f = lambda x, c=c: x**3 - c
+                if metodo == "newton_raphson":
+                    raiz(f, 2.0, f_prime=lambda x: 3 * x**2, method=metodo)
+                else:
+                    raiz(f, 0.5, 2.5, method=metodo)
+        return executar
+    return preparar
+
+
+def _preparar_raiz_lote(metodo):
+    # Mesmas equações x^3 - c = 0, resolvidas juntas em uma chamada.
+    def preparar(n):
+        constantes = np.linspace(1.0, 8.0, n)
+        f = lambda x, c: x**3 - c
+        if metodo == "newton_raphson":
+            return lambda: raiz_lote(f, 2.0, f_prime=lambda x, c: 3 * x**2,
+                                     method=metodo, args=(constantes,))
+        return lambda: raiz_lote(f, 0.0, 3.0, method=metodo, args=(constantes,))
+    return preparar
+
+
+def _preparar_interpolador_polinomial(n):
+    x = list(np.linspace(-1.0, 1.0, n))
+    y = [float(v) for v in np.cos(x)]
+
+    def executar():
+        p = InterpoladorPolinomial(x, y)
+        for ponto in (-0.5, 0.0, 0.5):
+            p(ponto)
+    return executar
+
+
+def _preparar_interpolador_hermite(n):
+    x = [float(v) for v in np.linspace(-1.0, 1.0, n)]
+    y = [float(v) for v in np.cos(x)]
+    dy = [float(v) for v in -np.sin(x)]
+
+    def executar():
+        h = InterpoladorHermite(x, y, dy)
+        for ponto in (-0.5, 0.0, 0.5):
+            h(ponto)
+    return executar
+
+
+def _preparar_linear_por_partes(n):
+    x = np.linspace(0.0, 1.0, n)
+    y = np.sqrt(x)
+    pontos = np.linspace(0.0, 1.0, 1000)
+
+    def executar():
+        interpolador = InterpolacaoLinearPorPartes(x, y)
+        for ponto in pontos:
+            interpolador(ponto)
+    return executar
+
+
+def _preparar_aproximacao_polinomial(n):
+    x = list(np.linspace(0.0, 1.0, n))
+    y = list(np.exp(x))
+    return lambda: AproximacaoPolinomial(x, y, grau=3)
+
+
+def _preparar_ajuste_linear(n):
+    x = np.linspace(0.0, 1.0, n)
+    y = 3 * x + 2 + np.sin(50 * x)
+    return lambda: ajuste_linear(x, y, plot=False)
+
+
+def _preparar_erro_escalar(funcao):
+    # O tamanho é o número de chamadas da função escalar.
+    def preparar(n):
+        reais = np.linspace(1.0, 2.0, n)
+
+        def executar():
+            for v in reais:
+                funcao(v, v + 1e-3)
+        return executar
+    return preparar
+
+
+def _preparar_erro_quadratico_medio(n):
+    reais = np.linspace(0.0, 1.0, n)
+    aproximados = reais + 1e-3
+    return lambda: erro_quadratico_medio(reais, aproximados)
+
+
+def _preparar_soma_kahan_array(n):
+    valores = np.random.default_rng(0).standard_normal(n)
+    return lambda: soma_kahan(valores)
+
+
+def _preparar_soma_kahan_lista(n):
+    valores = list(np.random.default_rng(0).standard_normal(n))
+    return lambda: soma_kahan(valores)
+
+
+# Nome do caso -> (função que prepara a chamada para um tamanho n, maior n medido).
+CASOS = {
+    "integral_trapezoidal": (_preparar_integral("Trapezoidal"), 10**7),
+    "integral_simpson": (_preparar_integral("Simpson"), 10**7),
+    "integral_lote": (_preparar_integral_lote, 10**6),
+    "raiz_bissecao": (_preparar_raiz("bissecao"), 10**5),
+    "raiz_secante": (_preparar_raiz("secante"), 10**5),
+    "raiz_newton_raphson": (_preparar_raiz("newton_raphson"), 10**5),
+    "raiz_lote_bissecao": (_preparar_raiz_lote("bissecao"), 10**6),
+    "raiz_lote_newton_raphson": (_preparar_raiz_lote("newton_raphson"), 10**6),
+    "InterpoladorPolinomial": (_preparar_interpolador_polinomial, 10**3),
+    "InterpoladorHermite": (_preparar_interpolador_hermite, 10**3),
+    "InterpolacaoLinearPorPartes": (_preparar_linear_por_partes, 10**5),
+    "AproximacaoPolinomial": (_preparar_aproximacao_polinomial, 10**6),
+    "ajuste_linear": (_preparar_ajuste_linear, 10**7),
+    "erro_absoluto": (_preparar_erro_escalar(erro_absoluto), 10**6),
+    "erro_relativo": (_preparar_erro_escalar(erro_relativo), 10**6),
+    "erro_quadratico_medio": (_preparar_erro_quadratico_medio, 10**7),
+    "soma_kahan_array": (_preparar_soma_kahan_array, 10**7),
+    "soma_kahan_lista": (_preparar_soma_kahan_lista, 10**6),
+}
+
+
+def medir(chamada, repeticoes=3):
+    """
+    Mede o tempo de uma chamada, em segundos.
+
+    Chamadas mais rápidas que TEMPO_MINIMO são repetidas em laço e o tempo
+    é dividido pelo número de execuções. Retorna o menor tempo entre as
+    repetições.
+
+    Args:
+        chamada (callable): Função sem argumentos a ser medida.
+        repeticoes (int, optional): Número de medições independentes.
+
+    Returns:
+        float: Tempo por chamada.
+    """
+
+    inicio = time.perf_counter()
+    chamada()
+    tempo = time.perf_counter() - inicio
+    laco = max(1, int(TEMPO_MINIMO / max(tempo, 1e-9)))
+
+    melhores = [tempo]
+    for _ in range(repeticoes - 1 if laco == 1 else repeticoes):
+        inicio = time.perf_counter()
+        for _ in range(laco):
+            chamada()
+        melhores.append((time.perf_counter() - inicio) / laco)
+    return min(melhores)
+
+
+def ajustar_complexidade(tamanhos, tempos):
+    """
+    Ajusta t = c * n^k por mínimos quadrados em escala log-log.
+
+    Tamanhos cujo tempo está abaixo de 1 ms são ignorados, pois nesse regime
+    o custo fixo de cada chamada domina a medição.
+
+    Returns:
+        dict or None: Expoente k e constante c, ou None com menos de dois pontos.
+    """
+
+    pontos = [(n, t) for n, t in zip(tamanhos, tempos) if t >= 1e-3]
+    if len(pontos) < 2:
+        pontos = list(zip(tamanhos, tempos))[-2:]
+    if len(pontos) < 2:
+        return None
+    log_n = np.log([n for n, _ in pontos])
+    log_t = np.log([t for _, t in pontos])
+    k, log_c = np.polyfit(log_n, log_t, 1)
+    return {"expoente": float(k), "constante": float(math.exp(log_c))}
+
+
+def executar(casos=None, tamanho_maximo=10**7, repeticoes=3, saida_texto=sys.stdout):
+    """
+    Executa os benchmarks escolhidos.
+
+    Args:
+        casos (list of str, optional): Nomes dos casos. Se None, executa todos.
+        tamanho_maximo (int, optional): Maior tamanho de entrada medido.
+        repeticoes (int, optional): Número de medições por tamanho.
+        saida_texto (file, optional): Onde imprimir o progresso (None para silenciar).
+
+    Raises:
+        ValueError: Se algum caso não existir.
+
+    Returns:
+        dict: Resultados no formato salvo em JSON.
+    """
+
+    casos = list(CASOS) if casos is None else casos
+    desconhecidos = [nome for nome in casos if nome not in CASOS]
+    if desconhecidos:
+        raise ValueError(f"Erro: casos desconhecidos: {', '.join(desconhecidos)}")
+
+    resultados = {}
+    for nome in casos:
+        preparar, limite = CASOS[nome]
+        tamanhos = [10**p for p in range(1, 8) if 10**p <= min(limite, tamanho_maximo)]
+        tempos = []
+        for n in tamanhos:
+            tempos.append(medir(preparar(n), repeticoes))
+            if saida_texto is not None:
+                print(f"{nome:<30} n={n:<10} {tempos[-1]:.3e} s  "
+                      f"{n / tempos[-1]:.3e} elem/s", file=saida_texto)
+        resultados[nome] = {
+            "tamanhos": tamanhos,
+            "tempos": tempos,
+            "vazao": [n / t for n, t in zip(tamanhos, tempos)],
+            "complexidade": ajustar_complexidade(tamanhos, tempos),
+        }
+
+    return {
+        "versao": cb2325numericag8.__version__,
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "plataforma": platform.platform(),
+        "data": datetime.now(timezone.utc).isoformat(),
+        "resultados": resultados,
+    }
+
+
+def comparar(atual, anterior, limite=1.25):
+    """
+    Compara duas execuções e lista os casos que ficaram mais lentos.
+
+    Args:
+        atual (dict): Resultados da execução atual.
+        anterior (dict): Resultados de referência.
+        limite (float, optional): Razão de tempo a partir da qual há regressão.
+
+    Returns:
+        list of tuple: (caso, tamanho, razão atual/anterior) das regressões.
+    """
+
+    regressoes = []
+    for nome, dados in atual["resultados"].items():
+        referencia = anterior.get("resultados", {}).get(nome)
+        if referencia is None:
+            continue
+        tempos_ref = dict(zip(referencia["tamanhos"], referencia["tempos"]))
+        for n, t in zip(dados["tamanhos"], dados["tempos"]):
+            if n in tempos_ref and t / tempos_ref[n] > limite:
+                regressoes.append((nome, n, t / tempos_ref[n]))
+    return regressoes
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--casos", nargs="*", default=None,
+                        help="casos a executar (padrão: todos)")
+    parser.add_argument("--tamanho-maximo", type=float, default=1e7,
+                        help="maior tamanho de entrada (padrão: 1e7)")
+    parser.add_argument("--repeticoes", type=int, default=3)
+    parser.add_argument("--saida", type=Path, default=None,
+                        help="arquivo JSON onde salvar os resultados")
+    parser.add_argument("--comparar", type=Path, default=None,
+                        help="arquivo JSON de uma execução anterior")
+    parser.add_argument("--limite", type=float, default=1.25,
+                        help="razão de tempo considerada regressão (padrão: 1.25)")
+    parser.add_argument("--listar", action="store_true", help="lista os casos e sai")
+    args = parser.parse_args(argv)
+
+    if args.listar:
+        print("\n".join(CASOS))
+        return 0
+
+    resultados = executar(args.casos, int(args.tamanho_maximo), args.repeticoes)
+
+    print()
+    for nome, dados in resultados["resultados"].items():
+        ajuste = dados["complexidade"]
+        if ajuste is not None:
+            print(f"{nome:<30} t ~ {ajuste['constante']:.2e} * n^{ajuste['expoente']:.2f}")
+
+    if args.saida is not None:
+        args.saida.write_text(json.dumps(resultados, indent=2))
+
+    if args.comparar is not None:
+        anterior = json.loads(args.comparar.read_text())
+        regressoes = comparar(resultados, anterior, args.limite)
+        for nome, n, razao in regressoes:
+            print(f"REGRESSÃO {nome} n={n}: {razao:.2f}x mais lento")
+        return 1 if regressoes else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,10 +1,14 @@
-from . import aproximacao as aproximacao
-from . import erros as erros
-from . import grafico as grafico
-from . import integracao as integracao
-from . import interpolacao as interpolacao
-from . import raizes as raizes
-from . import utils as utils
+from cb2325numericag8.utils.importacao import importacao_preguicosa
 
 __all__ = ["aproximacao", "erros", "grafico", "integracao", "interpolacao", "raizes", "utils"]
 __version__ = "0.2.1"
+
+# Os subpacotes são importados apenas no primeiro acesso (PEP 562), para
+# que `import cb2325numericag8` não carregue o matplotlib.
+__getattr__ = importacao_preguicosa(
+    __name__, {nome: f"{__name__}.{nome}" for nome in __all__}
+)
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,7 +1,14 @@
 import numpy as np
-from cb2325numericag8.grafico.grafico_minimos_quadrados import plot_aproximacao
 from cb2325numericag8.aproximacao.regressao_linear import ajuste_linear
+from cb2325numericag8.utils.importacao import importacao_preguicosa
+from cb2325numericag8.utils.instrumentacao import instrumentado, fase
 
+# A função de gráfico é carregada sob demanda, para não importar o matplotlib.
+__getattr__ = importacao_preguicosa(__name__, {
+    'plot_aproximacao': 'cb2325numericag8.grafico.grafico_minimos_quadrados:plot_aproximacao',
+})
+
+@instrumentado
 def AproximacaoPolinomial(abscissas: list, ordenadas: list, grau: int = 1, plot: bool = False, n: int = 500) -> list:
     """
     Aproxima os pontos (x, y) por um polinômio de grau n usando mínimos quadrados e plota o gráfico.
@@ -93,6 +100,8 @@ def AproximacaoPolinomial(abscissas: list, ordenadas: list, grau: int = 1, plot:
     coeficientes = [float(f"{coef:.10f}") for coef in beta]
     
     if plot:
-        plot_aproximacao(abscissas, ordenadas, coeficientes, n)
+        with fase("grafico"):
+            from cb2325numericag8.grafico.grafico_minimos_quadrados import plot_aproximacao
+            plot_aproximacao(abscissas, ordenadas, coeficientes, n)
     
     return coeficientes
@@ -1,31 +1,68 @@
-import matplotlib.pyplot as plt
-from cb2325numericag8.grafico.grafico_ajuste_linear import grafico_ajuste_linear
+import numpy as np
+from cb2325numericag8.utils.importacao import importacao_preguicosa
+from cb2325numericag8.utils.instrumentacao import instrumentado, fase
+from cb2325numericag8.utils.kahan import soma_kahan
+from cb2325numericag8.utils.produto_compensado import produto_escalar_compensado, soma_quadrados_compensada
+
+# A função de gráfico é carregada sob demanda, para não importar o matplotlib.
+__getattr__ = importacao_preguicosa(__name__, {
+    'grafico_ajuste_linear': 'cb2325numericag8.grafico.grafico_ajuste_linear:grafico_ajuste_linear',
+})
+
+@instrumentado
 def ajuste_linear(x, y, plot=True):
     """
     Calcula o ajuste linear dos dados (mínimos quadrados).
 
+    As somas são calculadas com soma e produto escalar compensados.
+
     Parâmetros:
     x, y : listas ou arrays numéricos
     plot : bool (opcional)
         Se True, mostra o gráfico dos pontos e da reta ajustada.
 
+    Raises:
+    TypeError : se x ou y não forem listas ou arrays numéricos
+    ValueError : se x e y não tiverem a mesma quantidade de elementos
+
     Retorna:
     a, b : coeficientes da reta ajustada (y = a*x + b)
     """
-    n = len(x)
-    soma_x = sum(x)
-    soma_y = sum(y)
-    soma_xy = sum(xi * yi for xi, yi in zip(x, y))
-    soma_x2 = sum(xi**2 for xi in x)
+    x = _como_vetor(x)
+    y = _como_vetor(y)
+    if x.size != y.size:
+        raise ValueError("Erro: x e y devem possuir a mesma quantidade de elementos.")
+
+    n = x.size
+    with fase("soma"):
+        soma_x = soma_kahan(x)
+        soma_y = soma_kahan(y)
+        soma_xy = produto_escalar_compensado(x, y)
+        soma_x2 = soma_quadrados_compensada(x)
 
     a = (n * soma_xy - soma_x * soma_y) / (n * soma_x2 - soma_x**2)
     b = (soma_y - a * soma_x) / n
 
     if plot:
-        grafico_ajuste_linear(x,y,a,b)
+        with fase("grafico"):
+            from cb2325numericag8.grafico.grafico_ajuste_linear import grafico_ajuste_linear
+            grafico_ajuste_linear(x,y,a,b)
 
     return a, b
 
+
+def _como_vetor(valores):
+    """
+    Converte os dados de entrada em um array unidimensional de floats.
+    """
+    try:
+        vetor = np.asarray(valores, dtype=float)
+    except (TypeError, ValueError):
+        raise TypeError("Erro: x e y devem ser listas ou arrays numéricos.")
+    if vetor.ndim != 1:
+        raise TypeError("Erro: x e y devem ser listas ou arrays numéricos.")
+    return vetor
+
 # Exemplo de uso
 if __name__ == "__main__":
     x = [0, 1, 2, 3, 4]
@@ -1,6 +1,12 @@
-from cb2325numericag8.utils.kahan import soma_kahan
+import numpy as np
+from cb2325numericag8.utils.blocos import iterar_blocos, para_floats, TAMANHO_BLOCO
+from cb2325numericag8.utils.instrumentacao import instrumentado, fase
+from cb2325numericag8.utils.kahan import KahanAccumulator, _soma_dupla, _two_sum
+from cb2325numericag8.utils.produto_compensado import soma_quadrados_compensada
+from cb2325numericag8.utils.validacao import validar_precisao
 
 
+@instrumentado
 def erro_absoluto(v_real, v_aproximado, precisao=None):
     """
     Retorna o erro absoluto para um valor de referência dado e um valor obtido.
@@ -23,13 +29,13 @@ def erro_absoluto(v_real, v_aproximado, precisao=None):
     except ValueError:
         raise ValueError("Erro: os valores real e aproximado devem ser numéricos.")
     erro = abs(v_real - v_aproximado)
+    validar_precisao(precisao)
     if precisao is not None:
-        if not isinstance(precisao, int) or precisao < 0:
-            raise ValueError("Erro: precisão deve ser um inteiro não negativo.")
         return round(erro, precisao)
     return erro
 
 
+@instrumentado
 def erro_relativo(v_real, v_aproximado, precisao=None):
     """
     Retorna o erro relativo para um valor de referência dado e um valor obtido.
@@ -57,22 +63,99 @@ def erro_relativo(v_real, v_aproximado, precisao=None):
             "Erro: o valor real não pode ser zero para o cálculo do erro relativo."
         )
     erro = abs((v_real - v_aproximado) / v_real)
+    validar_precisao(precisao)
     if precisao is not None:
-        if not isinstance(precisao, int) or precisao < 0:
-            raise ValueError("Erro: precisão deve ser um inteiro não negativo.")
         return round(erro, precisao)
     return erro
 
 
-def erro_quadratico_medio(lista_real, lista_aproximada, precisao=None):
+@instrumentado
+def erro_absoluto_lote(v_real, v_aproximado, precisao=None, out=None):
+    """
+    Retorna os erros absolutos elemento a elemento para arrays de valores.
+
+    Versão vetorizada de `erro_absoluto`: os valores são comparados em uma
+    única passada, com as regras de broadcasting do NumPy.
+
+    Args:
+        v_real (array_like): Valores teóricos de referência.
+        v_aproximado (array_like): Valores obtidos para comparação.
+        precisao (int, optional): Número de casas decimais nos resultados.
+        out (np.ndarray, optional): Array float64 onde os erros são escritos,
+            com o formato resultante do broadcasting.
+
+    Raises:
+        ValueError: Se um dos valores fornecidos não for numérico.
+        ValueError: Se `out` não tiver o tipo ou o formato adequado.
+
+    Returns:
+        np.ndarray: Erros absolutos arredondados de acordo com a precisão, caso fornecida.
+    """
+
+    validar_precisao(precisao)
+    v_real, v_aproximado, out = _preparar_lote(v_real, v_aproximado, out)
+    np.subtract(v_real, v_aproximado, out=out)
+    np.abs(out, out=out)
+    if precisao is not None:
+        np.round(out, precisao, out=out)
+    return out
+
+
+@instrumentado
+def erro_relativo_lote(v_real, v_aproximado, precisao=None, out=None):
+    """
+    Retorna os erros relativos elemento a elemento para arrays de valores.
+
+    Versão vetorizada de `erro_relativo`. Elementos com valor real zero não
+    interrompem o cálculo: o erro relativo nessas posições é NaN.
+
+    Args:
+        v_real (array_like): Valores teóricos de referência.
+        v_aproximado (array_like): Valores obtidos para comparação.
+        precisao (int, optional): Número de casas decimais nos resultados.
+        out (np.ndarray, optional): Array float64 onde os erros são escritos,
+            com o formato resultante do broadcasting.
+
+    Raises:
+        ValueError: Se um dos valores fornecidos não for numérico.
+        ValueError: Se `out` não tiver o tipo ou o formato adequado.
+
+    Returns:
+        np.ndarray: Erros relativos arredondados de acordo com a precisão, caso fornecida.
+    """
+
+    validar_precisao(precisao)
+    v_real, v_aproximado, out = _preparar_lote(v_real, v_aproximado, out)
+    if np.shares_memory(out, v_real):
+        # A diferença é escrita em out antes da divisão pelos valores reais.
+        v_real = v_real.copy()
+    zeros = v_real == 0
+    np.subtract(v_real, v_aproximado, out=out)
+    np.divide(out, v_real, out=out, where=~zeros)
+    np.abs(out, out=out)
+    if np.any(zeros):
+        out[np.broadcast_to(zeros, out.shape)] = np.nan
+    if precisao is not None:
+        np.round(out, precisao, out=out)
+    return out
+
+
+@instrumentado
+def erro_quadratico_medio(lista_real, lista_aproximada, precisao=None, tamanho_bloco=TAMANHO_BLOCO):
     """
     Retorna o erro quadrático médio para uma lista de valores de referência 
     e uma lista de valores obtidos.
 
+    Também aceita fontes que não cabem na memória: iteradores, geradores
+    (de números ou de blocos de números) e arrays grandes, como np.memmap.
+    Nesses casos os dados são percorridos em blocos e a soma dos quadrados
+    é acumulada com compensação, usando memória constante.
+
     Args:
-        lista_real (list of float): Valores teóricos de referência.
-        lista_aproximada (list of float): Valores obtidos para comparação.
+        lista_real (list of float or iterable): Valores teóricos de referência.
+        lista_aproximada (list of float or iterable): Valores obtidos para comparação.
         precisao (int, optional): Número de casas decimais no resultado retornado.
+        tamanho_bloco (int, optional): Número de elementos por bloco na leitura em fluxo.
 
     Raises:
         ValueError: Se as listas não possuírem o mesmo tamanho.
@@ -83,21 +166,231 @@ def erro_quadratico_medio(lista_real, lista_aproximada, precisao=None):
         float: Erro quadrático médio arredondado de acordo com a precisão, caso fornecida.
     """
 
-    if len(lista_real) != len(lista_aproximada):
+    validar_precisao(precisao)
+    if _em_fluxo(lista_real, tamanho_bloco) or _em_fluxo(lista_aproximada, tamanho_bloco):
+        eqm = _erro_quadratico_medio_fluxo(lista_real, lista_aproximada, tamanho_bloco)
+    else:
+        if len(lista_real) != len(lista_aproximada):
+            raise ValueError("Erro: as listas devem possuir a mesma quantidade de elementos.")
+        n = len(lista_real)
+        if n == 0:
+            raise ValueError("Erro: as listas não podem ser vazias.")
+        try:
+            valores_reais = para_floats(lista_real)
+            valores_aproximados = para_floats(lista_aproximada)
+        except (TypeError, ValueError):
+            raise ValueError("Erro: todos os valores das listas devem ser numéricos.")
+        # Listas aninhadas não são somadas como matriz.
+        if valores_reais.ndim != 1 or valores_aproximados.ndim != 1:
+            raise ValueError("Erro: todos os valores das listas devem ser numéricos.")
+        with fase("soma"):
+            eqm = soma_quadrados_compensada(valores_reais - valores_aproximados) / n
+    if precisao is not None:
+        return round(eqm, precisao)
+    return eqm
+
+
+METRICAS_ERRO = ("eqm", "reqm", "eam", "erro_maximo", "erro_relativo_medio")
+
+
+@instrumentado
+def relatorio_erros(real, aproximado, metricas=METRICAS_ERRO, axis=None, precisao=None,
+                    tamanho_bloco=TAMANHO_BLOCO):
+    """
+    Calcula várias métricas de erro em uma única passada pelos dados.
+
+    As métricas disponíveis são:
+        'eqm': erro quadrático médio;
+        'reqm': raiz do erro quadrático médio;
+        'eam': erro absoluto médio;
+        'erro_maximo': maior erro absoluto;
+        'erro_relativo_medio': média dos erros relativos, ignorando os
+            elementos com valor real zero (NaN se todos forem zero).
+
+    Os dados são percorridos em blocos e as somas são acumuladas com
+    compensação. Com `axis`, cada série ao longo desse eixo é avaliada
+    separadamente, de modo que várias séries de um array 2D são tratadas
+    em uma só chamada.
+
+    Args:
+        real (array_like): Valores teóricos de referência.
+        aproximado (array_like): Valores obtidos para comparação (mesmo formato).
+        metricas (list of str, optional): Métricas a calcular. Padrão são todas.
+        axis (int, optional): Eixo ao longo do qual as métricas são calculadas.
+            Se None, usa todos os elementos.
+        precisao (int, optional): Número de casas decimais nos resultados.
+        tamanho_bloco (int, optional): Número aproximado de elementos por bloco.
+
+    Raises:
+        ValueError: Se alguma métrica não for reconhecida.
+        ValueError: Se os arrays não possuírem o mesmo formato.
+        ValueError: Se os arrays forem vazios.
+        ValueError: Se um dos valores fornecidos não for numérico.
+
+    Returns:
+        dict: Valor de cada métrica (float, ou array quando `axis` é fornecido).
+    """
+
+    validar_precisao(precisao)
+    metricas = list(metricas)
+    invalidas = [m for m in metricas if m not in METRICAS_ERRO]
+    if invalidas:
+        raise ValueError(
+            f"Erro: métricas inválidas: {', '.join(map(str, invalidas))}. "
+            f"As métricas válidas são {', '.join(METRICAS_ERRO)}."
+        )
+
+    try:
+        real = np.asarray(real, dtype=float)
+        aproximado = np.asarray(aproximado, dtype=float)
+    except (TypeError, ValueError):
+        raise ValueError("Erro: todos os valores das listas devem ser numéricos.")
+    if real.shape != aproximado.shape:
         raise ValueError("Erro: as listas devem possuir a mesma quantidade de elementos.")
-    n = len(lista_real)
+
+    if axis is None:
+        real = real.reshape(-1)
+        aproximado = aproximado.reshape(-1)
+    else:
+        real = np.moveaxis(real, axis, -1)
+        aproximado = np.moveaxis(aproximado, axis, -1)
+    n = real.shape[-1]
+    if n == 0:
+        raise ValueError("Erro: as listas não podem ser vazias.")
+
+    formato = real.shape[:-1]
+    series = int(np.prod(formato))
+    passo = max(1, tamanho_bloco // max(series, 1))
+
+    quadrados = "eqm" in metricas or "reqm" in metricas
+    absolutos = "eam" in metricas
+    maximo = "erro_maximo" in metricas
+    relativos = "erro_relativo_medio" in metricas
+
+    soma_quadrados = [np.zeros(formato), np.zeros(formato)]
+    soma_absolutos = [np.zeros(formato), np.zeros(formato)]
+    soma_relativos = [np.zeros(formato), np.zeros(formato)]
+    erro_maximo = np.full(formato, -np.inf)
+    nao_nulos = np.zeros(formato, dtype=np.int64)
+
+    with fase("soma"), np.errstate(invalid="ignore", over="ignore", divide="ignore"):
+        for inicio in range(0, n, passo):
+            bloco_real = np.asarray(real[..., inicio:inicio + passo])
+            diferenca = bloco_real - aproximado[..., inicio:inicio + passo]
+            if quadrados:
+                _acumular(soma_quadrados, diferenca * diferenca)
+            np.abs(diferenca, out=diferenca)
+            if absolutos:
+                _acumular(soma_absolutos, diferenca)
+            if maximo:
+                np.maximum(erro_maximo, diferenca.max(axis=-1), out=erro_maximo)
+            if relativos:
+                validos = bloco_real != 0
+                razao = np.divide(diferenca, np.abs(bloco_real),
+                                  out=np.zeros_like(diferenca), where=validos)
+                _acumular(soma_relativos, razao)
+                nao_nulos += np.count_nonzero(validos, axis=-1)
+
+    resultados = {}
+    for metrica in metricas:
+        if metrica == "eqm":
+            valor = _valor(soma_quadrados) / n
+        elif metrica == "reqm":
+            valor = np.sqrt(_valor(soma_quadrados) / n)
+        elif metrica == "eam":
+            valor = _valor(soma_absolutos) / n
+        elif metrica == "erro_maximo":
+            valor = erro_maximo
+        else:
+            valor = np.where(nao_nulos > 0,
+                             _valor(soma_relativos) / np.maximum(nao_nulos, 1), np.nan)
+        if precisao is not None:
+            valor = np.round(valor, precisao)
+        resultados[metrica] = float(valor) if np.ndim(valor) == 0 else valor
+    return resultados
+
+
+def _acumular(par, valores):
+    """
+    Soma compensada de `valores` ao longo do último eixo, acumulada no par [soma, erro].
+    """
+
+    soma, erro = _soma_dupla(valores)
+    par[0], e = _two_sum(par[0], soma)
+    par[1] += e + erro
+
+
+def _valor(par):
+    """
+    Valor final de um par [soma, erro]; com inf ou NaN, a compensação é ignorada.
+    """
+
+    with np.errstate(invalid="ignore"):
+        total = par[0] + par[1]
+    return np.where(np.isfinite(total), total, par[0])
+
+
+def _em_fluxo(fonte, tamanho_bloco):
+    """
+    Indica se a fonte deve ser lida em blocos: iteráveis sem tamanho
+    conhecido e arrays maiores que um bloco.
+    """
+
+    if isinstance(fonte, np.ndarray):
+        return fonte.size > tamanho_bloco
+    return not hasattr(fonte, "__len__")
+
+
+def _erro_quadratico_medio_fluxo(fonte_real, fonte_aproximada, tamanho_bloco):
+    """
+    Calcula o erro quadrático médio percorrendo as duas fontes em blocos alinhados.
+    """
+
+    blocos_reais = iterar_blocos(fonte_real, tamanho_bloco)
+    blocos_aproximados = iterar_blocos(fonte_aproximada, tamanho_bloco)
+    acumulador = KahanAccumulator()
+    n = 0
+
+    while True:
+        try:
+            bloco_real = next(blocos_reais, None)
+            bloco_aproximado = next(blocos_aproximados, None)
+        except (TypeError, ValueError):
+            raise ValueError("Erro: todos os valores das listas devem ser numéricos.")
+        if bloco_real is None and bloco_aproximado is None:
+            break
+        if (bloco_real is None or bloco_aproximado is None
+                or bloco_real.size != bloco_aproximado.size):
+            raise ValueError("Erro: as listas devem possuir a mesma quantidade de elementos.")
+        with fase("soma"):
+            acumulador.add(soma_quadrados_compensada(bloco_real - bloco_aproximado))
+        n += bloco_real.size
+
     if n == 0:
         raise ValueError("Erro: as listas não podem ser vazias.")
+    return acumulador.value / n
+
+
+def _preparar_lote(v_real, v_aproximado, out):
+    """
+    Converte as entradas das versões em lote e prepara o array de saída.
+    """
+
     try:
-        valores_reais = [float(v) for v in lista_real]
-        valores_aproximados = [float(v) for v in lista_aproximada]
+        v_real = np.asarray(v_real, dtype=float)
+        v_aproximado = np.asarray(v_aproximado, dtype=float)
+    except (TypeError, ValueError):
+        raise ValueError("Erro: os valores real e aproximado devem ser numéricos.")
+    try:
+        formato = np.broadcast_shapes(v_real.shape, v_aproximado.shape)
     except ValueError:
-        raise ValueError("Erro: todos os valores das listas devem ser numéricos.")
-    lista_erros_quadraticos = [(real - aproximado) ** 2 for real, aproximado 
-                               in zip(valores_reais, valores_aproximados)]
-    eqm = soma_kahan(lista_erros_quadraticos) / n
-    if precisao is not None:
-        if not isinstance(precisao, int) or precisao < 0:
-            raise ValueError("Erro: precisão deve ser um inteiro não negativo.")
-        return round(eqm, precisao)
-    return eqm
+        raise ValueError("Erro: os arrays real e aproximado não têm formatos compatíveis.")
+
+    if out is None:
+        out = np.empty(formato)
+    elif (not isinstance(out, np.ndarray) or out.dtype != np.float64
+          or out.shape != formato):
+        raise ValueError(
+            f"Erro: out deve ser um array float64 de formato {formato}."
+        )
+    return v_real, v_aproximado, out
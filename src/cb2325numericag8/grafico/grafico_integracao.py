@@ -132,3 +132,51 @@ def grafico_simpson(funcao, a, b, s, area, n=20):
     plt.tight_layout()
 
     return plt.show()
+
+def grafico_nos(funcao, a, b, s, area, nos):
+    """
+    Gera e exibe um gráfico da função e dos nós em que ela foi avaliada.
+
+    Args:
+        funcao (callable): A função a ser plotada.
+        a (float): Limite inferior da integral.
+        b (float): Limite superior da integral.
+        s (int): Número de pontos para a curva suave.
+        area (float): Valor numérico da área da integral aproximada.
+        nos (array_like): Pontos em que a função foi avaliada.
+
+    Returns:
+        None: Exibe o gráfico utilizando plt.show().
+    """
+
+    plt.style.use('seaborn-v0_8-whitegrid')
+
+    # Dados da curva suave
+    x_curva = np.linspace(a, b, s)
+    y_curva = funcao(x_curva)
+
+    # Nós avaliados (na integração adaptativa, mais densos onde a função é mais difícil)
+    x_disc = np.sort(np.asarray(nos, dtype=float))
+    y_disc = funcao(x_disc)
+
+    plt.plot(x_curva, y_curva, label="f(x)", color="blue",
+             linewidth=2.5, alpha=0.9)
+
+    plt.fill_between(x_disc, y_disc, 0, label="Área da Aproximação",
+                     color="skyblue", alpha=0.6)
+
+    plt.plot(x_disc, y_disc, 'o', markersize=4, markerfacecolor='crimson',
+        markeredgecolor='black', markeredgewidth=0.6, label=f'{x_disc.size} Nós')
+
+    plt.axhline(0, color='black', linewidth=0.5)
+
+    plt.title(f"Aproximação da Integral ≈ {area:.4f}",
+              fontsize=14, fontweight='bold')
+    plt.xlabel("Eixo X", fontsize=12)
+    plt.ylabel("Eixo Y", fontsize=12)
+
+    plt.legend(loc='best', frameon=True, shadow=True)
+
+    plt.tight_layout()
+
+    return plt.show()
@@ -1,9 +1,33 @@
+import inspect
+
 import numpy as np
-from cb2325numericag8.utils.kahan import soma_kahan
-from cb2325numericag8.grafico.grafico_integracao import grafico_trapezoidal, grafico_simpson
+from cb2325numericag8.integracao.regras import (
+    avaliar_nos, regra_trapezoidal, regra_simpson, regra_gauss
+)
+from cb2325numericag8.utils.avaliacao import validar_avaliacao
+from cb2325numericag8.utils.kahan import (
+    soma_kahan, soma_acumulada_compensada, KahanAccumulator, _soma_dupla
+)
+from cb2325numericag8.utils.blocos import TAMANHO_BLOCO, iterar_blocos
+from cb2325numericag8.utils.produto_compensado import produto_escalar_compensado
+from cb2325numericag8.utils.gauss_legendre import nos_pesos_gauss_legendre
+from cb2325numericag8.utils.validacao import validar_metodo, validar_precisao
+from cb2325numericag8.utils.importacao import importacao_preguicosa
+from cb2325numericag8.utils.instrumentacao import (
+    instrumentado, contar_avaliacoes, fase
+)
+
+# Funções de gráfico carregadas sob demanda, para não importar o matplotlib.
+__getattr__ = importacao_preguicosa(__name__, {
+    'grafico_trapezoidal': 'cb2325numericag8.grafico.grafico_integracao:grafico_trapezoidal',
+    'grafico_simpson': 'cb2325numericag8.grafico.grafico_integracao:grafico_simpson',
+    'grafico_nos': 'cb2325numericag8.grafico.grafico_integracao:grafico_nos',
+})
 
 
-def integral_trapezoidal(funcao, a, b, n=100, mostrar_grafico=False, precisao=None):
+@instrumentado
+def integral_trapezoidal(funcao, a, b, n=100, mostrar_grafico=False, precisao=None, avaliacao='auto',
+                         executor=None, workers=None):
     """
     Integra numericamente uma função dada, utilizando uma aproximação trapezoidal.
 
@@ -14,38 +38,52 @@ def integral_trapezoidal(funcao, a, b, n=100, mostrar_grafico=False, precisao=No
         n (int): Número de divisões do intervalo de integração. Valor padrão é 100.
         mostrar_grafico (bool, optional): Define se deve gerar o gráfico ou não. Valor padrão é False.
         precisao (int, optional): Número de casas decimais no resultado retornado.
+        avaliacao (str, optional): Estratégia de avaliação da função: 'auto' (padrão)
+            tenta uma única chamada com o array de nós e volta para a avaliação
+            ponto a ponto se necessário; 'vetorizado' exige a chamada com array;
+            'escalar' avalia um nó por vez.
+        executor (concurrent.futures.Executor, optional): Executor usado para avaliar
+            os nós em paralelo, em partes contíguas reunidas na ordem original.
+        workers (int, optional): Número de processos de um ProcessPoolExecutor
+            criado para a chamada, caso nenhum executor seja informado. A função
+            deve então poder ser serializada (pickle). O resultado é o mesmo da
+            avaliação sequencial.
 
     Raises:
         ValueError: Caso a função não possa ser avaliada em algum ponto.
+        ValueError: Se o modo de avaliação não for reconhecido.
 
     Returns:
         float: Valor numérico obtido para a integral arredondado 
         de acordo com a precisão, caso fornecida.
     """
 
+    validar_avaliacao(avaliacao)
     vals_x = np.linspace(a, b, n + 1)
-    try:
-        y = [funcao(x) for x in vals_x]
-        y = np.asarray(y, dtype=float)
-        if not np.all(np.isfinite(y)):
-            raise ValueError("Função não definida em algum ponto do intervalo (NaN ou infinito).")
-    except Exception as e:
-        raise ValueError(f"Erro ao avaliar a função em algum ponto do intervalo: {e}")
+    if executor is None and workers is None:
+        funcao_contada = contar_avaliacoes(funcao)
+    else:
+        funcao_contada = funcao
+    y = avaliar_nos(funcao_contada, vals_x, avaliacao, executor=executor, workers=workers)
     delta = (b - a) / n
-    soma_intermediaria = soma_kahan(y[1:-1])
-    valor_integral = (delta / 2) * soma_kahan([y[0], 2 * soma_intermediaria, y[-1]])
+    with fase('soma'):
+        soma_intermediaria = soma_kahan(y[1:-1])
+        valor_integral = (delta / 2) * soma_kahan([y[0], 2 * soma_intermediaria, y[-1]])
 
     if mostrar_grafico:
-        grafico_trapezoidal(funcao, a, b, s=300, area=valor_integral, n=n)
+        with fase('grafico'):
+            from cb2325numericag8.grafico.grafico_integracao import grafico_trapezoidal
+            grafico_trapezoidal(funcao, a, b, s=300, area=valor_integral, n=n)
 
+    validar_precisao(precisao)
     if precisao is not None:
-        if not isinstance(precisao, int) or precisao < 0:
-            raise ValueError("Erro: precisão deve ser um inteiro não negativo.")
         return round(valor_integral, precisao)
     return valor_integral
 
 
-def integral_simpson(funcao, a, b, n=100, mostrar_grafico=False, precisao=None):
+@instrumentado
+def integral_simpson(funcao, a, b, n=100, mostrar_grafico=False, precisao=None, avaliacao='auto',
+                     executor=None, workers=None):
     """
     Integra numericamente uma função dada, utilizando o método de Simpson.
 
@@ -56,9 +94,20 @@ def integral_simpson(funcao, a, b, n=100, mostrar_grafico=False, precisao=None):
         n (int): Número de divisões do intervalo de integração. Valor padrão é 100.
         mostrar_grafico (bool, optional): Define se deve gerar o gráfico ou não. Valor padrão é False.
         precisao (int, optional): Número de casas decimais no resultado retornado.
+        avaliacao (str, optional): Estratégia de avaliação da função: 'auto' (padrão)
+            tenta uma única chamada com o array de nós e volta para a avaliação
+            ponto a ponto se necessário; 'vetorizado' exige a chamada com array;
+            'escalar' avalia um nó por vez.
+        executor (concurrent.futures.Executor, optional): Executor usado para avaliar
+            os nós em paralelo, em partes contíguas reunidas na ordem original.
+        workers (int, optional): Número de processos de um ProcessPoolExecutor
+            criado para a chamada, caso nenhum executor seja informado. A função
+            deve então poder ser serializada (pickle). O resultado é o mesmo da
+            avaliação sequencial.
     
     Raises:
         ValueError: Caso a função não possa ser avaliada em algum ponto.
+        ValueError: Se o modo de avaliação não for reconhecido.
 
     Returns:
         float: Valor numérico obtido para a integral arredondado 
@@ -69,38 +118,464 @@ def integral_simpson(funcao, a, b, n=100, mostrar_grafico=False, precisao=None):
         n += 1
         print(f"Aviso: número de divisões do intervalo de integração deve ser par. Ajustado para {n}.")
 
+    validar_avaliacao(avaliacao)
     vals_x = np.linspace(a, b, n + 1)
-    try:
-        y = [funcao(x) for x in vals_x]
-        y = np.asarray(y, dtype=float)
-        if not np.all(np.isfinite(y)):
-            raise ValueError("Função não definida em algum ponto do intervalo (NaN ou infinito).")
-    except Exception as e:
-        raise ValueError(f"Erro ao avaliar a função em algum ponto do intervalo: {e}")
+    if executor is None and workers is None:
+        funcao_contada = contar_avaliacoes(funcao)
+    else:
+        funcao_contada = funcao
+    y = avaliar_nos(funcao_contada, vals_x, avaliacao, executor=executor, workers=workers)
     delta = (b - a) / n
 
-    soma_imp = soma_kahan(y[1:-1:2])
-    soma_par = soma_kahan(y[2:-2:2])
+    with fase('soma'):
+        soma_imp = soma_kahan(y[1:-1:2])
+        soma_par = soma_kahan(y[2:-2:2])
 
-    valor_integral = (delta / 3) * soma_kahan([y[0], 4 * soma_imp, 2 * soma_par, y[-1]])
+        valor_integral = (delta / 3) * soma_kahan([y[0], 4 * soma_imp, 2 * soma_par, y[-1]])
 
     if mostrar_grafico:
-        grafico_simpson(funcao, a, b, s=300, area=valor_integral, n=n)
+        with fase('grafico'):
+            from cb2325numericag8.grafico.grafico_integracao import grafico_simpson
+            grafico_simpson(funcao, a, b, s=300, area=valor_integral, n=n)
 
+    validar_precisao(precisao)
     if precisao is not None:
-        if not isinstance(precisao, int) or precisao < 0:
-            raise ValueError("Erro: precisão deve ser um inteiro não negativo.")
         return round(valor_integral, precisao)
     return valor_integral
 
 
+@instrumentado
+def integral_adaptativa(funcao, a, b, n=8, mostrar_grafico=False, precisao=None, avaliacao='auto',
+                        tol=1e-8, max_niveis=50, max_avaliacoes=10 ** 6, detalhes=False):
+    """
+    Integra numericamente uma função dada, utilizando o método de Simpson adaptativo.
+
+    O intervalo começa dividido em n painéis. A cada nível, cada painel ainda
+    não aceito é dividido ao meio e a diferença entre a regra de Simpson no
+    painel inteiro e nas duas metades estima o erro local. Painéis cujo erro
+    estimado está abaixo da sua parte da tolerância (proporcional ao seu
+    comprimento) são aceitos, com a correção de Richardson; os demais são
+    refinados no próximo nível. Assim, só as regiões difíceis recebem mais
+    pontos, e toda avaliação feita é reaproveitada pelos painéis filhos.
+    Os novos pontos de cada nível são avaliados em uma única chamada. Se o
+    próximo nível ultrapassar max_avaliacoes (por exemplo, com tol próxima
+    do arredondamento), os painéis restantes são aceitos com um aviso.
+
+    Args:
+        funcao (callable): Expressão dada para a função.
+        a (float): Limite inferior da integral.
+        b (float): Limite superior da integral.
+        n (int): Número de painéis iniciais. Valor padrão é 8.
+        mostrar_grafico (bool, optional): Define se deve gerar o gráfico ou não. Valor padrão é False.
+        precisao (int, optional): Número de casas decimais no resultado retornado.
+        avaliacao (str, optional): Estratégia de avaliação da função ('auto', 'vetorizado'
+            ou 'escalar'). Valor padrão é 'auto'.
+        tol (float, optional): Tolerância para o erro absoluto total. Valor padrão é 1e-8.
+        max_niveis (int, optional): Número máximo de subdivisões de um painel. Valor padrão é 50.
+        max_avaliacoes (int, optional): Número máximo de avaliações da função.
+            Valor padrão é 10^6.
+        detalhes (bool, optional): Se True, retorna também um dicionário com o erro
+            estimado, o número de avaliações e o número final de painéis.
+
+    Raises:
+        ValueError: Caso a função não possa ser avaliada em algum ponto.
+        ValueError: Se o modo de avaliação não for reconhecido.
+        ValueError: Se n, tol, max_niveis ou max_avaliacoes não forem positivos.
+
+    Returns:
+        float: Valor numérico obtido para a integral arredondado de acordo com
+        a precisão, caso fornecida. Se detalhes=True, retorna a tupla
+        (valor, {'erro_estimado', 'avaliacoes', 'n'}).
+    """
+
+    validar_avaliacao(avaliacao)
+    if not isinstance(n, int) or n < 1:
+        raise ValueError("Erro: n deve ser um inteiro positivo.")
+    if not tol > 0:
+        raise ValueError("Erro: tol deve ser positiva.")
+    if not isinstance(max_niveis, int) or max_niveis < 1:
+        raise ValueError("Erro: max_niveis deve ser um inteiro positivo.")
+    if not isinstance(max_avaliacoes, int) or max_avaliacoes < 1:
+        raise ValueError("Erro: max_avaliacoes deve ser um inteiro positivo.")
+    validar_precisao(precisao)
+
+    if a == b:
+        if detalhes:
+            return 0.0, {'erro_estimado': 0.0, 'avaliacoes': 0, 'n': 0}
+        return 0.0
+
+    funcao_contada = contar_avaliacoes(funcao)
+    comprimento_total = abs(b - a)
+
+    # Painéis iniciais: extremos, pontos médios e valores já avaliados.
+    nos = np.linspace(a, b, 2 * n + 1)
+    y = avaliar_nos(funcao_contada, nos, avaliacao)
+    avaliacoes = nos.size
+    esq, meio, dir_ = nos[0:-1:2], nos[1::2], nos[2::2]
+    f_esq, f_meio, f_dir = y[0:-1:2], y[1::2], y[2::2]
+    simpson = (dir_ - esq) / 6 * (f_esq + 4 * f_meio + f_dir)
+
+    contribuicoes = []
+    erros = []
+    nos_usados = [nos]
+    paineis_aceitos = 0
+
+    for nivel in range(1, max_niveis + 1):
+        pontos_novos = np.concatenate([(esq + meio) / 2, (meio + dir_) / 2])
+        valores_novos = avaliar_nos(funcao_contada, pontos_novos, avaliacao)
+        avaliacoes += pontos_novos.size
+        nos_usados.append(pontos_novos)
+        k = esq.size
+        q_esq, q_dir = pontos_novos[:k], pontos_novos[k:]
+        f_q_esq, f_q_dir = valores_novos[:k], valores_novos[k:]
+
+        simpson_esq = (meio - esq) / 6 * (f_esq + 4 * f_q_esq + f_meio)
+        simpson_dir = (dir_ - meio) / 6 * (f_meio + 4 * f_q_dir + f_dir)
+        refinado = simpson_esq + simpson_dir
+        diferenca = refinado - simpson
+
+        limite = 15 * tol * np.abs(dir_ - esq) / comprimento_total
+        aceitos = np.abs(diferenca) <= limite
+        # O próximo nível avalia dois pontos em cada metade dos painéis refinados.
+        excede = avaliacoes + 4 * np.count_nonzero(~aceitos) > max_avaliacoes
+        if nivel == max_niveis or excede:
+            if not np.all(aceitos):
+                print(f"Aviso: tolerância não atingida em {np.count_nonzero(~aceitos)} "
+                      f"painéis após {nivel} níveis e {avaliacoes} avaliações.")
+            aceitos[:] = True
+
+        contribuicoes.append(refinado[aceitos] + diferenca[aceitos] / 15)
+        erros.append(np.abs(diferenca[aceitos]) / 15)
+        paineis_aceitos += 2 * int(np.count_nonzero(aceitos))
+
+        refinar = ~aceitos
+        if not np.any(refinar):
+            break
+        esq, meio, dir_ = (np.concatenate([esq[refinar], meio[refinar]]),
+                           np.concatenate([q_esq[refinar], q_dir[refinar]]),
+                           np.concatenate([meio[refinar], dir_[refinar]]))
+        f_esq, f_meio, f_dir = (np.concatenate([f_esq[refinar], f_meio[refinar]]),
+                                np.concatenate([f_q_esq[refinar], f_q_dir[refinar]]),
+                                np.concatenate([f_meio[refinar], f_dir[refinar]]))
+        simpson = np.concatenate([simpson_esq[refinar], simpson_dir[refinar]])
+
+    with fase('soma'):
+        valor_integral = soma_kahan(np.concatenate(contribuicoes))
+        erro_estimado = soma_kahan(np.concatenate(erros))
+
+    if mostrar_grafico:
+        with fase('grafico'):
+            from cb2325numericag8.grafico.grafico_integracao import grafico_nos
+            grafico_nos(funcao, a, b, s=300, area=valor_integral,
+                        nos=np.concatenate(nos_usados))
+
+    if precisao is not None:
+        valor_integral = round(valor_integral, precisao)
+    if detalhes:
+        return valor_integral, {'erro_estimado': erro_estimado,
+                                'avaliacoes': avaliacoes,
+                                'n': paineis_aceitos}
+    return valor_integral
+
+
+@instrumentado
+def integral_romberg(funcao, a, b, n=1, mostrar_grafico=False, precisao=None, avaliacao='auto',
+                     tol=1e-10, max_niveis=20, detalhes=False):
+    """
+    Integra numericamente uma função dada, utilizando o método de Romberg.
+
+    Parte da regra trapezoidal com n divisões e dobra o número de divisões a
+    cada nível. O novo trapézio é obtido do anterior somando apenas os
+    valores da função nos novos pontos médios, de forma que nenhum nó é
+    avaliado duas vezes. A extrapolação de Richardson sobre a sequência de
+    trapézios forma a tabela de Romberg, e o processo para quando dois
+    elementos consecutivos da diagonal diferem em no máximo tol.
+
+    Args:
+        funcao (callable): Expressão dada para a função.
+        a (float): Limite inferior da integral.
+        b (float): Limite superior da integral.
+        n (int): Número inicial de divisões do intervalo. Valor padrão é 1.
+        mostrar_grafico (bool, optional): Define se deve gerar o gráfico ou não. Valor padrão é False.
+        precisao (int, optional): Número de casas decimais no resultado retornado.
+        avaliacao (str, optional): Estratégia de avaliação da função ('auto', 'vetorizado'
+            ou 'escalar'). Valor padrão é 'auto'.
+        tol (float, optional): Diferença máxima entre dois elementos consecutivos
+            da diagonal da tabela. Valor padrão é 1e-10.
+        max_niveis (int, optional): Número máximo de refinamentos. Valor padrão é 20.
+        detalhes (bool, optional): Se True, retorna também um dicionário com o erro
+            estimado, o número de avaliações e o número final de divisões.
+
+    Raises:
+        ValueError: Caso a função não possa ser avaliada em algum ponto.
+        ValueError: Se o modo de avaliação não for reconhecido.
+        ValueError: Se n, tol ou max_niveis não forem positivos.
+
+    Returns:
+        float: Valor numérico obtido para a integral arredondado de acordo com
+        a precisão, caso fornecida. Se detalhes=True, retorna a tupla
+        (valor, {'erro_estimado', 'avaliacoes', 'n'}).
+    """
+
+    validar_avaliacao(avaliacao)
+    if not isinstance(n, int) or n < 1:
+        raise ValueError("Erro: n deve ser um inteiro positivo.")
+    if not tol > 0:
+        raise ValueError("Erro: tol deve ser positiva.")
+    if not isinstance(max_niveis, int) or max_niveis < 1:
+        raise ValueError("Erro: max_niveis deve ser um inteiro positivo.")
+    validar_precisao(precisao)
+
+    trapezio = integral_trapezoidal(funcao, a, b, n, avaliacao=avaliacao)
+    funcao_contada = contar_avaliacoes(funcao)
+    avaliacoes = n + 1
+    linha = [trapezio]
+    erro_estimado = float('inf')
+
+    for nivel in range(1, max_niveis + 1):
+        # Novos pontos médios do trapézio com 2n divisões.
+        delta = (b - a) / n
+        medios = a + delta * (np.arange(n) + 0.5)
+        y = avaliar_nos(funcao_contada, medios, avaliacao)
+        avaliacoes += n
+        n *= 2
+        with fase('soma'):
+            trapezio = trapezio / 2 + (delta / 2) * soma_kahan(y)
+
+        nova_linha = [trapezio]
+        for j in range(1, nivel + 1):
+            fator = 4 ** j
+            nova_linha.append(nova_linha[j - 1] + (nova_linha[j - 1] - linha[j - 1]) / (fator - 1))
+
+        erro_estimado = abs(nova_linha[-1] - linha[-1])
+        linha = nova_linha
+        if nivel >= 2 and erro_estimado <= tol:
+            break
+    else:
+        print(f"Aviso: tolerância não atingida após {max_niveis} níveis "
+              f"(diferença {erro_estimado:.3e}).")
+
+    valor_integral = float(linha[-1])
+    erro_estimado = float(erro_estimado)
+
+    if mostrar_grafico:
+        with fase('grafico'):
+            from cb2325numericag8.grafico.grafico_integracao import grafico_trapezoidal
+            grafico_trapezoidal(funcao, a, b, s=300, area=valor_integral, n=n)
+
+    if precisao is not None:
+        valor_integral = round(valor_integral, precisao)
+    if detalhes:
+        return valor_integral, {'erro_estimado': erro_estimado,
+                                'avaliacoes': avaliacoes,
+                                'n': n}
+    return valor_integral
+
+
+@instrumentado
+def integral_gauss(funcao, a, b, n=20, mostrar_grafico=False, precisao=None, avaliacao='auto',
+                   subintervalos=1):
+    """
+    Integra numericamente uma função dada, utilizando a quadratura de Gauss-Legendre.
+
+    Com n nós por subintervalo, a regra é exata para polinômios de grau até
+    2n - 1, de modo que funções suaves atingem a precisão da máquina com
+    poucas avaliações. Os nós e pesos vêm de um cache (ver
+    nos_pesos_gauss_legendre) e todos os nós são avaliados em uma única chamada.
+
+    Args:
+        funcao (callable): Expressão dada para a função.
+        a (float): Limite inferior da integral.
+        b (float): Limite superior da integral.
+        n (int): Número de nós (ordem) por subintervalo. Valor padrão é 20.
+        mostrar_grafico (bool, optional): Define se deve gerar o gráfico ou não. Valor padrão é False.
+        precisao (int, optional): Número de casas decimais no resultado retornado.
+        avaliacao (str, optional): Estratégia de avaliação da função ('auto', 'vetorizado'
+            ou 'escalar'). Valor padrão é 'auto'.
+        subintervalos (int, optional): Número de subintervalos iguais da regra
+            composta. Valor padrão é 1.
+
+    Raises:
+        ValueError: Caso a função não possa ser avaliada em algum ponto.
+        ValueError: Se o modo de avaliação não for reconhecido.
+        ValueError: Se n ou subintervalos não forem positivos.
+
+    Returns:
+        float: Valor numérico obtido para a integral arredondado
+        de acordo com a precisão, caso fornecida.
+    """
+
+    validar_avaliacao(avaliacao)
+    if not isinstance(subintervalos, int) or subintervalos < 1:
+        raise ValueError("Erro: subintervalos deve ser um inteiro positivo.")
+    nos, pesos = nos_pesos_gauss_legendre(n)
+
+    bordas = np.linspace(a, b, subintervalos + 1)
+    meia_largura = (b - a) / (2 * subintervalos)
+    centros = (bordas[:-1] + bordas[1:]) / 2
+    vals_x = (centros[:, None] + meia_largura * nos).ravel()
+    y = avaliar_nos(contar_avaliacoes(funcao), vals_x, avaliacao)
+    with fase('soma'):
+        valor_integral = meia_largura * produto_escalar_compensado(np.tile(pesos, subintervalos), y)
+
+    if mostrar_grafico:
+        with fase('grafico'):
+            from cb2325numericag8.grafico.grafico_integracao import grafico_nos
+            grafico_nos(funcao, a, b, s=300, area=valor_integral, nos=vals_x)
+
+    validar_precisao(precisao)
+    if precisao is not None:
+        return round(valor_integral, precisao)
+    return valor_integral
+
+
+@instrumentado
+def integral_com_tolerancia(funcao, a, b, n=None, mostrar_grafico=False, precisao=None,
+                            metodo='Trapezoidal', avaliacao='auto', tol=1e-8, n_max=2 ** 20,
+                            detalhes=False, executor=None, workers=None):
+    """
+    Integra numericamente uma função dada pela regra trapezoidal ou de Simpson,
+    escolhendo o número de divisões a partir de uma tolerância.
+
+    O número de divisões dobra a cada etapa, e só os novos pontos médios são
+    avaliados: as somas dos valores já calculados são guardadas (com
+    compensação) e reaproveitadas. O erro é estimado pela comparação de
+    Richardson entre duas etapas, |T(2n) - T(n)| / 3 para o trapézio e
+    |S(2n) - S(n)| / 15 para Simpson, e o processo para quando a estimativa
+    fica abaixo de tol.
+
+    Args:
+        funcao (callable): Expressão dada para a função.
+        a (float): Limite inferior da integral.
+        b (float): Limite superior da integral.
+        n (int, optional): Número inicial de divisões. Se None, usa 16.
+        mostrar_grafico (bool, optional): Define se deve gerar o gráfico ou não. Valor padrão é False.
+        precisao (int, optional): Número de casas decimais no resultado retornado.
+        metodo (str, optional): 'Trapezoidal' ou 'Simpson'. Valor padrão é 'Trapezoidal'.
+        avaliacao (str, optional): Estratégia de avaliação da função ('auto', 'vetorizado'
+            ou 'escalar'). Valor padrão é 'auto'.
+        tol (float, optional): Erro estimado desejado. Valor padrão é 1e-8.
+        n_max (int, optional): Número máximo de divisões. Valor padrão é 2^20.
+        detalhes (bool, optional): Se True, retorna também um dicionário com o erro
+            estimado, o número de avaliações e o número final de divisões.
+        executor (concurrent.futures.Executor, optional): Executor usado para avaliar
+            os nós em paralelo, como em integral_trapezoidal.
+        workers (int, optional): Número de processos de um ProcessPoolExecutor
+            criado para a chamada, caso nenhum executor seja informado.
+
+    Raises:
+        ValueError: Se o método não for 'Trapezoidal' ou 'Simpson'.
+        ValueError: Se n, tol ou n_max forem inválidos.
+        ValueError: Caso a função não possa ser avaliada em algum ponto.
+
+    Returns:
+        float: Valor numérico obtido para a integral arredondado de acordo com
+        a precisão, caso fornecida. Se detalhes=True, retorna a tupla
+        (valor, {'erro_estimado', 'avaliacoes', 'n'}).
+    """
+
+    validar_avaliacao(avaliacao)
+    metodo = validar_metodo(metodo, ('Trapezoidal', 'Simpson'))
+    n = 16 if n is None else n
+    if not isinstance(n, int) or n < 1:
+        raise ValueError("Erro: n deve ser um inteiro positivo.")
+    simpson = metodo == 'Simpson'
+    if simpson and n % 2 != 0:
+        n += 1
+    if not tol > 0:
+        raise ValueError("Erro: tol deve ser positiva.")
+    if not isinstance(n_max, int) or n_max < 2 * n:
+        raise ValueError("Erro: n_max deve ser um inteiro maior ou igual a 2n.")
+    validar_precisao(precisao)
+
+    if simpson:
+        # S(n) usa os trapézios com n e n/2 divisões.
+        n //= 2
+
+    if executor is None and workers is None:
+        funcao_contada = contar_avaliacoes(funcao)
+    else:
+        funcao_contada = funcao
+    paralelo = {'executor': executor, 'workers': workers}
+    vals_x = np.linspace(a, b, n + 1)
+    y = avaliar_nos(funcao_contada, vals_x, avaliacao, **paralelo)
+    avaliacoes = n + 1
+    extremos = (y[0] + y[-1]) / 2
+    interiores = KahanAccumulator()
+    with fase('soma'):
+        interiores.extend(y[1:-1])
+
+    # O trapézio inicial já serve de comparação; Simpson precisa de uma etapa.
+    erro_estimado = None
+    if simpson:
+        anterior = None
+    else:
+        with fase('soma'):
+            anterior = ((b - a) / n) * soma_kahan([extremos, interiores.value])
+
+    while True:
+        # A validação de n_max garante uma estimativa antes de atingir o limite.
+        if erro_estimado is not None and 2 * n > n_max:
+            print(f"Aviso: tolerância não atingida com n_max = {n_max} divisões "
+                  f"(erro estimado {erro_estimado:.3e}).")
+            break
+
+        # Novos pontos médios: o número de divisões passa de n para 2n.
+        delta = (b - a) / n
+        medios = a + delta * (np.arange(n) + 0.5)
+        y = avaliar_nos(funcao_contada, medios, avaliacao, **paralelo)
+        avaliacoes += n
+        n *= 2
+        with fase('soma'):
+            soma_medios = soma_kahan(y)
+            if simpson:
+                # h/3 (f0 + fn + 2 * pares + 4 * ímpares), com h = delta / 2.
+                pares = KahanAccumulator()
+                pares.merge(interiores)
+                pares.add(extremos)
+                atual = (delta / 6) * soma_kahan([2 * pares.value, 4 * soma_medios])
+            interiores.add(soma_medios)
+            if not simpson:
+                atual = (delta / 2) * soma_kahan([extremos, interiores.value])
+
+        if anterior is not None:
+            erro_estimado = abs(atual - anterior) / (15 if simpson else 3)
+            if erro_estimado <= tol:
+                break
+        anterior = atual
+
+    valor_integral = float(atual)
+    erro_estimado = float(erro_estimado)
+
+    if mostrar_grafico:
+        with fase('grafico'):
+            if simpson:
+                from cb2325numericag8.grafico.grafico_integracao import grafico_simpson as grafico
+            else:
+                from cb2325numericag8.grafico.grafico_integracao import grafico_trapezoidal as grafico
+            grafico(funcao, a, b, s=300, area=valor_integral, n=n)
+
+    if precisao is not None:
+        valor_integral = round(valor_integral, precisao)
+    if detalhes:
+        return valor_integral, {'erro_estimado': erro_estimado,
+                                'avaliacoes': avaliacoes,
+                                'n': n}
+    return valor_integral
+
+
 metodos_integral = {
     'Trapezoidal': integral_trapezoidal,
     'Simpson': integral_simpson,
+    'Adaptativo': integral_adaptativa,
+    'Romberg': integral_romberg,
+    'Gauss': integral_gauss,
 }
 
 
-def integral(funcao, a, b, n=100, mostrar_grafico=False, precisao=None, metodo='Trapezoidal'):
+@instrumentado
+def integral(funcao, a, b, n=None, mostrar_grafico=False, precisao=None, metodo='Trapezoidal',
+             avaliacao='auto', **opcoes):
     """
     Integra numericamente uma função dada, utilizando o método escolhido.
 
@@ -108,31 +583,376 @@ def integral(funcao, a, b, n=100, mostrar_grafico=False, precisao=None, metodo='
         funcao (callable): Expressão dada para a função.
         a (float): Limite inferior da integral.
         b (float): Limite superior da integral.
-        n (int): Número de divisões do intervalo de integração. Valor padrão é 100.
+        n (int, optional): Número de divisões do intervalo de integração. Se None,
+            usa o padrão do método (100 para 'Trapezoidal' e 'Simpson';
+            para 'Gauss', n é o número de nós por subintervalo).
         mostrar_grafico (bool, optional): Define se deve gerar o gráfico ou não. Valor padrão é False.
         precisao (int, optional): Número de casas decimais no resultado retornado. Se None, não arredonda.
         metodo (str, optional): Método escolhido para a integração. Valor padrão é 'Trapezoidal'.
+        avaliacao (str, optional): Estratégia de avaliação da função ('auto', 'vetorizado'
+            ou 'escalar'). Valor padrão é 'auto'.
+        **opcoes: Opções específicas do método, como tol e detalhes para
+            'Adaptativo' e 'Romberg' ou executor e workers para 'Trapezoidal'
+            e 'Simpson'. Com 'Trapezoidal' e 'Simpson', informar tol (ou
+            n_max) faz o número de divisões ser escolhido automaticamente
+            (ver integral_com_tolerancia); n passa a ser o número inicial.
 
     Raises:
         ValueError: Se o método escolhido não estiver entre os implementados.
+        ValueError: Se alguma opção não for aceita pelo método escolhido.
 
     Returns:
         float: Valor numérico obtido para a integral arredondado 
         de acordo com a precisão, caso fornecida.
     """
-    try:
-        metodo = metodo.capitalize()
-    except AttributeError:
-        raise ValueError(
-            f"Erro: o método informado deve ser uma string. "
-            f"Recebido tipo {type(metodo).__name__}."
-        )
+    metodo = validar_metodo(metodo, metodos_integral)
 
-    if metodo not in metodos_integral:
+    if n is not None:
+        opcoes['n'] = n
+    if metodo in ('Trapezoidal', 'Simpson') and ('tol' in opcoes or 'n_max' in opcoes):
+        funcao_escolhida = integral_com_tolerancia
+        opcoes['metodo'] = metodo
+    else:
+        funcao_escolhida = metodos_integral[metodo]
+
+    aceitas = inspect.signature(funcao_escolhida).parameters
+    invalidas = sorted(set(opcoes) - set(aceitas))
+    if invalidas:
         raise ValueError(
-            f"Erro: o método escolhido é inválido. "
-            f"Os métodos válidos são {', '.join(metodos_integral.keys())}"
+            f"Erro: opções não reconhecidas para o método {metodo}: {', '.join(invalidas)}."
         )
+    return funcao_escolhida(funcao, a, b, mostrar_grafico=mostrar_grafico, precisao=precisao,
+                            avaliacao=avaliacao, **opcoes)
+
+
+@instrumentado
+def integral_lote(funcao, limites_a, limites_b, n=None, metodo='Trapezoidal', parametros=None,
+                  precisao=None, avaliacao='auto', tamanho_bloco=TAMANHO_BLOCO):
+    """
+    Integra uma função em vários intervalos (ou para vários parâmetros) de uma vez.
+
+    Os nós de todos os intervalos formam uma grade bidimensional (uma linha
+    por intervalo), avaliada em uma única chamada da função; a regra de
+    integração é então aplicada ao longo das linhas, com soma compensada.
+    Para limitar a memória, a grade é montada em blocos de linhas com no
+    máximo `tamanho_bloco` nós cada.
+
+    Args:
+        funcao (callable): Expressão dada para a função. Se houver parâmetros,
+            é chamada como funcao(x, *parametros).
+        limites_a (array_like): Limites inferiores.
+        limites_b (array_like): Limites superiores, compatíveis (por
+            broadcasting) com limites_a.
+        n (int, optional): Número de divisões de cada intervalo ('Trapezoidal' e
+            'Simpson', padrão 100) ou de nós por intervalo ('Gauss', padrão 20).
+        metodo (str, optional): 'Trapezoidal', 'Simpson' ou 'Gauss'. Valor padrão é 'Trapezoidal'.
+        parametros (array_like or tuple, optional): Parâmetro (ou tupla de
+            parâmetros) da função, um valor por integral, compatíveis com os limites.
+        precisao (int, optional): Número de casas decimais nos resultados.
+        avaliacao (str, optional): Estratégia de avaliação da função ('auto', 'vetorizado'
+            ou 'escalar'). Valor padrão é 'auto'.
+        tamanho_bloco (int, optional): Número máximo de nós avaliados por chamada.
+
+    Raises:
+        ValueError: Se o método escolhido não estiver entre os disponíveis em lote.
+        ValueError: Caso a função não possa ser avaliada em algum ponto.
+        ValueError: Se os limites e parâmetros não tiverem formatos compatíveis.
+
+    Returns:
+        np.ndarray: Valores das integrais, com o formato comum dos limites e parâmetros.
+    """
+
+    validar_avaliacao(avaliacao)
+    metodo = validar_metodo(metodo, _regras_lote)
+    if not isinstance(tamanho_bloco, int) or tamanho_bloco < 1:
+        raise ValueError("Erro: tamanho_bloco deve ser um inteiro positivo.")
+    validar_precisao(precisao)
+
+    if parametros is None:
+        parametros = ()
+    elif not isinstance(parametros, tuple):
+        parametros = (parametros,)
+    try:
+        arrays = np.broadcast_arrays(np.asarray(limites_a, dtype=float),
+                                     np.asarray(limites_b, dtype=float),
+                                     *(np.asarray(p) for p in parametros))
+    except ValueError:
+        raise ValueError("Erro: os limites e parâmetros devem possuir formatos compatíveis.")
+    formato = arrays[0].shape
+    a, b, *parametros = (arr.reshape(-1) for arr in arrays)
+
+    # Nós e pesos da regra no intervalo de referência [0, 1].
+    t, pesos = _regras_lote[metodo](n)
+    funcao_contada = contar_avaliacoes(funcao)
+    linhas = max(1, tamanho_bloco // t.size)
+    resultado = np.empty(a.size)
 
-    funcao_escolhida = metodos_integral[metodo]
-    return funcao_escolhida(funcao, a, b, n, mostrar_grafico, precisao)
+    for inicio in range(0, a.size, linhas):
+        fatia = slice(inicio, inicio + linhas)
+        largura = b[fatia] - a[fatia]
+        grade = a[fatia, None] + largura[:, None] * t
+        args = tuple(p[fatia, None] for p in parametros)
+        y = avaliar_nos(funcao_contada, grade, avaliacao, args)
+        with fase('soma'):
+            soma, erro = _soma_dupla(y * pesos)
+            resultado[fatia] = largura * (soma + erro)
+
+    resultado = resultado.reshape(formato)
+    if precisao is not None:
+        return np.round(resultado, precisao)
+    return resultado
+
+
+_regras_lote = {
+    'Trapezoidal': regra_trapezoidal,
+    'Simpson': regra_simpson,
+    'Gauss': regra_gauss,
+}
+
+
+@instrumentado
+def integral_amostras(x, y, metodo='Trapezoidal', precisao=None, tamanho_bloco=TAMANHO_BLOCO):
+    """
+    Integra amostras tabeladas (x, y), com espaçamento qualquer entre os pontos.
+
+    As amostras são lidas em blocos alinhados (ver iterar_blocos), de modo
+    que arrays em disco (np.memmap) e iteráveis de blocos podem ser
+    integrados sem carregar tudo na memória. Os pontos da fronteira de cada
+    bloco são guardados para o bloco seguinte, e as contribuições de cada
+    intervalo são somadas com compensação.
+
+    No método 'Simpson', cada par de intervalos consecutivos é integrado pela
+    parábola que passa pelos três pontos. Se o número de intervalos for
+    ímpar, o último intervalo é integrado pela parábola dos três últimos
+    pontos, restrita a ele.
+
+    Args:
+        x (array_like or iterable): Abscissas das amostras, em ordem.
+        y (array_like or iterable): Valores da função nas abscissas.
+        metodo (str, optional): 'Trapezoidal' ou 'Simpson'. Valor padrão é 'Trapezoidal'.
+        precisao (int, optional): Número de casas decimais no resultado retornado.
+        tamanho_bloco (int, optional): Número de amostras lidas por vez.
+
+    Raises:
+        ValueError: Se o método escolhido não estiver entre os disponíveis.
+        ValueError: Se x e y não possuírem a mesma quantidade de elementos.
+        ValueError: Se houver menos de duas amostras ou valores não numéricos.
+        ValueError: Se, no método 'Simpson', x possuir valores repetidos.
+
+    Returns:
+        float: Valor numérico obtido para a integral arredondado
+        de acordo com a precisão, caso fornecida.
+    """
+
+    metodo = validar_metodo(metodo, _regras_amostras)
+    validar_precisao(precisao)
+
+    regra, passo = _regras_amostras[metodo]
+    blocos_x = iterar_blocos(x, tamanho_bloco)
+    blocos_y = iterar_blocos(y, tamanho_bloco)
+    acumulador = KahanAccumulator()
+    resto_x = resto_y = np.empty(0)
+    anterior = None
+    total = 0
+
+    while True:
+        try:
+            bloco_x = next(blocos_x, None)
+            bloco_y = next(blocos_y, None)
+        except (TypeError, ValueError):
+            raise ValueError("Erro: todos os valores das amostras devem ser numéricos.")
+        if bloco_x is None and bloco_y is None:
+            break
+        if bloco_x is None or bloco_y is None or bloco_x.size != bloco_y.size:
+            raise ValueError("Erro: x e y devem possuir a mesma quantidade de elementos.")
+        total += bloco_x.size
+
+        xs = np.concatenate([resto_x, bloco_x])
+        ys = np.concatenate([resto_y, bloco_y])
+        fim = (xs.size - 1) // passo * passo
+        if fim > 0:
+            with fase('soma'):
+                acumulador.extend(regra(xs[:fim + 1], ys[:fim + 1]))
+            anterior = (xs[fim - 1], ys[fim - 1])
+        resto_x, resto_y = xs[fim:], ys[fim:]
+
+    if total < 2:
+        raise ValueError("Erro: são necessárias pelo menos duas amostras.")
+
+    # Simpson com número ímpar de intervalos: sobra o último intervalo.
+    if resto_x.size == 2:
+        if anterior is None:
+            acumulador.extend(_trapezio_amostras(resto_x, resto_y))
+        else:
+            acumulador.add(_simpson_ultimo_intervalo(
+                np.array([anterior[0], *resto_x]), np.array([anterior[1], *resto_y])
+            ))
+
+    valor_integral = acumulador.value
+    if precisao is not None:
+        return round(valor_integral, precisao)
+    return valor_integral
+
+
+def _trapezio_amostras(x, y):
+    """
+    Áreas dos trapézios entre amostras consecutivas.
+    """
+
+    return np.diff(x) * (y[:-1] + y[1:]) / 2
+
+
+def _simpson_amostras(x, y):
+    """
+    Integrais das parábolas por cada trio de amostras (x0, x1, x2), (x2, x3, x4), ...
+
+    Raises:
+        ValueError: Se x possuir valores repetidos.
+    """
+
+    h0 = x[1:-1:2] - x[:-2:2]
+    h1 = x[2::2] - x[1:-1:2]
+    if np.any(h0 == 0) or np.any(h1 == 0):
+        raise ValueError("Erro: os valores de x não podem se repetir.")
+    soma_h = h0 + h1
+    return soma_h / 6 * ((2 - h1 / h0) * y[:-2:2]
+                         + soma_h ** 2 / (h0 * h1) * y[1:-1:2]
+                         + (2 - h0 / h1) * y[2::2])
+
+
+def _simpson_ultimo_intervalo(x, y):
+    """
+    Integral, só no último intervalo, da parábola pelos três pontos dados.
+
+    Raises:
+        ValueError: Se x possuir valores repetidos.
+    """
+
+    h0 = x[1] - x[0]
+    h1 = x[2] - x[1]
+    if h0 == 0 or h1 == 0:
+        raise ValueError("Erro: os valores de x não podem se repetir.")
+    return float(_simpson_metades(h0, h1, *y)[1])
+
+
+def _simpson_metades(h0, h1, y0, y1, y2):
+    """
+    Integrais da parábola por (x0, y0), (x1, y1), (x2, y2) em [x0, x1] e em [x1, x2],
+    com h0 = x1 - x0 e h1 = x2 - x1. Com h0 = h1 = h, valem
+    h/12 (5 y0 + 8 y1 - y2) e h/12 (-y0 + 8 y1 + 5 y2).
+    """
+
+    soma_h = h0 + h1
+    esquerda = ((2 * h0 ** 2 + 3 * h0 * h1) / (6 * soma_h) * y0
+                + (h0 ** 2 + 3 * h0 * h1) / (6 * h1) * y1
+                - h0 ** 3 / (6 * h1 * soma_h) * y2)
+    direita = (-h1 ** 3 / (6 * h0 * soma_h) * y0
+               + (h1 ** 2 + 3 * h0 * h1) / (6 * h0) * y1
+               + (2 * h1 ** 2 + 3 * h0 * h1) / (6 * soma_h) * y2)
+    return esquerda, direita
+
+
+# Método -> (regra aplicada a um bloco, número de intervalos por painel).
+_regras_amostras = {
+    'Trapezoidal': (_trapezio_amostras, 1),
+    'Simpson': (_simpson_amostras, 2),
+}
+
+
+@instrumentado
+def integral_cumulativa(funcao_ou_amostras, a=None, b=None, n=100, metodo='Trapezoidal',
+                        precisao=None, avaliacao='auto'):
+    """
+    Calcula a integral acumulada F(x_i) = integral de x_0 a x_i em todos os nós, de uma vez.
+
+    A função é avaliada uma única vez em todos os nós; a integral de cada
+    intervalo é calculada pela regra escolhida e os valores acumulados são
+    obtidos com somas de prefixos compensadas, com custo total O(n).
+
+    No método 'Simpson', cada intervalo recebe a integral da parábola pelos
+    três pontos do seu par de intervalos (com espaçamento h constante,
+    h/12 (5 y0 + 8 y1 - y2) e h/12 (-y0 + 8 y1 + 5 y2)), de modo que, nos nós
+    de índice par, F coincide com a regra de Simpson composta. Se o número
+    de intervalos for ímpar, o último usa a parábola dos três últimos pontos.
+
+    O resultado (x, F) pode ser usado diretamente em InterpolacaoLinearPorPartes,
+    por exemplo para inverter uma função de distribuição acumulada.
+
+    Args:
+        funcao_ou_amostras (callable or tuple): Função a integrar ou par (x, y)
+            de amostras tabeladas, com x em ordem.
+        a (float, optional): Limite inferior (obrigatório para funções).
+        b (float, optional): Limite superior (obrigatório para funções).
+        n (int, optional): Número de divisões do intervalo, para funções. Valor padrão é 100.
+        metodo (str, optional): 'Trapezoidal' ou 'Simpson'. Valor padrão é 'Trapezoidal'.
+        precisao (int, optional): Número de casas decimais nos resultados.
+        avaliacao (str, optional): Estratégia de avaliação da função ('auto', 'vetorizado'
+            ou 'escalar'). Valor padrão é 'auto'.
+
+    Raises:
+        ValueError: Se o método escolhido não estiver entre os disponíveis.
+        ValueError: Se a função for dada sem os limites a e b.
+        ValueError: Se as amostras forem inválidas (tamanhos diferentes, menos
+            de duas amostras ou, no método 'Simpson', abscissas repetidas).
+        ValueError: Caso a função não possa ser avaliada em algum ponto.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: Nós x e integrais acumuladas F, com F[0] = 0.
+    """
+
+    metodo = validar_metodo(metodo, _intervalos_cumulativos)
+    validar_precisao(precisao)
+
+    if callable(funcao_ou_amostras):
+        if a is None or b is None:
+            raise ValueError("Erro: os limites a e b devem ser informados para integrar uma função.")
+        validar_avaliacao(avaliacao)
+        x = np.linspace(a, b, n + 1)
+        y = avaliar_nos(contar_avaliacoes(funcao_ou_amostras), x, avaliacao)
+    else:
+        try:
+            x, y = (np.asarray(v, dtype=float).ravel() for v in funcao_ou_amostras)
+        except (TypeError, ValueError):
+            raise ValueError("Erro: as amostras devem ser um par (x, y) de valores numéricos.")
+        if x.size != y.size:
+            raise ValueError("Erro: x e y devem possuir a mesma quantidade de elementos.")
+    if x.size < 2:
+        raise ValueError("Erro: são necessárias pelo menos duas amostras.")
+
+    intervalos = _intervalos_cumulativos[metodo](x, y)
+    with fase('soma'):
+        acumulada = np.concatenate([[0.0], soma_acumulada_compensada(intervalos)])
+
+    if precisao is not None:
+        acumulada = np.round(acumulada, precisao)
+    return x, acumulada
+
+
+def _simpson_intervalos(x, y):
+    """
+    Integral de cada intervalo pela parábola do seu par de intervalos.
+
+    Raises:
+        ValueError: Se x possuir valores repetidos.
+    """
+
+    h = np.diff(x)
+    if h.size == 1:
+        return _trapezio_amostras(x, y)
+    if np.any(h == 0):
+        raise ValueError("Erro: os valores de x não podem se repetir.")
+
+    intervalos = np.empty(h.size)
+    fim = h.size // 2 * 2
+    intervalos[0:fim:2], intervalos[1:fim:2] = _simpson_metades(
+        h[0:fim:2], h[1:fim:2], y[0:fim:2], y[1:fim + 1:2], y[2:fim + 1:2]
+    )
+    if h.size % 2:
+        intervalos[-1] = _simpson_metades(h[-2], h[-1], y[-3], y[-2], y[-1])[1]
+    return intervalos
+
+
+_intervalos_cumulativos = {
+    'Trapezoidal': _trapezio_amostras,
+    'Simpson': _simpson_intervalos,
+}
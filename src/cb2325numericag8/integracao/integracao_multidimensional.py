@@ -0,0 +1,254 @@
+import numpy as np
+from cb2325numericag8.integracao.regras import (
+    avaliar_nos, regra_trapezoidal, regra_simpson, regra_gauss
+)
+from cb2325numericag8.utils.avaliacao import validar_avaliacao
+from cb2325numericag8.utils.blocos import TAMANHO_BLOCO
+from cb2325numericag8.utils.instrumentacao import instrumentado, contar_avaliacoes, fase
+from cb2325numericag8.utils.kahan import KahanAccumulator, soma_kahan
+from cb2325numericag8.utils.quase_aleatorio import halton, sobol
+from cb2325numericag8.utils.validacao import validar_metodo, validar_precisao
+
+
+@instrumentado
+def integral_produto_tensorial(funcao, limites, n=20, metodo='Trapezoidal', precisao=None,
+                               avaliacao='auto', tamanho_bloco=TAMANHO_BLOCO):
+    """
+    Integra numericamente uma função de várias variáveis em uma caixa, com a
+    regra produto (tensorial) de uma regra unidimensional.
+
+    A função é chamada como funcao(x_1, ..., x_d), com um array por
+    coordenada. Os nós da grade são percorridos em blocos de até
+    `tamanho_bloco` pontos, cada bloco avaliado em uma única chamada, e as
+    contribuições são somadas com compensação. O número de nós cresce como
+    (n + 1)^d, de modo que a regra é indicada para poucas dimensões; para
+    mais dimensões, veja integral_quase_monte_carlo.
+
+    Args:
+        funcao (callable): Expressão dada para a função.
+        limites (sequence): Pares (a_k, b_k) com os limites de cada variável.
+        n (int or sequence, optional): Número de divisões ('Trapezoidal' e 'Simpson')
+            ou de nós ('Gauss') por variável, único ou um por variável. Valor padrão é 20.
+        metodo (str, optional): 'Trapezoidal', 'Simpson' ou 'Gauss'. Valor padrão é 'Trapezoidal'.
+        precisao (int, optional): Número de casas decimais no resultado retornado.
+        avaliacao (str, optional): Estratégia de avaliação da função ('auto', 'vetorizado'
+            ou 'escalar'). Valor padrão é 'auto'.
+        tamanho_bloco (int, optional): Número máximo de nós avaliados por chamada.
+
+    Raises:
+        ValueError: Se o método escolhido não estiver entre os disponíveis.
+        ValueError: Se os limites ou o número de divisões forem inválidos.
+        ValueError: Caso a função não possa ser avaliada em algum ponto.
+
+    Returns:
+        float: Valor numérico obtido para a integral arredondado
+        de acordo com a precisão, caso fornecida.
+    """
+
+    validar_avaliacao(avaliacao)
+    metodo = validar_metodo(metodo, _regras_tensoriais)
+    inferiores, larguras = _validar_limites(limites)
+    dimensao = inferiores.size
+    if not isinstance(tamanho_bloco, int) or tamanho_bloco < 1:
+        raise ValueError("Erro: tamanho_bloco deve ser um inteiro positivo.")
+    validar_precisao(precisao)
+
+    divisoes = [n] * dimensao if np.ndim(n) == 0 else list(n)
+    if len(divisoes) != dimensao:
+        raise ValueError("Erro: deve haver um número de divisões para cada variável.")
+
+    regra = _regras_tensoriais[metodo]
+    nos, pesos = [], []
+    for k, n_k in enumerate(divisoes):
+        t, w = regra(n_k)
+        nos.append(inferiores[k] + larguras[k] * t)
+        pesos.append(w)
+    formato = tuple(len(t) for t in nos)
+    total = int(np.prod(formato))
+
+    funcao_contada = contar_avaliacoes(funcao)
+    acumulador = KahanAccumulator()
+    for inicio in range(0, total, tamanho_bloco):
+        indices = np.unravel_index(np.arange(inicio, min(inicio + tamanho_bloco, total)), formato)
+        coordenadas = [nos[k][indices[k]] for k in range(dimensao)]
+        peso = pesos[0][indices[0]]
+        for k in range(1, dimensao):
+            peso = peso * pesos[k][indices[k]]
+        y = avaliar_nos(funcao_contada, coordenadas[0], avaliacao, tuple(coordenadas[1:]))
+        with fase('soma'):
+            acumulador.extend(peso * y)
+
+    valor_integral = float(np.prod(larguras)) * acumulador.value
+    if precisao is not None:
+        return round(valor_integral, precisao)
+    return valor_integral
+
+
+@instrumentado
+def integral_quase_monte_carlo(funcao, limites, metodo='Sobol', tol=1e-4, n_min=2 ** 10,
+                               n_max=2 ** 20, replicas=8, semente=None, precisao=None,
+                               avaliacao='auto', detalhes=False, tamanho_bloco=TAMANHO_BLOCO):
+    """
+    Integra numericamente uma função de várias variáveis em uma caixa, com
+    quase Monte Carlo (sequências de Sobol ou de Halton) e deslocamentos aleatórios.
+
+    São usadas `replicas` cópias da sequência, cada uma deslocada por um
+    vetor aleatório (módulo 1). A média das réplicas é a estimativa da
+    integral e o desvio padrão da média estima o seu erro. O número de
+    pontos começa em n_min e dobra a cada etapa; em cada etapa só os pontos
+    novos são avaliados, em blocos de até `tamanho_bloco` pontos por
+    chamada, e o processo para quando o erro estimado fica abaixo de tol
+    ou quando n_max é atingido.
+
+    A função é chamada como funcao(x_1, ..., x_d), com um array por coordenada.
+
+    Args:
+        funcao (callable): Expressão dada para a função.
+        limites (sequence): Pares (a_k, b_k) com os limites de cada variável.
+        metodo (str, optional): 'Sobol' ou 'Halton'. Valor padrão é 'Sobol'.
+        tol (float, optional): Erro estimado desejado. Valor padrão é 1e-4.
+        n_min (int, optional): Número inicial de pontos por réplica. Valor padrão é 2^10.
+        n_max (int, optional): Número máximo de pontos por réplica. Valor padrão é 2^20.
+        replicas (int, optional): Número de deslocamentos aleatórios. Valor padrão é 8.
+        semente (int, optional): Semente do gerador dos deslocamentos.
+        precisao (int, optional): Número de casas decimais no resultado retornado.
+        avaliacao (str, optional): Estratégia de avaliação da função ('auto', 'vetorizado'
+            ou 'escalar'). Valor padrão é 'auto'.
+        detalhes (bool, optional): Se True, retorna também um dicionário com o erro
+            estimado, o número de avaliações e o número de pontos por réplica.
+        tamanho_bloco (int, optional): Número máximo de pontos avaliados por chamada.
+
+    Raises:
+        ValueError: Se o método escolhido não estiver entre os disponíveis.
+        ValueError: Se os limites, tol, n_min, n_max ou replicas forem inválidos.
+        ValueError: Caso a função não possa ser avaliada em algum ponto.
+
+    Returns:
+        float: Valor numérico obtido para a integral arredondado de acordo com
+        a precisão, caso fornecida. Se detalhes=True, retorna a tupla
+        (valor, {'erro_estimado', 'avaliacoes', 'n'}).
+    """
+
+    validar_avaliacao(avaliacao)
+    metodo = validar_metodo(metodo, _sequencias)
+    inferiores, larguras = _validar_limites(limites)
+    dimensao = inferiores.size
+    if not tol > 0:
+        raise ValueError("Erro: tol deve ser positiva.")
+    if not isinstance(n_min, int) or not isinstance(n_max, int) or not 1 <= n_min <= n_max:
+        raise ValueError("Erro: n_min e n_max devem ser inteiros com 1 <= n_min <= n_max.")
+    if not isinstance(replicas, int) or replicas < 2:
+        raise ValueError("Erro: replicas deve ser um inteiro maior ou igual a 2.")
+    if not isinstance(tamanho_bloco, int) or tamanho_bloco < 1:
+        raise ValueError("Erro: tamanho_bloco deve ser um inteiro positivo.")
+    validar_precisao(precisao)
+
+    sequencia = _sequencias[metodo]
+    deslocamentos = np.random.default_rng(semente).random((replicas, dimensao))
+    acumuladores = [KahanAccumulator() for _ in range(replicas)]
+    funcao_contada = contar_avaliacoes(funcao)
+    volume = float(np.prod(larguras))
+
+    n = 0
+    n_alvo = n_min
+    while True:
+        for inicio in range(n, n_alvo, tamanho_bloco):
+            pontos = sequencia(min(tamanho_bloco, n_alvo - inicio), dimensao, inicio)
+            for r in range(replicas):
+                x = inferiores + larguras * ((pontos + deslocamentos[r]) % 1.0)
+                y = avaliar_nos(funcao_contada, x[:, 0], avaliacao,
+                                 tuple(x[:, k] for k in range(1, dimensao)))
+                with fase('soma'):
+                    acumuladores[r].extend(y)
+        n = n_alvo
+
+        estimativas = volume * np.array([acumulador.value for acumulador in acumuladores]) / n
+        erro_estimado = float(np.std(estimativas, ddof=1) / np.sqrt(replicas))
+        if erro_estimado <= tol or n >= n_max:
+            break
+        n_alvo = min(2 * n, n_max)
+
+    if erro_estimado > tol:
+        print(f"Aviso: tolerância não atingida com n_max = {n_max} pontos por réplica "
+              f"(erro estimado {erro_estimado:.3e}).")
+
+    valor_integral = soma_kahan(estimativas) / replicas
+    if precisao is not None:
+        valor_integral = round(valor_integral, precisao)
+    if detalhes:
+        return valor_integral, {'erro_estimado': erro_estimado,
+                                'avaliacoes': n * replicas,
+                                'n': n}
+    return valor_integral
+
+
+metodos_multidimensionais = {
+    'Trapezoidal': integral_produto_tensorial,
+    'Simpson': integral_produto_tensorial,
+    'Gauss': integral_produto_tensorial,
+    'Sobol': integral_quase_monte_carlo,
+    'Halton': integral_quase_monte_carlo,
+}
+
+
+@instrumentado
+def integral_multidimensional(funcao, limites, metodo='Trapezoidal', precisao=None,
+                              avaliacao='auto', **opcoes):
+    """
+    Integra numericamente uma função de várias variáveis em uma caixa,
+    utilizando o método escolhido.
+
+    Os métodos 'Trapezoidal', 'Simpson' e 'Gauss' usam a regra produto
+    (integral_produto_tensorial), indicada para poucas dimensões; 'Sobol' e
+    'Halton' usam quase Monte Carlo (integral_quase_monte_carlo).
+
+    Args:
+        funcao (callable): Expressão dada para a função, chamada como funcao(x_1, ..., x_d).
+        limites (sequence): Pares (a_k, b_k) com os limites de cada variável.
+        metodo (str, optional): Método escolhido para a integração. Valor padrão é 'Trapezoidal'.
+        precisao (int, optional): Número de casas decimais no resultado retornado.
+        avaliacao (str, optional): Estratégia de avaliação da função ('auto', 'vetorizado'
+            ou 'escalar'). Valor padrão é 'auto'.
+        **opcoes: Opções do método escolhido, como n, tol ou detalhes.
+
+    Raises:
+        ValueError: Se o método escolhido não estiver entre os implementados.
+
+    Returns:
+        float: Valor numérico obtido para a integral arredondado
+        de acordo com a precisão, caso fornecida.
+    """
+
+    metodo = validar_metodo(metodo, metodos_multidimensionais)
+    funcao_escolhida = metodos_multidimensionais[metodo]
+    return funcao_escolhida(funcao, limites, metodo=metodo, precisao=precisao,
+                            avaliacao=avaliacao, **opcoes)
+
+
+_regras_tensoriais = {
+    'Trapezoidal': regra_trapezoidal,
+    'Simpson': regra_simpson,
+    'Gauss': regra_gauss,
+}
+
+_sequencias = {
+    'Sobol': sobol,
+    'Halton': halton,
+}
+
+
+def _validar_limites(limites):
+    """
+    Converte os limites em arrays de limites inferiores e larguras.
+
+    Raises:
+        ValueError: Se os limites não forem pares (a, b) numéricos.
+    """
+
+    try:
+        limites = np.asarray(limites, dtype=float)
+    except (TypeError, ValueError):
+        raise ValueError("Erro: os limites devem ser pares (a, b) numéricos.")
+    if limites.ndim != 2 or limites.shape[1] != 2 or limites.shape[0] == 0:
+        raise ValueError("Erro: os limites devem ser pares (a, b) numéricos.")
+    return limites[:, 0], limites[:, 1] - limites[:, 0]
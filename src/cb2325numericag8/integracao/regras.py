@@ -0,0 +1,74 @@
+import numpy as np
+from cb2325numericag8.utils.avaliacao import avaliar_funcao, avaliar_funcao_paralela
+from cb2325numericag8.utils.gauss_legendre import nos_pesos_gauss_legendre
+from cb2325numericag8.utils.instrumentacao import fase, registrar_avaliacoes
+
+# Funções internas compartilhadas pelos módulos de integração em uma e
+# várias dimensões (não fazem parte da interface pública do pacote).
+
+
+def avaliar_nos(funcao, pontos, avaliacao, args=(), executor=None, workers=None):
+    """
+    Avalia a função nos nós de integração, verificando se todos os valores são finitos.
+
+    Se `executor` ou `workers` forem informados, os nós são avaliados em
+    paralelo (ver avaliar_funcao_paralela); nesse caso a função não pode ser
+    envolvida por contar_avaliacoes, e as avaliações são registradas aqui.
+
+    Raises:
+        ValueError: Caso a função não possa ser avaliada em algum ponto,
+            indicando o primeiro nó com problema.
+    """
+
+    try:
+        if executor is None and workers is None:
+            y = avaliar_funcao(funcao, pontos, avaliacao, args)
+        else:
+            with fase('avaliacao'):
+                y = avaliar_funcao_paralela(funcao, pontos, avaliacao, executor, workers)
+            registrar_avaliacoes(pontos.size)
+        finitos = np.isfinite(y)
+        if not np.all(finitos):
+            i = int(np.argmin(finitos.reshape(-1)))
+            raise ValueError(
+                f"Função não definida em algum ponto do intervalo (NaN ou infinito): "
+                f"nó {i}, x = {pontos.flat[i]}."
+            )
+    except Exception as e:
+        raise ValueError(f"Erro ao avaliar a função em algum ponto do intervalo: {e}")
+    return y
+
+
+def regra_trapezoidal(n):
+    """
+    Nós e pesos da regra trapezoidal composta em [0, 1].
+    """
+
+    n = 100 if n is None else n
+    pesos = np.full(n + 1, 1.0 / n)
+    pesos[[0, -1]] /= 2
+    return np.linspace(0, 1, n + 1), pesos
+
+
+def regra_simpson(n):
+    """
+    Nós e pesos da regra de Simpson composta em [0, 1].
+    """
+
+    n = 100 if n is None else n
+    if n % 2 != 0:
+        n += 1
+        print(f"Aviso: número de divisões do intervalo de integração deve ser par. Ajustado para {n}.")
+    pesos = np.full(n + 1, 2.0)
+    pesos[1::2] = 4.0
+    pesos[[0, -1]] = 1.0
+    return np.linspace(0, 1, n + 1), pesos / (3 * n)
+
+
+def regra_gauss(n):
+    """
+    Nós e pesos da quadratura de Gauss-Legendre em [0, 1].
+    """
+
+    nos, pesos = nos_pesos_gauss_legendre(20 if n is None else n)
+    return (nos + 1) / 2, pesos / 2
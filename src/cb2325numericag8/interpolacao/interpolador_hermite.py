@@ -1,6 +1,11 @@
 import numpy as np
-import matplotlib.pyplot as plt
-from cb2325numericag8.grafico.grafico_interpolacao_hermite import grafico_hermite
+from cb2325numericag8.utils.importacao import importacao_preguicosa
+from cb2325numericag8.utils.instrumentacao import instrumentado, fase
+
+# A função de gráfico é carregada sob demanda, para não importar o matplotlib.
+__getattr__ = importacao_preguicosa(__name__, {
+    'grafico_hermite': 'cb2325numericag8.grafico.grafico_interpolacao_hermite:grafico_hermite',
+})
 
 class InterpoladorHermite():
     """
@@ -105,6 +110,7 @@ class InterpoladorHermite():
         self._coef = coef
         self._z_nodes = z_nodes
 
+    @instrumentado
     def __call__(self, x: float) -> float:
         """
         Avalia o polinômio interpolador de Hermite em um ponto x.
@@ -134,11 +140,14 @@ class InterpoladorHermite():
 
         return k
 
+    @instrumentado
     def grafico(self):
 
         '''
         Plota os segmentos de retas do interpolador
         '''
 
-        grafico_hermite(self)
+        with fase("grafico"):
+            from cb2325numericag8.grafico.grafico_interpolacao_hermite import grafico_hermite
+            grafico_hermite(self)
         
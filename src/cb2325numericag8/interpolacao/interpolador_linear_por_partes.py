@@ -1,6 +1,12 @@
 import numpy as np
-import matplotlib.pyplot as plt
-from cb2325numericag8.grafico.grafico_interpolador_linear_por_partes import grafico_interpolacao_linear
+from cb2325numericag8.utils.importacao import importacao_preguicosa
+from cb2325numericag8.utils.instrumentacao import instrumentado, fase
+
+# A função de gráfico é carregada sob demanda, para não importar o matplotlib.
+__getattr__ = importacao_preguicosa(__name__, {
+    'grafico_interpolacao_linear': 'cb2325numericag8.grafico.grafico_interpolador_linear_por_partes:grafico_interpolacao_linear',
+})
+
 class InterpolacaoLinearPorPartes:
     
     '''
@@ -47,6 +53,7 @@ class InterpolacaoLinearPorPartes:
       
         return coef_angular, coef_linear
 
+    @instrumentado
     def __call__(self, x):
 
         '''
@@ -67,16 +74,12 @@ class InterpolacaoLinearPorPartes:
         elif x==self.x[-1]:
             return self.y[-1] 
         else:
-            i = 0
-            while True:
-                if self.x[i]<=x<self.x[i+1]: 
-                    break
-                i+=1
-                
+            i = self._indice(x)
             a,b = self.reta(i)
         
             return a*x+b
         
+    @instrumentado
     def calcular_retas(self):      
   
         '''
@@ -98,6 +101,7 @@ class InterpolacaoLinearPorPartes:
 
         return self.retas
 
+    @instrumentado
     def interpolar_muitos_pontos(self,x):
         
         '''
@@ -107,38 +111,62 @@ class InterpolacaoLinearPorPartes:
 
         A diferença desta função para '__call__' é que 'interpolar_muitos_pontos' é mais eficiente caso sejam realizadas muitas interpolações.
 
+        Também aceita um array de abscissas, interpoladas todas de uma vez.
+
         Args:
-            x (float): Coordenada x do ponto que se deseja interpolar.    
+            x (float or array): Coordenada x do ponto (ou pontos) que se deseja interpolar.
         
         Raises:
             ValueError: O valor de x está fora dos limites de self.x (extrapolação).
 
         Return:
-            float: Coordenada y do ponto interpolado.
+            float or array: Coordenada y do ponto (ou pontos) interpolado.
         '''
 
+        if np.ndim(x) > 0:
+            x = np.asarray(x, dtype=float)
+            if np.any(x < self.x[0]) or np.any(x > self.x[-1]):
+                raise ValueError('Erro de Extrapolação: a abscissa a ser avaliada está fora do intrevalo de interpolação.')
+            i = self._indice(x)
+            y = self.retas[i, 0]*x + self.retas[i, 1]
+            return np.where(x == self.x[-1], self.y[-1], y)
+
         if x<self.x[0] or x>self.x[-1]:
             raise ValueError('Erro de Extrapolação: a abscissa a ser avaliada está fora do intrevalo de interpolação.')
         elif x == self.x[-1]:
             return self.y[-1]
         else:    
-            i = 0
-            while True:
-                if self.x[i]<=x<self.x[i+1]: 
-                    break
-                i+=1
+            i = self._indice(x)
         
         y = self.retas[i][0]*x+self.retas[i][1]
 
         return y
 
+    def _indice(self, x):
+
+        '''
+        Encontra, por busca binária, o índice i do intervalo [self.x[i], self.x[i+1]) que contém x.
+
+        Args:
+            x (float or array): Abscissa (ou abscissas) dentro do intervalo de interpolação.
+
+        Return:
+            int or array: Índice do ponto extremo esquerdo do intervalo.
+        '''
+
+        i = np.searchsorted(self.x, x, side='right') - 1
+        return np.minimum(i, len(self.x) - 2)
+
+    @instrumentado
     def plot(self):
 
         '''
         Plota os segmentos de retas do interpolador
         '''
 
-        grafico_interpolacao_linear(self)
+        with fase("grafico"):
+            from cb2325numericag8.grafico.grafico_interpolador_linear_por_partes import grafico_interpolacao_linear
+            grafico_interpolacao_linear(self)
     
 
 #TESTES:
@@ -1,5 +1,11 @@
 import numpy as np
-from cb2325numericag8.grafico.grafico_interpolacao_newton import grafico_newton
+from cb2325numericag8.utils.importacao import importacao_preguicosa
+from cb2325numericag8.utils.instrumentacao import instrumentado, fase
+
+# A função de gráfico é carregada sob demanda, para não importar o matplotlib.
+__getattr__ = importacao_preguicosa(__name__, {
+    'grafico_newton': 'cb2325numericag8.grafico.grafico_interpolacao_newton:grafico_newton',
+})
 
 class InterpoladorPolinomial:
     """
@@ -148,6 +154,7 @@ class InterpoladorPolinomial:
 
         self._coef_iterativo_cache = coef.tolist()  # Armazena no cache
 
+    @instrumentado
     def __call__(self, x: float) -> float:
         """
         Avalia o polinômio interpolador em um ponto 'x'.
@@ -188,11 +195,14 @@ class InterpoladorPolinomial:
 
         return k
 
+    @instrumentado
     def grafico(self):
         '''
         Plota os segmentos de retas do interpolador
         '''
-        grafico_newton(self)
+        with fase("grafico"):
+            from cb2325numericag8.grafico.grafico_interpolacao_newton import grafico_newton
+            grafico_newton(self)
         
 
 if __name__ == "__main__":
@@ -1,7 +1,19 @@
 #Implementação do método das raízes
 
-from cb2325numericag8.grafico.grafico_raizes import grafico
+import sys
 
+import numpy as np
+from cb2325numericag8.utils.avaliacao import avaliar_funcao, validar_avaliacao
+from cb2325numericag8.utils.dual import derivada_central, valor_e_derivada
+from cb2325numericag8.utils.importacao import importacao_preguicosa
+from cb2325numericag8.utils.instrumentacao import instrumentado, contar_avaliacoes, fase, registrar_iteracoes
+
+# A função de gráfico é carregada sob demanda, para não importar o matplotlib.
+__getattr__ = importacao_preguicosa(__name__, {
+    'grafico': 'cb2325numericag8.grafico.grafico_raizes:grafico',
+})
+
+@instrumentado
 def raiz(funcao, a, b=None, f_prime=None, tol=1e-6, max_iter=1000, method="secante", mostrar_grafico=False):
     """
     Função principal para encontrar raizes de uma equação f(x)=0.
@@ -11,9 +23,11 @@ def raiz(funcao, a, b=None, f_prime=None, tol=1e-6, max_iter=1000, method="secan
         a (float): parâmetro inicial (depende do método escolhido)
         b (float): parâmetro inicial (depende do método escolhido)
         tol (float): tolerância para a convergência do método.
-        f_prime (callable): derivada da função f(x).
+        f_prime (callable): derivada da função f(x). Se None, o método de
+            Newton-Raphson calcula a derivada automaticamente.
         max_iter (int): número máximo de iterações do método.
-        method (str): método a ser utilizado.
+        method (str): método a ser utilizado ("bissecao", "secante",
+            "newton_raphson" ou "brent").
         mostrar_grafico (bool): se for True plota o gráfico. Padrão é False.
     
     Returns:
@@ -26,24 +40,39 @@ def raiz(funcao, a, b=None, f_prime=None, tol=1e-6, max_iter=1000, method="secan
     if method == "bissecao":
         raiz,lista_iteracoes=bissecao(funcao, a, b, tol, max_iter)
         if(mostrar_grafico==True):
-            grafico(funcao, lista_iteracoes, titulo_metodo="Método Numérico da Bisseção para Raízes")
+            with fase("grafico"):
+                from cb2325numericag8.grafico.grafico_raizes import grafico
+                grafico(funcao, lista_iteracoes, titulo_metodo="Método Numérico da Bisseção para Raízes")
         return raiz,lista_iteracoes
 
     elif method == "secante":
         raiz,lista_iteracoes=secante(funcao, a, b, tol, max_iter)
         if(mostrar_grafico==True):
-            grafico(funcao, lista_iteracoes, titulo_metodo="Método Numérico da Secante para Raízes")
+            with fase("grafico"):
+                from cb2325numericag8.grafico.grafico_raizes import grafico
+                grafico(funcao, lista_iteracoes, titulo_metodo="Método Numérico da Secante para Raízes")
         return raiz,lista_iteracoes
 
     elif method == "newton_raphson":
         raiz,lista_iteracoes=newton(funcao, a, f_prime,tol, max_iter)
         if(mostrar_grafico==True):
-            grafico(funcao, lista_iteracoes, titulo_metodo="Método Numérico de Newton-Raphson para Raízes")
+            with fase("grafico"):
+                from cb2325numericag8.grafico.grafico_raizes import grafico
+                grafico(funcao, lista_iteracoes, titulo_metodo="Método Numérico de Newton-Raphson para Raízes")
+        return raiz,lista_iteracoes
+
+    elif method == "brent":
+        raiz,lista_iteracoes=brent(funcao, a, b, tol, max_iter)
+        if(mostrar_grafico==True):
+            with fase("grafico"):
+                from cb2325numericag8.grafico.grafico_raizes import grafico
+                grafico(funcao, lista_iteracoes, titulo_metodo="Método Numérico de Brent para Raízes")
         return raiz,lista_iteracoes
     
     else:
         raise ValueError("Método não reconhecido")
 
+@instrumentado
 def bissecao(funcao, a, b, tol, max_iter):
     """
     Encontra a raiz de uma equação f(x)=0 usando o método da bisseção.
@@ -67,6 +96,7 @@ def bissecao(funcao, a, b, tol, max_iter):
                       é atingido sem convergência.
     """
 
+    funcao = contar_avaliacoes(funcao)
     f_a = funcao(a)
     f_b = funcao(b)
 
@@ -100,11 +130,13 @@ def bissecao(funcao, a, b, tol, max_iter):
             else:
                 a = m
                 f_a = f_m
+        registrar_iteracoes(iter)
         if (b-a)/2 > tol and iter == max_iter:
             raise RuntimeError("Número máximo de iterações atingido sem convergência.")
         else: 
             return (a+b)/2, iter_para_plot
 
+@instrumentado
 def secante(funcao, a, b, tol, max_iter):
     """
     Encontra a raiz de uma equação f(x)=0 usando o método da secante.
@@ -128,6 +160,7 @@ def secante(funcao, a, b, tol, max_iter):
                       é atingido sem convergência.
     """
 
+    funcao = contar_avaliacoes(funcao)
     iter = 0
     iter_para_plot = []
     f_a = funcao(a)
@@ -143,26 +176,32 @@ def secante(funcao, a, b, tol, max_iter):
         iter_para_plot.append(c)
 
         if (abs(c-b) < tol or abs(f_c) < tol):
+            registrar_iteracoes(iter + 1)
             return c, iter_para_plot
         a = b
         f_a = f_b
         b = c
         f_b = f_c
         iter += 1
+    registrar_iteracoes(iter)
     raise RuntimeError("Número máximo de iterações atingido sem convergência.")
 
 
+@instrumentado
 def newton(funcao, a, f_prime, tol, max_iter):
     """
     Encontra a raiz de uma equação f(x)=0 usando o método de newton-raphson.
 
     Este método requer uma estimativa inicial a para o valor da raiz e a 
-    derivada f_prime da função
+    derivada f_prime da função. Se f_prime for None, f(x) e f'(x) são
+    calculados juntos com números duais (derivada exata, uma avaliação da
+    função); se a função não aceitar números duais, usa-se o passo
+    complexo e, por último, diferenças centrais.
 
     Args:
         funcao (callable): expressão dada para a função f(x).
         a (float): aproximação inicial para a raiz
-        f_prime (callable): expressão dada para a função f'(x).
+        f_prime (callable): expressão dada para a função f'(x). Opcional.
         tol (float): tolerância para a convergência do método.
         max_iter (int): número máximo de iterações do método.
     
@@ -175,16 +214,18 @@ def newton(funcao, a, f_prime, tol, max_iter):
                       é atingido sem convergência.
     """
 
+    funcao = contar_avaliacoes(funcao)
+    f_prime = contar_avaliacoes(f_prime, chave="avaliacoes_derivada")
     iter = 0
     iter_para_plot = []
 
-    if (f_prime == None):
-            h=tol
-            f_prime=lambda x: (funcao(x+h)-funcao(x))/h
-            
+    if f_prime is None:
+        valor_derivada = valor_e_derivada(funcao)
+    else:
+        valor_derivada = lambda x: (funcao(x), f_prime(x))
+
     while iter < max_iter:
-        f_a = funcao(a)
-        f_prime_a=f_prime(a)
+        f_a, f_prime_a = valor_derivada(a)
 
         if f_prime_a == 0:
             raise ZeroDivisionError("Erro: derivada zero f_prime(a) = 0. Divisão por zero.")
@@ -193,9 +234,644 @@ def newton(funcao, a, f_prime, tol, max_iter):
         iter_para_plot.append(c)
         
         if (abs(c-a) < tol and abs(funcao(c))<tol):
+            registrar_iteracoes(iter + 1)
             return c, iter_para_plot
         
         a = c
         iter += 1
     
+    registrar_iteracoes(iter)
+    raise RuntimeError("Número máximo de iterações atingido sem convergência.")
+
+
+@instrumentado
+def brent(funcao, a, b, tol, max_iter):
+    """
+    Encontra a raiz de uma equação f(x)=0 usando o método de Brent.
+
+    Como a bisseção, este método requer um intervalo inicial [a, b] tal que
+    f(a) e f(b) tenham sinais opostos, e a raiz permanece sempre cercada.
+    A cada iteração tenta um passo de interpolação quadrática inversa (ou
+    da secante) e só recorre à bisseção quando esse passo não reduz o
+    intervalo o suficiente, o que costuma exigir bem menos avaliações.
+
+    Args:
+        funcao (callable): expressão dada para a função f(x).
+        a (float): limite inferior do intervalo de busca.
+        b (float): limite superior do intervalo de busca.
+        tol (float): tolerância para a convergência do método.
+        max_iter (int): número máximo de iterações do método.
+    
+    Returns:
+        tuple (float, list): raiz encontrada e lista de iterações.
+    
+    Raises:
+        ValueError: Se f(a) e f(b) têm o mesmo sinal.
+        RuntimeError: Se o número máximo de iterações
+                      é atingido sem convergência.
+    """
+
+    funcao = contar_avaliacoes(funcao)
+    f_a = funcao(a)
+    f_b = funcao(b)
+
+    if f_a*f_b > 0:
+        raise ValueError(
+            "Erro: f(a) e f(b) têm o mesmo sinal."
+            "O método não pode garantir uma raiz no intervalo."
+            )
+    elif f_a == 0:
+        return a, [a]
+    elif f_b == 0:
+        return b, [b]
+
+    # b é a melhor estimativa, c o outro extremo do intervalo com a raiz
+    # e a a estimativa anterior; d é o último passo e e o penúltimo.
+    c, f_c = a, f_a
+    d = e = b - a
+    iter_para_plot = []
+
+    for iter in range(max_iter + 1):
+        if f_b*f_c > 0:
+            c, f_c = a, f_a
+            d = e = b - a
+        if abs(f_c) < abs(f_b):
+            a, b, c = b, c, b
+            f_a, f_b, f_c = f_b, f_c, f_b
+
+        tol_atual = 2*sys.float_info.epsilon*abs(b) + tol/2
+        meio = (c - b)/2
+        if abs(meio) <= tol_atual or f_b == 0:
+            registrar_iteracoes(iter)
+            return b, iter_para_plot
+        if iter == max_iter:
+            break
+
+        if abs(e) >= tol_atual and abs(f_a) > abs(f_b):
+            s = f_b/f_a
+            if a == c:
+                # Secante
+                p = 2*meio*s
+                q = 1 - s
+            else:
+                # Interpolação quadrática inversa
+                q = f_a/f_c
+                r = f_b/f_c
+                p = s*(2*meio*q*(q - r) - (b - a)*(r - 1))
+                q = (q - 1)*(r - 1)*(s - 1)
+            if p > 0:
+                q = -q
+            p = abs(p)
+            if 2*p < min(3*meio*q - abs(tol_atual*q), abs(e*q)):
+                e, d = d, p/q
+            else:
+                d = e = meio
+        else:
+            d = e = meio
+
+        a, f_a = b, f_b
+        b += d if abs(d) > tol_atual else (tol_atual if meio > 0 else -tol_atual)
+        f_b = funcao(b)
+        iter_para_plot.append(b)
+
+    registrar_iteracoes(max_iter)
     raise RuntimeError("Número máximo de iterações atingido sem convergência.")
+
+
+@instrumentado
+def raiz_lote(funcao, a, b=None, f_prime=None, tol=1e-6, max_iter=1000, method="secante", args=(),
+              avaliacao="auto"):
+    """
+    Resolve muitas equações f(x, *args) = 0 de uma vez, uma para cada elemento
+    dos arrays de parâmetros iniciais.
+
+    Todos os problemas avançam juntos: a cada iteração a função é chamada uma
+    única vez, com o array dos problemas ainda ativos (e os respectivos
+    elementos de args). Problemas que convergem (ou falham) são congelados.
+
+    Args:
+        funcao (callable): expressão dada para a função, chamada como funcao(x, *args).
+        a (array_like): parâmetros iniciais (dependem do método escolhido).
+        b (array_like): parâmetros iniciais (dependem do método escolhido).
+        f_prime (callable): derivada da função, chamada como f_prime(x, *args).
+        tol (float): tolerância para a convergência do método.
+        max_iter (int): número máximo de iterações do método.
+        method (str): "bissecao", "secante" ou "newton_raphson".
+        args (tuple): parâmetros extras da função, arrays compatíveis com a e b.
+        avaliacao (str): estratégia de avaliação da função ('auto', 'vetorizado'
+            ou 'escalar'). Padrão é 'auto'.
+
+    Returns:
+        tuple (np.ndarray, np.ndarray, np.ndarray): raízes encontradas,
+        número de iterações e indicador de convergência de cada problema.
+
+    Raises:
+        ValueError: Se o método não for reconhecido.
+    """
+
+    if method == "bissecao":
+        return bissecao_lote(funcao, a, b, tol, max_iter, args, avaliacao)
+    elif method == "secante":
+        return secante_lote(funcao, a, b, tol, max_iter, args, avaliacao)
+    elif method == "newton_raphson":
+        return newton_lote(funcao, a, f_prime, tol, max_iter, args, avaliacao)
+    else:
+        raise ValueError("Método não reconhecido")
+
+
+@instrumentado
+def bissecao_lote(funcao, a, b, tol=1e-6, max_iter=1000, args=(), avaliacao="auto"):
+    """
+    Aplica o método da bisseção a muitos intervalos [a_i, b_i] de uma vez.
+
+    Intervalos em que f(a_i) e f(b_i) têm o mesmo sinal não são refinados:
+    a raiz correspondente é NaN e o indicador de convergência é False.
+
+    Args:
+        funcao (callable): expressão dada para a função, chamada como funcao(x, *args).
+        a (array_like): limites inferiores dos intervalos de busca.
+        b (array_like): limites superiores dos intervalos de busca.
+        tol (float): tolerância para a convergência do método.
+        max_iter (int): número máximo de iterações do método.
+        args (tuple): parâmetros extras da função, arrays compatíveis com a e b.
+        avaliacao (str): estratégia de avaliação da função. Padrão é 'auto'.
+
+    Returns:
+        tuple (np.ndarray, np.ndarray, np.ndarray): raízes encontradas,
+        número de iterações e indicador de convergência de cada problema.
+    """
+
+    validar_avaliacao(avaliacao)
+    funcao = contar_avaliacoes(funcao)
+    formato, (a, b, *args) = _preparar_lote(a, b, *args)
+    f_a = _avaliar_lote(funcao, a, args, None, avaliacao)
+    f_b = _avaliar_lote(funcao, b, args, None, avaliacao)
+
+    iteracoes = np.zeros(a.shape, dtype=int)
+    valido = f_a * f_b <= 0
+    exato = valido & ((f_a == 0) | (f_b == 0))
+    raizes = np.where(f_a == 0, a, b)
+    raizes[~valido] = np.nan
+    convergiu = exato.copy()
+    ativos = np.flatnonzero(valido & ~exato & ((b - a) / 2 > tol))
+
+    iter = 0
+    while ativos.size > 0 and iter < max_iter:
+        m = (a[ativos] + b[ativos]) / 2
+        f_m = _avaliar_lote(funcao, m, args, ativos, avaliacao)
+        iteracoes[ativos] += 1
+        iter += 1
+
+        esquerda = f_a[ativos] * f_m < 0
+        direita = ~esquerda
+        b[ativos[esquerda]] = m[esquerda]
+        a[ativos[direita]] = m[direita]
+        f_a[ativos[direita]] = f_m[direita]
+
+        zero = f_m == 0
+        raizes[ativos[zero]] = m[zero]
+        convergiu[ativos[zero]] = True
+        ativos = ativos[~zero & ((b[ativos] - a[ativos]) / 2 > tol)]
+
+    registrar_iteracoes(iter)
+    restantes = valido & ~convergiu
+    raizes[restantes] = (a[restantes] + b[restantes]) / 2
+    convergiu[restantes] = (b[restantes] - a[restantes]) / 2 <= tol
+    return raizes.reshape(formato), iteracoes.reshape(formato), convergiu.reshape(formato)
+
+
+@instrumentado
+def secante_lote(funcao, a, b, tol=1e-6, max_iter=1000, args=(), avaliacao="auto"):
+    """
+    Aplica o método da secante a muitos pares de estimativas (a_i, b_i) de uma vez.
+
+    Problemas em que f(a_i) = f(b_i) em alguma iteração (divisão por zero)
+    são congelados com o indicador de convergência False.
+
+    Args:
+        funcao (callable): expressão dada para a função, chamada como funcao(x, *args).
+        a (array_like): aproximações iniciais para as raízes.
+        b (array_like): aproximações iniciais para as raízes.
+        tol (float): tolerância para a convergência do método.
+        max_iter (int): número máximo de iterações do método.
+        args (tuple): parâmetros extras da função, arrays compatíveis com a e b.
+        avaliacao (str): estratégia de avaliação da função. Padrão é 'auto'.
+
+    Returns:
+        tuple (np.ndarray, np.ndarray, np.ndarray): raízes encontradas,
+        número de iterações e indicador de convergência de cada problema.
+    """
+
+    validar_avaliacao(avaliacao)
+    funcao = contar_avaliacoes(funcao)
+    formato, (a, b, *args) = _preparar_lote(a, b, *args)
+    f_a = _avaliar_lote(funcao, a, args, None, avaliacao)
+    f_b = _avaliar_lote(funcao, b, args, None, avaliacao)
+
+    raizes = b.copy()
+    iteracoes = np.zeros(a.shape, dtype=int)
+    convergiu = np.zeros(a.shape, dtype=bool)
+    ativos = np.arange(a.size)
+
+    iter = 0
+    while ativos.size > 0 and iter < max_iter:
+        diferenca = f_b[ativos] - f_a[ativos]
+        ativos = ativos[diferenca != 0]
+        if ativos.size == 0:
+            break
+        c = b[ativos] - f_b[ativos] * ((b[ativos] - a[ativos]) / (f_b[ativos] - f_a[ativos]))
+        f_c = _avaliar_lote(funcao, c, args, ativos, avaliacao)
+        iteracoes[ativos] += 1
+        raizes[ativos] = c
+        iter += 1
+
+        pronto = (np.abs(c - b[ativos]) < tol) | (np.abs(f_c) < tol)
+        convergiu[ativos[pronto]] = True
+        a[ativos], f_a[ativos] = b[ativos], f_b[ativos]
+        b[ativos], f_b[ativos] = c, f_c
+        ativos = ativos[~pronto]
+
+    registrar_iteracoes(iter)
+    return raizes.reshape(formato), iteracoes.reshape(formato), convergiu.reshape(formato)
+
+
+@instrumentado
+def newton_lote(funcao, a, f_prime=None, tol=1e-6, max_iter=1000, args=(), avaliacao="auto"):
+    """
+    Aplica o método de Newton-Raphson a muitas estimativas iniciais a_i de uma vez.
+
+    Se f_prime não for dada, valores e derivadas são calculados juntos,
+    como em newton: com números duais (uma chamada vetorizada da função por
+    iteração), passo complexo ou, se a função não aceitar nenhum dos dois,
+    diferenças centrais. Problemas em que a derivada se anula são
+    congelados com o indicador de convergência False.
+
+    Args:
+        funcao (callable): expressão dada para a função, chamada como funcao(x, *args).
+        a (array_like): aproximações iniciais para as raízes.
+        f_prime (callable): derivada da função, chamada como f_prime(x, *args).
+        tol (float): tolerância para a convergência do método.
+        max_iter (int): número máximo de iterações do método.
+        args (tuple): parâmetros extras da função, arrays compatíveis com a.
+        avaliacao (str): estratégia de avaliação da função. Padrão é 'auto'.
+
+    Returns:
+        tuple (np.ndarray, np.ndarray, np.ndarray): raízes encontradas,
+        número de iterações e indicador de convergência de cada problema.
+    """
+
+    validar_avaliacao(avaliacao)
+    funcao = contar_avaliacoes(funcao)
+    f_prime = contar_avaliacoes(f_prime, chave="avaliacoes_derivada")
+    formato, (x, *args) = _preparar_lote(a, *args)
+
+    raizes = x.copy()
+    iteracoes = np.zeros(x.shape, dtype=int)
+    convergiu = np.zeros(x.shape, dtype=bool)
+    passo_pequeno = np.zeros(x.shape, dtype=bool)
+    ativos = np.arange(x.size)
+
+    if f_prime is None:
+        avaliar = lambda g, pontos, *a: avaliar_funcao(g, pontos, avaliacao, a)
+        valor_derivada = valor_e_derivada(funcao, avaliar)
+        if avaliacao == "escalar":
+            # Sem chamadas vetorizadas, apenas as diferenças centrais ponto a ponto.
+            valor_derivada = lambda pontos, *a: derivada_central(funcao, pontos, *a, avaliar=avaliar)
+
+    iter = 0
+    while ativos.size > 0:
+        x_ativos = x[ativos]
+        if f_prime is None:
+            f_x, derivada = valor_derivada(x_ativos, *(arg[ativos] for arg in args))
+        else:
+            f_x = _avaliar_lote(funcao, x_ativos, args, ativos, avaliacao)
+
+        # Critério do método escalar: passo e |f| pequenos no novo ponto.
+        pronto = passo_pequeno[ativos] & (np.abs(f_x) < tol)
+        convergiu[ativos[pronto]] = True
+        ativos, x_ativos, f_x = ativos[~pronto], x_ativos[~pronto], f_x[~pronto]
+        if ativos.size == 0 or iter >= max_iter:
+            break
+
+        if f_prime is None:
+            derivada = derivada[~pronto]
+        else:
+            derivada = _avaliar_lote(f_prime, x_ativos, args, ativos, avaliacao)
+        nao_nula = derivada != 0
+        ativos, x_ativos = ativos[nao_nula], x_ativos[nao_nula]
+        f_x, derivada = f_x[nao_nula], derivada[nao_nula]
+
+        c = x_ativos - f_x / derivada
+        passo_pequeno[ativos] = np.abs(c - x_ativos) < tol
+        x[ativos] = c
+        raizes[ativos] = c
+        iteracoes[ativos] += 1
+        iter += 1
+
+    registrar_iteracoes(iter)
+    return raizes.reshape(formato), iteracoes.reshape(formato), convergiu.reshape(formato)
+
+
+@instrumentado
+def todas_raizes(funcao, a, b, n=1000, tol=1e-10, max_iter=200, tol_funcao=1e-8, avaliacao="auto",
+                 executor=None, workers=None):
+    """
+    Encontra todas as raízes de uma equação f(x)=0 no intervalo [a, b].
+
+    A função é amostrada em n + 1 pontos com uma única chamada vetorizada.
+    Cada mudança de sinal entre amostras vizinhas define um intervalo com
+    uma raiz, e todos esses intervalos são refinados juntos pela bisseção
+    em lote. Mínimos locais de |f| sem mudança de sinal (raízes de
+    multiplicidade par, como em x^2) são refinados em lote pela busca da
+    seção áurea e aceitos quando |f| fica abaixo de tol_funcao. Mudanças de
+    sinal causadas por polos (onde |f| cresce no refinamento) são descartadas.
+
+    Raízes mais próximas que n amostras conseguem separar podem não ser
+    detectadas; nesse caso, aumente n.
+
+    Args:
+        funcao (callable): expressão dada para a função f(x).
+        a (float): limite inferior do intervalo de busca.
+        b (float): limite superior do intervalo de busca.
+        n (int): número de subintervalos da amostragem inicial. Padrão é 1000.
+        tol (float): tolerância para a convergência do refinamento.
+        max_iter (int): número máximo de iterações do refinamento.
+        tol_funcao (float): valor máximo de |f| para aceitar um mínimo local como raiz.
+        avaliacao (str): estratégia de avaliação da função ('auto', 'vetorizado'
+            ou 'escalar'). Padrão é 'auto'.
+        executor (concurrent.futures.Executor): executor usado para refinar os
+            intervalos em paralelo, divididos em partes. Opcional.
+        workers (int): número de processos de um ProcessPoolExecutor criado
+            para o refinamento, caso nenhum executor seja informado. Opcional.
+
+    Returns:
+        np.ndarray: raízes encontradas, em ordem crescente e sem repetições.
+
+    Raises:
+        ValueError: Se n não for um inteiro positivo ou a >= b.
+    """
+
+    validar_avaliacao(avaliacao)
+    if not isinstance(n, int) or n < 1:
+        raise ValueError("Erro: n deve ser um inteiro positivo.")
+    if not a < b:
+        raise ValueError("Erro: o intervalo deve satisfazer a < b.")
+
+    funcao_contada = contar_avaliacoes(funcao)
+    x = np.linspace(a, b, n + 1)
+    with np.errstate(all="ignore"):
+        y = avaliar_funcao(funcao_contada, x, avaliacao)
+    raizes = [x[y == 0]]
+
+    # Mudanças de sinal entre amostras vizinhas.
+    troca = np.flatnonzero(y[:-1]*y[1:] < 0)
+    if troca.size > 0:
+        with np.errstate(all="ignore"):
+            encontradas, _, convergiu = _refinar_intervalos(funcao, x[troca], x[troca + 1], tol,
+                                                            max_iter, avaliacao, executor, workers)
+            f_raiz = np.abs(avaliar_funcao(funcao_contada, encontradas, avaliacao))
+        limite = np.maximum(np.abs(y[troca]), np.abs(y[troca + 1]))
+        raizes.append(encontradas[convergiu & (f_raiz <= limite)])
+
+    # Mínimos locais de |f| longe de mudanças de sinal.
+    modulo = np.abs(y)
+    i = np.arange(1, n)
+    minimo = ((modulo[i] < modulo[i - 1]) & (modulo[i] <= modulo[i + 1])
+              & (y[i - 1]*y[i] > 0) & (y[i]*y[i + 1] > 0))
+    candidatos = i[minimo]
+    if candidatos.size > 0:
+        x_min, f_min = _minimos_lote(funcao_contada, x[candidatos - 1], x[candidatos + 1],
+                                     tol, max_iter, avaliacao)
+        raizes.append(x_min[f_min <= tol_funcao])
+
+    raizes = np.sort(np.concatenate(raizes))
+    if raizes.size > 1:
+        raizes = raizes[np.concatenate([[True], np.diff(raizes) > 2*tol])]
+    return raizes
+
+
+@instrumentado
+def raizes_polinomio(polinomio, polir=True, tol=1e-14, max_iter=50, reais=False, tol_real=1e-10):
+    """
+    Encontra todas as raízes (reais e complexas) de um polinômio.
+
+    O polinômio pode ser dado pelos coeficientes na base de monômios, do
+    maior para o menor grau (como retornado por AproximacaoPolinomial), ou
+    diretamente por um InterpoladorPolinomial ou InterpoladorHermite. Os
+    interpoladores são usados na própria forma de Newton, sem conversão
+    para monômios: as raízes são os autovalores da matriz companheira da
+    base de Newton, que é bidiagonal com os nós na diagonal e os
+    coeficientes normalizados na última linha (com todos os nós nulos, é a
+    matriz companheira usual dos monômios).
+
+    Todas as raízes saem de um único cálculo de autovalores, em O(n^3),
+    sem chutes iniciais. Com polir=True, elas são refinadas juntas por
+    iterações de Newton vetorizadas (aritmética complexa), aceitando um
+    passo apenas quando ele reduz |p(z)|.
+
+    Args:
+        polinomio (list, tuple, np.ndarray, InterpoladorPolinomial ou InterpoladorHermite):
+            coeficientes do maior para o menor grau ou interpolador.
+        polir (bool): se True, refina as raízes pelo método de Newton. Padrão é True.
+        tol (float): tolerância relativa do passo de Newton no refinamento.
+        max_iter (int): número máximo de iterações do refinamento.
+        reais (bool): se True, retorna apenas as raízes reais. Padrão é False.
+        tol_real (float): valor máximo de |Im(z)|/max(1, |z|) para considerar uma raiz real.
+
+    Returns:
+        np.ndarray: raízes complexas, ordenadas pela parte real e depois pela
+            imaginária, ou, com reais=True, raízes reais em ordem crescente.
+
+    Raises:
+        ValueError: Se os coeficientes forem inválidos ou o polinômio for nulo.
+    """
+
+    coef, nos = _forma_newton(polinomio)
+
+    # Coeficientes líderes nulos não alteram o polinômio.
+    nao_nulos = np.flatnonzero(coef)
+    if nao_nulos.size == 0:
+        raise ValueError("Erro: o polinômio nulo não possui raízes isoladas.")
+    grau = nao_nulos[-1]
+    coef, nos = coef[:grau + 1], nos[:grau]
+
+    if grau == 0:
+        raizes = np.empty(0, dtype=complex)
+    else:
+        matriz = np.diag(nos.astype(complex)) + np.diag(np.ones(grau - 1), 1)
+        matriz[-1] -= coef[:-1] / coef[-1]
+        raizes = np.linalg.eigvals(matriz).astype(complex)
+        if polir:
+            raizes = _polir_raizes(coef, nos, raizes, tol, max_iter)
+
+    if reais:
+        real = np.abs(raizes.imag) <= tol_real * np.maximum(1.0, np.abs(raizes))
+        return np.sort(raizes.real[real])
+    return np.sort_complex(raizes)
+
+
+def _refinar_intervalos(funcao, a, b, tol, max_iter, avaliacao, executor, workers):
+    """
+    Refina os intervalos com bissecao_lote, no processo atual ou em partes
+    distribuídas pelo executor.
+    """
+
+    if executor is None and workers is None:
+        return bissecao_lote(funcao, a, b, tol, max_iter, avaliacao=avaliacao)
+
+    from concurrent.futures import ProcessPoolExecutor
+    from itertools import repeat
+
+    partes = np.array_split(np.arange(a.size), min(a.size, 4*(workers or 1)))
+    argumentos = (repeat(funcao), (a[p] for p in partes), (b[p] for p in partes),
+                  repeat(tol), repeat(max_iter), repeat(()), repeat(avaliacao))
+    if executor is None:
+        with ProcessPoolExecutor(max_workers=workers) as novo_executor:
+            resultados = list(novo_executor.map(bissecao_lote, *argumentos))
+    else:
+        resultados = list(executor.map(bissecao_lote, *argumentos))
+    return tuple(np.concatenate(parte) for parte in zip(*resultados))
+
+
+def _minimos_lote(funcao, a, b, tol, max_iter, avaliacao):
+    """
+    Busca da seção áurea, em lote, do mínimo de |f| em cada intervalo [a_i, b_i].
+
+    Returns:
+        tuple (np.ndarray, np.ndarray): pontos de mínimo e valores de |f| neles.
+    """
+
+    razao = (np.sqrt(5) - 1)/2
+    a, b = a.copy(), b.copy()
+    x1 = b - razao*(b - a)
+    x2 = a + razao*(b - a)
+    with np.errstate(all="ignore"):
+        f1 = np.abs(avaliar_funcao(funcao, x1, avaliacao))
+        f2 = np.abs(avaliar_funcao(funcao, x2, avaliacao))
+    ativos = np.flatnonzero(b - a > tol)
+
+    iter = 0
+    while ativos.size > 0 and iter < max_iter:
+        esquerda = f1[ativos] < f2[ativos]
+        e, d = ativos[esquerda], ativos[~esquerda]
+        # Mínimo em [a, x2]: x2 <- x1 e novo x1; mínimo em [x1, b]: x1 <- x2 e novo x2.
+        b[e], x2[e], f2[e] = x2[e], x1[e], f1[e]
+        x1[e] = b[e] - razao*(b[e] - a[e])
+        a[d], x1[d], f1[d] = x1[d], x2[d], f2[d]
+        x2[d] = a[d] + razao*(b[d] - a[d])
+
+        novos = np.where(esquerda, x1[ativos], x2[ativos])
+        with np.errstate(all="ignore"):
+            valores = np.abs(avaliar_funcao(funcao, novos, avaliacao))
+        f1[e] = valores[esquerda]
+        f2[d] = valores[~esquerda]
+        ativos = ativos[b[ativos] - a[ativos] > tol]
+        iter += 1
+
+    melhor = f1 <= f2
+    return np.where(melhor, x1, x2), np.where(melhor, f1, f2)
+
+
+def _preparar_lote(*valores):
+    """
+    Converte os valores em arrays float unidimensionais de mesmo tamanho (broadcasting).
+
+    Returns:
+        tuple: formato comum dos valores e lista com os arrays achatados.
+
+    Raises:
+        ValueError: Se os formatos não forem compatíveis.
+    """
+
+    try:
+        arrays = np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in valores))
+    except ValueError:
+        raise ValueError("Erro: os parâmetros devem possuir formatos compatíveis.")
+    return arrays[0].shape, [np.array(arr, dtype=float).reshape(-1) for arr in arrays]
+
+
+def _avaliar_lote(funcao, x, args, indices, avaliacao):
+    """
+    Avalia a função nos pontos x, com os elementos de args dos problemas em `indices`
+    (ou todos os elementos, se `indices` for None).
+    """
+
+    if indices is not None:
+        args = tuple(arg[indices] for arg in args)
+    return avaliar_funcao(funcao, x, avaliacao, tuple(args))
+
+
+def _forma_newton(polinomio):
+    """
+    Obtém os coeficientes (do menor para o maior índice) e os nós da forma de Newton
+    p(x) = c_0 + c_1 (x - x_0) + ... + c_n (x - x_0)...(x - x_{n-1}).
+
+    Coeficientes na base de monômios correspondem a todos os nós nulos.
+
+    Raises:
+        ValueError: Se os coeficientes não formarem uma lista numérica finita e não vazia.
+    """
+
+    from cb2325numericag8.interpolacao.interpolador_hermite import InterpoladorHermite
+    from cb2325numericag8.interpolacao.interpolador_polinomial import InterpoladorPolinomial
+
+    if isinstance(polinomio, InterpoladorPolinomial):
+        if polinomio._coef_iterativo_cache is None:
+            polinomio._calcular_coef_iterativo()
+        coef = np.array(polinomio._coef_iterativo_cache, dtype=float)
+        return coef, np.array(polinomio.valores_x[:-1], dtype=float)
+
+    if isinstance(polinomio, InterpoladorHermite):
+        if polinomio._coef is None:
+            polinomio._calc_coefficients()
+        return np.array(polinomio._coef, dtype=float), np.array(polinomio._z_nodes[:-1], dtype=float)
+
+    try:
+        coef = np.asarray(polinomio)
+    except Exception:
+        coef = np.empty(0)
+    if (coef.ndim != 1 or coef.size == 0 or coef.dtype.kind not in "biufc"
+            or not np.all(np.isfinite(coef))):
+        raise ValueError(
+            "Erro: o polinômio deve ser uma lista não vazia de coeficientes finitos "
+            "ou um interpolador."
+        )
+    coef = coef[::-1].astype(complex if coef.dtype.kind == "c" else float)
+    return coef, np.zeros(coef.size - 1)
+
+
+def _polir_raizes(coef, nos, raizes, tol, max_iter):
+    """
+    Refina todas as raízes juntas pelo método de Newton, avaliando p e p' na
+    forma de Newton pelo esquema de Horner.
+    """
+
+    def avaliar(z):
+        p = np.full(z.shape, coef[-1], dtype=complex)
+        dp = np.zeros(z.shape, dtype=complex)
+        for k in range(len(nos) - 1, -1, -1):
+            dp = dp*(z - nos[k]) + p
+            p = p*(z - nos[k]) + coef[k]
+        return p, dp
+
+    p, dp = avaliar(raizes)
+    ativos = np.flatnonzero((p != 0) & (dp != 0))
+    iter = 0
+    while ativos.size > 0 and iter < max_iter:
+        z = raizes[ativos]
+        passo = p[ativos] / dp[ativos]
+        novo = z - passo
+        p_novo, dp_novo = avaliar(novo)
+
+        melhora = np.abs(p_novo) < np.abs(p[ativos])
+        indices = ativos[melhora]
+        raizes[indices] = novo[melhora]
+        p[indices], dp[indices] = p_novo[melhora], dp_novo[melhora]
+
+        continua = (melhora & (np.abs(passo) > tol * np.maximum(1.0, np.abs(z)))
+                    & (p_novo != 0) & (dp_novo != 0))
+        ativos = ativos[continua]
+        iter += 1
+
+    registrar_iteracoes(iter)
+    return raizes
@@ -0,0 +1,155 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+
+import numpy as np
+
+MODOS_AVALIACAO = ("auto", "vetorizado", "escalar")
+
+
+def avaliar_funcao(funcao, pontos, avaliacao="auto", args=()):
+    """
+    Avalia uma função em um array de pontos.
+
+    Modos de avaliação:
+        'vetorizado': chama funcao(pontos) uma única vez com o array inteiro;
+        'escalar': chama funcao(x) para cada ponto, um por vez;
+        'auto': tenta a chamada vetorizada e confere se o resultado tem o
+            mesmo formato dos pontos e tipo numérico; caso contrário (ou se a
+            chamada falhar), volta para a avaliação ponto a ponto.
+
+    Argumentos extras em `args` são repassados como funcao(pontos, *args) na
+    chamada vetorizada; na avaliação ponto a ponto, cada um é expandido para o
+    formato dos pontos e o valor correspondente a cada ponto é repassado.
+
+    Args:
+        funcao (callable): Função a ser avaliada.
+        pontos (np.ndarray): Pontos de avaliação.
+        avaliacao (str, optional): Modo de avaliação. Padrão é 'auto'.
+        args (tuple, optional): Argumentos extras da função, compatíveis
+            (por broadcasting) com o formato dos pontos.
+
+    Raises:
+        ValueError: Se o modo de avaliação não for reconhecido.
+        ValueError: Se, no modo 'vetorizado', a função não aceitar arrays.
+        ValueError: Erros levantados pela própria função na avaliação ponto a
+            ponto, com o ponto em que ocorreram.
+
+    Returns:
+        np.ndarray: Valores da função (float64), com o formato de `pontos`.
+    """
+
+    validar_avaliacao(avaliacao)
+
+    if avaliacao != "escalar":
+        try:
+            valores = _avaliar_vetorizado(funcao, pontos, args)
+        except Exception as e:
+            if avaliacao == "vetorizado":
+                raise ValueError(
+                    f"Erro: a função não pôde ser avaliada de forma vetorizada: {e}"
+                )
+        else:
+            return valores
+
+    valores = np.empty(pontos.shape)
+    args = [np.broadcast_to(arg, pontos.shape) for arg in args]
+    try:
+        if args:
+            for i, x in enumerate(pontos.flat):
+                valores.flat[i] = funcao(x, *(arg.flat[i] for arg in args))
+        else:
+            for i, x in enumerate(pontos.flat):
+                valores.flat[i] = funcao(x)
+    except Exception as e:
+        raise ValueError(f"{e} (em x = {x})") from e
+    return valores
+
+
+def avaliar_funcao_paralela(funcao, pontos, avaliacao="auto", executor=None, workers=None,
+                            tamanho_parte=None):
+    """
+    Avalia uma função em um array de pontos distribuindo o trabalho entre processos.
+
+    Os pontos são divididos em partes contíguas, avaliadas com avaliar_funcao
+    em um ProcessPoolExecutor (ou no executor fornecido), e os valores são
+    reunidos na ordem original dos pontos. Como cada ponto é avaliado
+    isoladamente, o resultado é o mesmo da avaliação sequencial para
+    qualquer número de processos ou tamanho de parte.
+
+    Com processos, a função precisa poder ser serializada (pickle): funções
+    definidas no nível de um módulo servem, funções lambda não.
+
+    Args:
+        funcao (callable): Função a ser avaliada.
+        pontos (np.ndarray): Pontos de avaliação.
+        avaliacao (str, optional): Modo de avaliação de cada parte. Padrão é 'auto'.
+        executor (concurrent.futures.Executor, optional): Executor a usar. Se
+            None, um ProcessPoolExecutor é criado e encerrado nesta chamada.
+        workers (int, optional): Número de processos do executor criado. Se
+            None, usa o número de CPUs.
+        tamanho_parte (int, optional): Número de pontos por tarefa. Se None,
+            os pontos são divididos em cerca de quatro partes por processo.
+
+    Raises:
+        ValueError: Se o modo de avaliação não for reconhecido.
+        ValueError: Se `workers` ou `tamanho_parte` não forem inteiros positivos.
+
+    Returns:
+        np.ndarray: Valores da função (float64), com o formato de `pontos`.
+    """
+
+    validar_avaliacao(avaliacao)
+    if workers is not None and (not isinstance(workers, int) or workers < 1):
+        raise ValueError("Erro: workers deve ser um inteiro positivo.")
+    if tamanho_parte is not None and (not isinstance(tamanho_parte, int) or tamanho_parte < 1):
+        raise ValueError("Erro: tamanho_parte deve ser um inteiro positivo.")
+
+    plano = pontos.reshape(-1)
+    if tamanho_parte is None:
+        partes = 4 * (workers or os.cpu_count() or 1)
+        tamanho_parte = max(1, -(-plano.size // partes))
+    tarefas = [plano[i:i + tamanho_parte] for i in range(0, plano.size, tamanho_parte)]
+
+    if executor is None:
+        with ProcessPoolExecutor(max_workers=workers) as novo_executor:
+            resultados = list(novo_executor.map(avaliar_funcao, repeat(funcao), tarefas,
+                                                repeat(avaliacao)))
+    else:
+        resultados = list(executor.map(avaliar_funcao, repeat(funcao), tarefas, repeat(avaliacao)))
+
+    if not resultados:
+        return np.empty(pontos.shape)
+    return np.concatenate(resultados).reshape(pontos.shape)
+
+
+def validar_avaliacao(avaliacao):
+    """
+    Verifica se o modo de avaliação está entre os reconhecidos.
+
+    Raises:
+        ValueError: Se o modo de avaliação não for reconhecido.
+    """
+
+    if avaliacao not in MODOS_AVALIACAO:
+        raise ValueError(
+            f"Erro: o modo de avaliação é inválido. "
+            f"Os modos válidos são {', '.join(MODOS_AVALIACAO)}"
+        )
+
+
+def _avaliar_vetorizado(funcao, pontos, args=()):
+    """
+    Chama a função uma vez com o array de pontos e valida o resultado.
+
+    Raises:
+        TypeError: Se o resultado não tiver o formato dos pontos ou não for numérico.
+    """
+
+    valores = np.asarray(funcao(pontos, *args))
+    if valores.shape != pontos.shape or valores.dtype.kind not in "biuf":
+        raise TypeError(
+            f"resultado de formato {valores.shape} e tipo {valores.dtype} "
+            f"para pontos de formato {pontos.shape}"
+        )
+    return valores.astype(float, copy=False)
@@ -0,0 +1,112 @@
+import numpy as np
+
+# Tamanho padrão (em elementos) dos blocos processados de cada vez.
+TAMANHO_BLOCO = 2 ** 16
+
+
+def iterar_blocos(fonte, tamanho_bloco=TAMANHO_BLOCO):
+    """
+    Percorre uma fonte de dados em blocos de floats de tamanho fixo.
+
+    A fonte pode ser um array (inclusive np.memmap, lido sob demanda),
+    um iterável de números (lista, gerador) ou um iterável de blocos de
+    tamanhos quaisquer (arrays ou listas). Todos os blocos produzidos têm
+    `tamanho_bloco` elementos, exceto possivelmente o último, de modo que
+    duas fontes com os mesmos dados geram blocos alinhados. A memória usada
+    não depende do tamanho total da fonte.
+
+    Args:
+        fonte (array_like or iterable): Dados a percorrer.
+        tamanho_bloco (int, optional): Número de elementos por bloco.
+
+    Raises:
+        ValueError: Se `tamanho_bloco` não for um inteiro positivo.
+        ValueError, TypeError: Se algum valor não puder ser convertido em float
+            (inclusive None, ver `para_floats`).
+
+    Yields:
+        np.ndarray: Blocos unidimensionais float64.
+    """
+
+    if not isinstance(tamanho_bloco, int) or tamanho_bloco < 1:
+        raise ValueError("Erro: tamanho_bloco deve ser um inteiro positivo.")
+
+    if isinstance(fonte, np.ndarray):
+        plano = fonte.reshape(-1)
+        for inicio in range(0, plano.size, tamanho_bloco):
+            yield para_floats(plano[inicio:inicio + tamanho_bloco])
+        return
+
+    partes = []
+    escalares = []
+    quantidade = 0
+
+    for item in fonte:
+        if np.ndim(item) == 0:
+            escalares.append(item)
+            quantidade += 1
+        else:
+            if escalares:
+                _mover_escalares(escalares, partes)
+            parte = para_floats(item).ravel()
+            partes.append(parte)
+            quantidade += parte.size
+
+        if quantidade >= tamanho_bloco:
+            if escalares:
+                _mover_escalares(escalares, partes)
+            while quantidade >= tamanho_bloco:
+                quantidade -= tamanho_bloco
+                yield _retirar(partes, tamanho_bloco)
+
+    if escalares:
+        _mover_escalares(escalares, partes)
+    if quantidade > 0:
+        yield _retirar(partes, quantidade)
+
+
+def para_floats(valores):
+    """
+    Converte valores em um array float64 sem transformar None em NaN.
+
+    Arrays numéricos são convertidos de uma vez. Arrays de objetos ou de
+    strings (Fraction, Decimal, '1.5', ...) têm cada elemento convertido com
+    float(), que rejeita None e valores não numéricos.
+
+    Args:
+        valores (array_like): Valores a converter.
+
+    Raises:
+        ValueError, TypeError: Se algum valor não puder ser convertido em float.
+
+    Returns:
+        np.ndarray: Array float64 com o formato dos valores.
+    """
+
+    array = np.asarray(valores)
+    if array.dtype.kind in "biuf":
+        return array.astype(float, copy=False)
+    if array.dtype.kind not in "OUS":
+        raise TypeError(f"valores do tipo {array.dtype} não são numéricos")
+    return np.array([float(v) for v in array.ravel()], dtype=float).reshape(array.shape)
+
+
+def _mover_escalares(escalares, partes):
+    """
+    Converte os escalares acumulados em um array e os move para `partes`.
+    """
+
+    partes.append(para_floats(escalares))
+    escalares.clear()
+
+
+def _retirar(partes, quantidade):
+    """
+    Retira os primeiros `quantidade` elementos da lista de partes.
+    """
+
+    if len(partes) > 1:
+        partes[:] = [np.concatenate(partes)]
+    bloco = partes[0][:quantidade]
+    partes[0] = partes[0][quantidade:]
+    return bloco
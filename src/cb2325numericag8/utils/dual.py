@@ -0,0 +1,398 @@
+import numpy as np
+
+# Passo da derivada por passo complexo: não há cancelamento, então pode ser
+# muito menor que a precisão da máquina.
+_PASSO_COMPLEXO = 1e-20
+
+# Passo relativo ótimo das diferenças centrais (raiz cúbica da precisão da máquina).
+_PASSO_CENTRAL = float(np.finfo(float).eps) ** (1 / 3)
+
+
+class Dual:
+    """
+    Número dual a + b·ε, com ε² = 0, para diferenciação automática progressiva.
+
+    Avaliar uma função em Dual(x, 1) propaga, junto com o valor f(x), a
+    derivada exata f'(x). As operações aritméticas do Python e as ufuncs do
+    NumPy (np.sin, np.exp, np.sqrt, ...) são suportadas, com valor e
+    derivada escalares ou arrays. Funções do módulo math, que precisam
+    converter o argumento para float, levantam TypeError.
+
+    Atributos:
+        valor (float ou np.ndarray): parte real a.
+        derivada (float ou np.ndarray): parte dual b.
+    """
+
+    __slots__ = ("valor", "derivada")
+
+    def __init__(self, valor, derivada=0.0):
+        self.valor = valor
+        self.derivada = derivada
+
+    @property
+    def size(self):
+        """
+        Número de elementos do valor (1 para escalares).
+        """
+        return int(np.size(self.valor))
+
+    def __repr__(self):
+        return f"Dual({self.valor!r}, {self.derivada!r})"
+
+    # --- Aritmética ---
+
+    def __add__(self, outro):
+        outro = _como_dual(outro)
+        if outro is NotImplemented:
+            return outro
+        return Dual(self.valor + outro.valor, self.derivada + outro.derivada)
+
+    __radd__ = __add__
+
+    def __sub__(self, outro):
+        outro = _como_dual(outro)
+        if outro is NotImplemented:
+            return outro
+        return Dual(self.valor - outro.valor, self.derivada - outro.derivada)
+
+    def __rsub__(self, outro):
+        outro = _como_dual(outro)
+        if outro is NotImplemented:
+            return outro
+        return outro - self
+
+    def __mul__(self, outro):
+        outro = _como_dual(outro)
+        if outro is NotImplemented:
+            return outro
+        return Dual(self.valor * outro.valor,
+                    self.derivada * outro.valor + self.valor * outro.derivada)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, outro):
+        outro = _como_dual(outro)
+        if outro is NotImplemented:
+            return outro
+        valor = self.valor / outro.valor
+        return Dual(valor, (self.derivada - valor * outro.derivada) / outro.valor)
+
+    def __rtruediv__(self, outro):
+        outro = _como_dual(outro)
+        if outro is NotImplemented:
+            return outro
+        return outro / self
+
+    def __pow__(self, expoente):
+        if isinstance(expoente, Dual) and not np.any(expoente.derivada):
+            expoente = expoente.valor
+        if isinstance(expoente, Dual):
+            valor = self.valor ** expoente.valor
+            return Dual(valor, valor * (expoente.derivada * np.log(self.valor)
+                                        + expoente.valor * self.derivada / self.valor))
+        if _como_dual(expoente) is NotImplemented:
+            return NotImplemented
+        # Expoente constante: evita o log da base, que pode ser negativa.
+        return Dual(self.valor ** expoente,
+                    expoente * self.valor ** (expoente - 1) * self.derivada)
+
+    def __rpow__(self, base):
+        base = _como_dual(base)
+        if base is NotImplemented:
+            return base
+        return base ** self
+
+    def __neg__(self):
+        return Dual(-self.valor, -self.derivada)
+
+    def __pos__(self):
+        return self
+
+    def __abs__(self):
+        return Dual(abs(self.valor), np.sign(self.valor) * self.derivada)
+
+    # --- Comparações (apenas pelo valor) ---
+
+    def __lt__(self, outro):
+        return self.valor < _valor(outro)
+
+    def __le__(self, outro):
+        return self.valor <= _valor(outro)
+
+    def __gt__(self, outro):
+        return self.valor > _valor(outro)
+
+    def __ge__(self, outro):
+        return self.valor >= _valor(outro)
+
+    def __eq__(self, outro):
+        return self.valor == _valor(outro)
+
+    def __ne__(self, outro):
+        return self.valor != _valor(outro)
+
+    __hash__ = None
+
+    def __bool__(self):
+        return bool(self.valor)
+
+    # --- Conversões proibidas ---
+
+    def __float__(self):
+        raise TypeError("Erro: um número dual não pode ser convertido para float.")
+
+    def __int__(self):
+        raise TypeError("Erro: um número dual não pode ser convertido para int.")
+
+    def __complex__(self):
+        raise TypeError("Erro: um número dual não pode ser convertido para complex.")
+
+    # --- NumPy ---
+
+    def __array_ufunc__(self, ufunc, method, *entradas, **kwargs):
+        if method != "__call__" or kwargs:
+            return NotImplemented
+
+        if ufunc in _COMPARACOES:
+            return ufunc(*(_valor(x) for x in entradas))
+
+        entradas = [_como_dual(x) for x in entradas]
+        if any(x is NotImplemented for x in entradas):
+            return NotImplemented
+
+        if ufunc in _DERIVADAS_UNARIAS:
+            (x,) = entradas
+            return Dual(ufunc(x.valor), _DERIVADAS_UNARIAS[ufunc](x.valor) * x.derivada)
+        if ufunc in _DERIVADAS_BINARIAS:
+            return _DERIVADAS_BINARIAS[ufunc](*entradas)
+        return NotImplemented
+
+
+def derivada_dual(funcao, x, *args):
+    """
+    Calcula f(x) e f'(x) exatos com uma única avaliação em números duais.
+
+    Args:
+        funcao (callable): Função chamada como funcao(x, *args).
+        x (float ou np.ndarray): Ponto(s) de avaliação.
+        *args: Parâmetros extras da função (constantes na derivação).
+
+    Raises:
+        TypeError: Se a função não puder ser avaliada com números duais.
+
+    Returns:
+        tuple: Valor e derivada da função em x.
+    """
+
+    resultado = funcao(Dual(x, np.ones_like(x, dtype=float)), *args)
+    if isinstance(resultado, Dual):
+        valor, derivada = resultado.valor, resultado.derivada
+    elif np.asarray(resultado).dtype.kind in "biuf":
+        # A função não depende de x.
+        valor, derivada = resultado, 0.0
+    else:
+        raise TypeError("Erro: a função não pôde ser avaliada com números duais.")
+    valor, derivada = np.broadcast_arrays(np.asarray(valor, dtype=float),
+                                          np.asarray(derivada, dtype=float), np.asarray(x))[:2]
+    return _formatar(valor, derivada, x)
+
+
+def derivada_passo_complexo(funcao, x, *args):
+    """
+    Calcula f(x) e f'(x) pelo passo complexo, f'(x) ≈ Im f(x + ih) / h.
+
+    Não há subtração de valores próximos, então o passo pode ser minúsculo e
+    a derivada sai com precisão próxima à da máquina, com uma avaliação.
+    Requer que a função seja analítica e aceite argumentos complexos.
+
+    Args:
+        funcao (callable): Função chamada como funcao(x, *args).
+        x (float ou np.ndarray): Ponto(s) de avaliação.
+        *args: Parâmetros extras da função.
+
+    Raises:
+        TypeError: Se a função não retornar valores complexos.
+
+    Returns:
+        tuple: Valor e derivada da função em x.
+    """
+
+    h = _PASSO_COMPLEXO * _escala(x)
+    resultado = np.asarray(funcao(x + 1j * h, *args))
+    if resultado.dtype.kind != "c":
+        raise TypeError("Erro: a função não retornou valores complexos.")
+    return _formatar(resultado.real, resultado.imag / h, x)
+
+
+def derivada_central(funcao, x, *args, avaliar=None):
+    """
+    Calcula f(x) e aproxima f'(x) por diferenças centrais, com três avaliações.
+
+    O passo é h = eps^(1/3)·max(1, |x|), que equilibra os erros de
+    truncamento e de arredondamento.
+
+    Args:
+        funcao (callable): Função chamada como funcao(x, *args).
+        x (float ou np.ndarray): Ponto(s) de avaliação.
+        *args: Parâmetros extras da função.
+        avaliar (callable, optional): Usado no lugar de funcao(x, *args) como
+            avaliar(funcao, x, *args), por exemplo para avaliar ponto a ponto.
+
+    Returns:
+        tuple: Valor e derivada aproximada da função em x.
+    """
+
+    if avaliar is None:
+        avaliar = lambda g, ponto, *a: g(ponto, *a)
+    h = _PASSO_CENTRAL * _escala(x)
+    valor = avaliar(funcao, x, *args)
+    derivada = (avaliar(funcao, x + h, *args) - avaliar(funcao, x - h, *args)) / (2 * h)
+    return _formatar(np.asarray(valor, dtype=float), np.asarray(derivada, dtype=float), x)
+
+
+def valor_e_derivada(funcao, avaliar=None):
+    """
+    Cria uma função que retorna f(x) e f'(x) sem a derivada explícita.
+
+    Tenta, nesta ordem, números duais (derivada exata, uma avaliação), passo
+    complexo (precisão da máquina, uma avaliação) e diferenças centrais
+    (três avaliações). A primeira estratégia que funcionar é usada nas
+    chamadas seguintes, sem repetir as tentativas que falharam.
+
+    Args:
+        funcao (callable): Função chamada como funcao(x, *args).
+        avaliar (callable, optional): Repassado a derivada_central.
+
+    Returns:
+        callable: Função g(x, *args) que retorna a tupla (f(x), f'(x)).
+    """
+
+    etapas = [derivada_dual, derivada_passo_complexo]
+    inicio = [0]
+
+    def calcular(x, *args):
+        while inicio[0] < len(etapas):
+            try:
+                return etapas[inicio[0]](funcao, x, *args)
+            except Exception:
+                inicio[0] += 1
+        return derivada_central(funcao, x, *args, avaliar=avaliar)
+
+    return calcular
+
+
+def _como_dual(x):
+    """
+    Converte constantes numéricas em duais com derivada nula.
+    """
+
+    if isinstance(x, Dual):
+        return x
+    if isinstance(x, (int, float, np.integer, np.floating)):
+        return Dual(x, 0.0)
+    if isinstance(x, np.ndarray) and x.dtype.kind in "biuf":
+        return Dual(x, np.zeros(x.shape))
+    return NotImplemented
+
+
+def _valor(x):
+    """
+    Parte real de um dual (ou o próprio valor, para constantes).
+    """
+
+    return x.valor if isinstance(x, Dual) else x
+
+
+def _escala(x):
+    """
+    max(1, |x|), como float para x escalar (a função recebe tipos do Python).
+    """
+
+    escala = np.maximum(1.0, np.abs(x))
+    return float(escala) if np.ndim(x) == 0 else escala
+
+
+def _formatar(valor, derivada, x):
+    """
+    Retorna floats para x e resultado escalares e arrays nos demais casos.
+    """
+
+    if np.ndim(x) == 0 and np.ndim(valor) == 0:
+        return float(valor), float(derivada)
+    return np.asarray(valor, dtype=float), np.asarray(derivada, dtype=float)
+
+
+def _maximo(x, y):
+    maior = x.valor >= y.valor
+    return Dual(np.where(maior, x.valor, y.valor), np.where(maior, x.derivada, y.derivada))
+
+
+def _minimo(x, y):
+    menor = x.valor <= y.valor
+    return Dual(np.where(menor, x.valor, y.valor), np.where(menor, x.derivada, y.derivada))
+
+
+def _hipotenusa(x, y):
+    valor = np.hypot(x.valor, y.valor)
+    return Dual(valor, (x.valor * x.derivada + y.valor * y.derivada) / valor)
+
+
+def _arco_tangente2(y, x):
+    return Dual(np.arctan2(y.valor, x.valor),
+                (x.valor * y.derivada - y.valor * x.derivada) / (x.valor**2 + y.valor**2))
+
+
+# Derivada de cada ufunc de um argumento em função do valor.
+_DERIVADAS_UNARIAS = {
+    np.negative: lambda v: -np.ones_like(v, dtype=float),
+    np.positive: lambda v: np.ones_like(v, dtype=float),
+    np.absolute: np.sign,
+    np.square: lambda v: 2 * v,
+    np.reciprocal: lambda v: -1 / v**2,
+    np.sqrt: lambda v: 0.5 / np.sqrt(v),
+    np.cbrt: lambda v: 1 / (3 * np.cbrt(v)**2),
+    np.exp: np.exp,
+    np.exp2: lambda v: np.exp2(v) * np.log(2),
+    np.expm1: np.exp,
+    np.log: lambda v: 1 / v,
+    np.log2: lambda v: 1 / (v * np.log(2)),
+    np.log10: lambda v: 1 / (v * np.log(10)),
+    np.log1p: lambda v: 1 / (1 + v),
+    np.sin: np.cos,
+    np.cos: lambda v: -np.sin(v),
+    np.tan: lambda v: 1 / np.cos(v)**2,
+    np.arcsin: lambda v: 1 / np.sqrt(1 - v**2),
+    np.arccos: lambda v: -1 / np.sqrt(1 - v**2),
+    np.arctan: lambda v: 1 / (1 + v**2),
+    np.sinh: np.cosh,
+    np.cosh: np.sinh,
+    np.tanh: lambda v: 1 - np.tanh(v)**2,
+    np.arcsinh: lambda v: 1 / np.sqrt(v**2 + 1),
+    np.arccosh: lambda v: 1 / np.sqrt(v**2 - 1),
+    np.arctanh: lambda v: 1 / (1 - v**2),
+    # Funções constantes por partes.
+    np.sign: np.zeros_like,
+    np.floor: np.zeros_like,
+    np.ceil: np.zeros_like,
+    np.trunc: np.zeros_like,
+    np.rint: np.zeros_like,
+}
+
+# Ufuncs de dois argumentos, calculadas pelas operações de Dual.
+_DERIVADAS_BINARIAS = {
+    np.add: lambda x, y: x + y,
+    np.subtract: lambda x, y: x - y,
+    np.multiply: lambda x, y: x * y,
+    np.true_divide: lambda x, y: x / y,
+    np.power: lambda x, y: x ** y,
+    np.maximum: _maximo,
+    np.minimum: _minimo,
+    np.hypot: _hipotenusa,
+    np.arctan2: _arco_tangente2,
+}
+
+# Comparações e testes, avaliados apenas nos valores.
+_COMPARACOES = {
+    np.less, np.less_equal, np.greater, np.greater_equal, np.equal, np.not_equal,
+    np.isfinite, np.isnan, np.isinf, np.signbit,
+}
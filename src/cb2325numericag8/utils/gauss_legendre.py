@@ -0,0 +1,130 @@
+from collections import OrderedDict
+from importlib import resources
+
+import numpy as np
+
+# Número máximo de ordens mantidas no cache em memória.
+TAMANHO_CACHE = 128
+
+# Ordens incluídas na tabela distribuída com o pacote.
+ORDENS_PADRAO = tuple(range(1, 65))
+
+_ARQUIVO_TABELA = "gauss_legendre.npz"
+
+_cache = OrderedDict()
+_tabela_distribuida = None
+
+
+def nos_pesos_gauss_legendre(ordem):
+    """
+    Retorna os nós e pesos da quadratura de Gauss-Legendre em [-1, 1].
+
+    A busca segue a ordem: cache em memória (LRU, com até TAMANHO_CACHE
+    ordens), tabela pré-calculada distribuída com o pacote (lida apenas no
+    primeiro acesso) e, por último, o cálculo com
+    numpy.polynomial.legendre.leggauss. Os arrays retornados são somente
+    leitura, pois são compartilhados entre as chamadas.
+
+    Args:
+        ordem (int): Número de nós da quadratura.
+
+    Raises:
+        ValueError: Se a ordem não for um inteiro positivo.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: Nós e pesos, ambos com `ordem` elementos.
+    """
+
+    if not isinstance(ordem, (int, np.integer)) or ordem < 1:
+        raise ValueError("Erro: a ordem da quadratura deve ser um inteiro positivo.")
+    ordem = int(ordem)
+
+    par = _cache.get(ordem)
+    if par is not None:
+        _cache.move_to_end(ordem)
+        return par
+
+    tabela = _carregar_tabela_distribuida()
+    if f"nos_{ordem}" in tabela:
+        nos, pesos = tabela[f"nos_{ordem}"], tabela[f"pesos_{ordem}"]
+    else:
+        nos, pesos = np.polynomial.legendre.leggauss(ordem)
+    return _guardar(ordem, nos, pesos)
+
+
+def salvar_tabela_gauss_legendre(caminho, ordens=ORDENS_PADRAO):
+    """
+    Calcula e salva os nós e pesos de várias ordens em um arquivo .npz.
+
+    O arquivo gerado pode ser carregado com carregar_tabela_gauss_legendre,
+    evitando recalcular as ordens usadas com frequência.
+
+    Args:
+        caminho (str or PathLike): Arquivo de destino.
+        ordens (iterable of int, optional): Ordens a incluir. Padrão é 1 a 64.
+    """
+
+    dados = {}
+    for ordem in ordens:
+        nos, pesos = nos_pesos_gauss_legendre(ordem)
+        dados[f"nos_{ordem}"] = nos
+        dados[f"pesos_{ordem}"] = pesos
+    np.savez(caminho, **dados)
+
+
+def carregar_tabela_gauss_legendre(caminho):
+    """
+    Carrega no cache os nós e pesos salvos por salvar_tabela_gauss_legendre.
+
+    Args:
+        caminho (str or PathLike): Arquivo .npz com a tabela.
+
+    Returns:
+        list[int]: Ordens carregadas.
+    """
+
+    with np.load(caminho) as arquivo:
+        ordens = sorted(int(nome[4:]) for nome in arquivo.files if nome.startswith("nos_"))
+        for ordem in ordens:
+            _guardar(ordem, arquivo[f"nos_{ordem}"], arquivo[f"pesos_{ordem}"])
+    return ordens
+
+
+def limpar_cache_gauss_legendre():
+    """
+    Esvazia o cache em memória de nós e pesos.
+    """
+
+    _cache.clear()
+
+
+def _guardar(ordem, nos, pesos):
+    """
+    Insere uma ordem no cache, removendo a menos usada se ele estiver cheio.
+    """
+
+    nos = np.array(nos, dtype=float)
+    pesos = np.array(pesos, dtype=float)
+    nos.flags.writeable = False
+    pesos.flags.writeable = False
+    _cache[ordem] = (nos, pesos)
+    _cache.move_to_end(ordem)
+    while len(_cache) > TAMANHO_CACHE:
+        _cache.popitem(last=False)
+    return nos, pesos
+
+
+def _carregar_tabela_distribuida():
+    """
+    Lê (uma única vez) a tabela de nós e pesos distribuída com o pacote.
+    """
+
+    global _tabela_distribuida
+    if _tabela_distribuida is None:
+        try:
+            arquivo = resources.files("cb2325numericag8").joinpath("data", _ARQUIVO_TABELA)
+            with resources.as_file(arquivo) as caminho, np.load(caminho) as dados:
+                _tabela_distribuida = {nome: dados[nome] for nome in dados.files}
+        except (FileNotFoundError, OSError):
+            _tabela_distribuida = {}
+    return _tabela_distribuida
@@ -0,0 +1,34 @@
+import importlib
+import sys
+
+
+def importacao_preguicosa(nome_modulo, atributos):
+    """
+    Cria uma função `__getattr__` de módulo (PEP 562) que importa nomes sob demanda.
+
+    Serve para adiar a importação de dependências pesadas (como o matplotlib)
+    até o primeiro acesso ao nome. Depois do primeiro acesso o valor fica
+    guardado no módulo e o `__getattr__` não é mais chamado.
+
+    Args:
+        nome_modulo (str): Nome do módulo que recebe o `__getattr__` (use __name__).
+        atributos (dict): Mapeia cada nome ao caminho de onde ele vem, no formato
+            "pacote.modulo" (o próprio módulo) ou "pacote.modulo:atributo".
+
+    Returns:
+        callable: Função a ser atribuída a `__getattr__` no módulo.
+    """
+
+    def __getattr__(nome):
+        if nome not in atributos:
+            raise AttributeError(f"module {nome_modulo!r} has no attribute {nome!r}")
+
+        caminho, _, atributo = atributos[nome].partition(":")
+        valor = importlib.import_module(caminho)
+        if atributo:
+            valor = getattr(valor, atributo)
+
+        setattr(sys.modules[nome_modulo], nome, valor)
+        return valor
+
+    return __getattr__
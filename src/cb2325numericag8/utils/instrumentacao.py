@@ -0,0 +1,263 @@
+import contextvars
+import functools
+import json
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+import numpy as np
+
+from cb2325numericag8.utils.dual import Dual
+
+# Fases em que o tempo de cada chamada é dividido.
+FASES = ("avaliacao", "soma", "grafico")
+
+_estatisticas_ativas = contextvars.ContextVar("_estatisticas_ativas", default=None)
+_registro_atual = contextvars.ContextVar("_registro_atual", default=None)
+
+
+class EstatisticasInstrumentacao:
+    """
+    Estatísticas coletadas dentro de um bloco `with instrumentar()`.
+
+    Os dados são agregados por função da biblioteca: número de chamadas,
+    avaliações da função do usuário, iterações, tempo total e por fase
+    ('avaliacao', 'soma', 'grafico') e pico de memória alocada.
+
+    Atributos:
+        funcoes (dict): Estatísticas agregadas, indexadas pelo nome da função.
+        memoria (bool): Indica se o pico de memória está sendo medido.
+    """
+
+    def __init__(self, memoria=True):
+        self.funcoes = {}
+        self.memoria = memoria
+
+    def _agregar(self, nome, registro):
+        """
+        Soma o registro de uma chamada às estatísticas da função.
+        """
+
+        dados = self.funcoes.get(nome)
+        if dados is None:
+            dados = self.funcoes[nome] = _novo_registro()
+            dados["chamadas"] = 0
+        dados["chamadas"] += 1
+        for chave in ("avaliacoes", "avaliacoes_derivada", "iteracoes"):
+            dados[chave] += registro[chave]
+        for fase, tempo in registro["tempo"].items():
+            dados["tempo"][fase] += tempo
+        if registro["memoria_pico"] is not None:
+            dados["memoria_pico"] = max(dados["memoria_pico"] or 0, registro["memoria_pico"])
+
+    def como_dict(self):
+        """
+        Retorna as estatísticas como um dicionário simples.
+
+        Returns:
+            dict: {'funcoes': {nome: estatísticas}, 'totais': estatísticas somadas}.
+        """
+
+        totais = _novo_registro()
+        totais["chamadas"] = 0
+        for dados in self.funcoes.values():
+            for chave in ("chamadas", "avaliacoes", "avaliacoes_derivada", "iteracoes"):
+                totais[chave] += dados[chave]
+            for fase, tempo in dados["tempo"].items():
+                totais["tempo"][fase] += tempo
+            if dados["memoria_pico"] is not None:
+                totais["memoria_pico"] = max(totais["memoria_pico"] or 0, dados["memoria_pico"])
+
+        return {
+            "funcoes": {nome: _copiar(dados) for nome, dados in self.funcoes.items()},
+            "totais": totais,
+        }
+
+    def como_json(self, **kwargs):
+        """
+        Retorna as estatísticas em formato JSON.
+
+        Args:
+            **kwargs: Repassados para json.dumps (por exemplo, indent=2).
+
+        Returns:
+            str: Estatísticas serializadas.
+        """
+
+        return json.dumps(self.como_dict(), **kwargs)
+
+
+@contextmanager
+def instrumentar(memoria=True):
+    """
+    Ativa a coleta de estatísticas para as chamadas da biblioteca no bloco.
+
+    Exemplo:
+        with instrumentar() as stats:
+            integral(f, 0, 1, n=1000)
+        print(stats.como_json(indent=2))
+
+    Args:
+        memoria (bool, optional): Se True, mede o pico de memória de cada
+            chamada com o tracemalloc (o que deixa as alocações mais lentas).
+
+    Yields:
+        EstatisticasInstrumentacao: Objeto preenchido durante o bloco.
+    """
+
+    estatisticas = EstatisticasInstrumentacao(memoria)
+    iniciou_tracemalloc = memoria and not tracemalloc.is_tracing()
+    if iniciou_tracemalloc:
+        tracemalloc.start()
+    token = _estatisticas_ativas.set(estatisticas)
+    try:
+        yield estatisticas
+    finally:
+        _estatisticas_ativas.reset(token)
+        if iniciou_tracemalloc:
+            tracemalloc.stop()
+
+
+def instrumentado(funcao):
+    """
+    Decorador que registra as chamadas de uma função pública da biblioteca.
+
+    Só a chamada mais externa gera um registro: avaliações, iterações e
+    tempos de funções chamadas internamente são somados a ela. Fora de um
+    bloco `instrumentar()` o custo é apenas uma consulta a uma ContextVar.
+    """
+
+    nome = f"{funcao.__module__.rsplit('.', 1)[-1]}.{funcao.__qualname__}"
+
+    @functools.wraps(funcao)
+    def envoltorio(*args, **kwargs):
+        estatisticas = _estatisticas_ativas.get()
+        if estatisticas is None or _registro_atual.get() is not None:
+            return funcao(*args, **kwargs)
+
+        registro = _novo_registro()
+        token = _registro_atual.set(registro)
+        medir_memoria = estatisticas.memoria and tracemalloc.is_tracing()
+        if medir_memoria:
+            memoria_inicial = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+        inicio = time.perf_counter()
+        try:
+            return funcao(*args, **kwargs)
+        finally:
+            registro["tempo"]["total"] = time.perf_counter() - inicio
+            if medir_memoria:
+                registro["memoria_pico"] = max(
+                    0, tracemalloc.get_traced_memory()[1] - memoria_inicial
+                )
+            _registro_atual.reset(token)
+            estatisticas._agregar(nome, registro)
+
+    return envoltorio
+
+
+def contar_avaliacoes(funcao, chave="avaliacoes"):
+    """
+    Envolve uma função do usuário para contar suas avaliações.
+
+    Cada chamada concluída soma ao registro atual o número de pontos avaliados
+    (1 para escalares, o tamanho do array para chamadas vetorizadas); o tempo
+    de todas as chamadas é somado à fase 'avaliacao'. Sem registro ativo a
+    função é retornada sem mudanças.
+
+    Args:
+        funcao (callable): Função a ser contada.
+        chave (str, optional): Contador usado ('avaliacoes' ou 'avaliacoes_derivada').
+
+    Returns:
+        callable: Função equivalente que atualiza o registro.
+    """
+
+    registro = _registro_atual.get()
+    if registro is None or funcao is None:
+        return funcao
+
+    @functools.wraps(funcao)
+    def funcao_contada(x, *args, **kwargs):
+        inicio = time.perf_counter()
+        try:
+            valor = funcao(x, *args, **kwargs)
+        finally:
+            registro["tempo"]["avaliacao"] += time.perf_counter() - inicio
+        registro[chave] += x.size if isinstance(x, (np.ndarray, Dual)) else 1
+        return valor
+
+    return funcao_contada
+
+
+@contextmanager
+def fase(nome):
+    """
+    Mede o tempo gasto em uma fase ('soma' ou 'grafico') da chamada atual.
+
+    Args:
+        nome (str): Nome da fase.
+    """
+
+    registro = _registro_atual.get()
+    if registro is None:
+        yield
+        return
+    inicio = time.perf_counter()
+    try:
+        yield
+    finally:
+        registro["tempo"][nome] += time.perf_counter() - inicio
+
+
+def registrar_avaliacoes(quantidade, chave="avaliacoes"):
+    """
+    Soma avaliações feitas fora do processo atual ao registro da chamada atual.
+
+    Args:
+        quantidade (int): Número de pontos avaliados.
+        chave (str, optional): Contador usado ('avaliacoes' ou 'avaliacoes_derivada').
+    """
+
+    registro = _registro_atual.get()
+    if registro is not None:
+        registro[chave] += int(quantidade)
+
+
+def registrar_iteracoes(iteracoes):
+    """
+    Soma o número de iterações de um método ao registro da chamada atual.
+
+    Args:
+        iteracoes (int): Número de iterações realizadas.
+    """
+
+    registro = _registro_atual.get()
+    if registro is not None:
+        registro["iteracoes"] += int(iteracoes)
+
+
+def _novo_registro():
+    """
+    Cria um registro vazio de uma chamada.
+    """
+
+    tempo = {"total": 0.0}
+    tempo.update((f, 0.0) for f in FASES)
+    return {
+        "avaliacoes": 0,
+        "avaliacoes_derivada": 0,
+        "iteracoes": 0,
+        "tempo": tempo,
+        "memoria_pico": None,
+    }
+
+
+def _copiar(dados):
+    """
+    Copia um registro, incluindo o dicionário de tempos.
+    """
+
+    copia = dict(dados)
+    copia["tempo"] = dict(dados["tempo"])
+    return copia
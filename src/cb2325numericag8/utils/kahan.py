@@ -1,22 +1,402 @@
+import mmap
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+# Número de acumuladores paralelos usados pela soma compensada vetorizada.
+_LARGURA_BLOCO = 4096
+
+# Abaixo deste tamanho o laço escalar é mais rápido que as operações vetorizadas.
+_LIMITE_LACO = 256
+
+# Número de parcelas em que a redução em árvore passa para o laço escalar.
+_LIMITE_ARVORE = 32
+
+# Tamanho padrão (em elementos) das partes distribuídas entre os processos.
+_TAMANHO_PARTE = 2 ** 20
+
+
 def soma_kahan(lista):
     """
-    Aplica o algoritmo de soma de Kahan para somar todos os elementos 
+    Aplica o algoritmo de soma de Kahan para somar todos os elementos
     de uma lista, a fim de evitar erros de ponto flutuante.
 
+    Arrays do NumPy com dtype numérico são somados pela versão vetorizada
+    (ver `soma_kahan_vetorizada`); demais iteráveis usam o laço clássico.
+
     Args:
-        lista (list): Lista com os números a serem somados.
+        lista (list or np.ndarray): Lista com os números a serem somados.
 
     Returns:
         float: Valor numérico obtido para a soma.
     """
 
+    if isinstance(lista, np.ndarray) and lista.dtype.kind in "biuf":
+        return soma_kahan_vetorizada(lista)
+
     soma = 0.0
     c = 0.0 # Variável de compensação
-    
+
     for valor in lista:
         y = valor - c
         t = soma + y
         c = (t - soma) - y
         soma = t
 
-    return soma
\ No newline at end of file
+    return soma
+
+
+def soma_kahan_vetorizada(valores):
+    """
+    Soma compensada de um array usando operações vetorizadas do NumPy.
+
+    Os valores são distribuídos entre vários acumuladores independentes,
+    atualizados em bloco com a transformação exata TwoSum (Neumaier sem
+    desvio). Os acumuladores são depois reduzidos em árvore, também com
+    TwoSum. O resultado tem a mesma garantia de precisão do laço de Kahan.
+
+    Args:
+        valores (array_like): Números a serem somados (qualquer formato).
+
+    Returns:
+        float: Valor numérico obtido para a soma.
+    """
+
+    valores = np.asarray(valores, dtype=float).ravel()
+    if valores.size <= _LIMITE_LACO:
+        soma = erro = 0.0
+        for valor in valores.tolist():
+            t = soma + valor
+            z = t - soma
+            erro += (soma - (t - z)) + (valor - z)
+            soma = t
+    else:
+        with np.errstate(invalid="ignore", over="ignore"):
+            soma, erro = _soma_dupla(valores)
+    total = float(soma + erro)
+    if not np.isfinite(total):
+        # Com inf ou NaN a compensação não faz sentido; propaga como np.sum.
+        return float(np.sum(valores))
+    return total
+
+
+def soma_acumulada_compensada(valores):
+    """
+    Somas acumuladas (prefixos) compensadas de um vetor.
+
+    As somas parciais são obtidas com np.add.accumulate e o erro de
+    arredondamento de cada adição é recuperado de forma exata com TwoSum;
+    a soma acumulada desses erros corrige cada prefixo. Cada elemento do
+    resultado tem a precisão da soma de Kahan do prefixo correspondente,
+    com custo O(n) e sem laços em Python.
+
+    Args:
+        valores (array_like): Números a serem somados.
+
+    Returns:
+        np.ndarray: Array float64 em que o elemento i é a soma de valores[:i + 1].
+    """
+
+    valores = np.asarray(valores, dtype=float).ravel()
+    with np.errstate(invalid="ignore", over="ignore"):
+        somas = np.add.accumulate(valores)
+        anteriores = np.concatenate([[0.0], somas[:-1]])
+        _, erros = _two_sum(anteriores, valores)
+        corrigidas = somas + np.cumsum(erros)
+    # Com inf ou NaN a compensação não faz sentido; mantém a soma simples.
+    return np.where(np.isfinite(corrigidas), corrigidas, somas)
+
+
+def soma_kahan_paralela(valores, workers=None, tamanho_bloco=_TAMANHO_PARTE):
+    """
+    Soma compensada de um array grande distribuída em um pool de processos.
+
+    O array é dividido em partes de tamanho fixo, cada uma somada com
+    `soma_kahan_vetorizada` por um processo. As somas parciais são então
+    combinadas em árvore, sempre na mesma ordem. Como a divisão não depende
+    do número de processos, o resultado é idêntico bit a bit para qualquer
+    valor de `workers`.
+
+    Arrays criados com np.memmap não são copiados para os processos: cada
+    processo abre o próprio mapeamento do arquivo e lê apenas a sua parte.
+
+    Args:
+        valores (np.ndarray): Array (ou np.memmap) com os números a somar.
+        workers (int, optional): Número de processos. Se None ou 1, a soma é
+            feita no processo atual, com a mesma divisão em partes.
+        tamanho_bloco (int, optional): Número de elementos por parte.
+
+    Raises:
+        ValueError: Se `workers` ou `tamanho_bloco` não forem inteiros positivos.
+
+    Returns:
+        float: Valor numérico obtido para a soma.
+    """
+
+    if workers is not None and (not isinstance(workers, int) or workers < 1):
+        raise ValueError("Erro: workers deve ser um inteiro positivo.")
+    if not isinstance(tamanho_bloco, int) or tamanho_bloco < 1:
+        raise ValueError("Erro: tamanho_bloco deve ser um inteiro positivo.")
+
+    arquivo = _origem_memmap(valores)
+    if arquivo is None:
+        valores = np.asarray(valores).ravel()
+        total = valores.size
+    else:
+        total = int(np.prod(valores.shape))
+
+    limites = [(i, min(i + tamanho_bloco, total)) for i in range(0, total, tamanho_bloco)]
+
+    if arquivo is not None:
+        tarefas = [arquivo + limite for limite in limites]
+        funcao_parte = _soma_parte_arquivo
+    else:
+        tarefas = [valores[i:j] for i, j in limites]
+        funcao_parte = _soma_parte
+
+    if workers is None or workers == 1 or len(tarefas) <= 1:
+        parciais = [funcao_parte(tarefa) for tarefa in tarefas]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            parciais = list(executor.map(funcao_parte, tarefas))
+
+    if not parciais:
+        return 0.0
+
+    soma, erro = _combinar_em_arvore(parciais)
+    total_soma = soma + erro
+    if not np.isfinite(total_soma):
+        return float(soma)
+    return float(total_soma)
+
+
+class KahanAccumulator:
+    """
+    Acumulador de soma compensada que pode ser alimentado aos poucos.
+
+    Guarda a soma corrente e o termo de compensação entre chamadas, de modo
+    que somar um conjunto de dados em blocos (arquivos, geradores, partes
+    calculadas por processos diferentes) tem a mesma precisão de uma única
+    passada. Dois acumuladores podem ser combinados com `merge`.
+
+    Atributos:
+        quantidade (int): Número de valores somados até o momento.
+    """
+
+    def __init__(self):
+        """
+        Inicializa o acumulador com soma zero.
+        """
+
+        self._soma = 0.0
+        self._erro = 0.0
+        self.quantidade = 0
+
+    def add(self, valor):
+        """
+        Soma um único valor ao acumulador.
+
+        Args:
+            valor (float): Valor a ser somado.
+        """
+
+        self._soma, e = _two_sum(self._soma, float(valor))
+        self._erro += e
+        self.quantidade += 1
+
+    def extend(self, valores):
+        """
+        Soma um bloco de valores ao acumulador.
+
+        Args:
+            valores (array_like or iterable): Bloco de valores. Arrays são
+                somados pela rotina vetorizada; outros iteráveis são
+                convertidos em array antes.
+        """
+
+        if not isinstance(valores, np.ndarray) and not hasattr(valores, "__len__"):
+            valores = np.fromiter(valores, dtype=float)
+        valores = np.asarray(valores, dtype=float).ravel()
+        if valores.size == 0:
+            return
+        with np.errstate(invalid="ignore", over="ignore"):
+            soma, erro = _soma_dupla(valores)
+        self._acumular(float(soma), float(erro))
+        self.quantidade += valores.size
+
+    def merge(self, outro):
+        """
+        Incorpora a soma de outro acumulador a este.
+
+        Args:
+            outro (KahanAccumulator): Acumulador com uma soma parcial.
+
+        Raises:
+            TypeError: Se `outro` não for um KahanAccumulator.
+        """
+
+        if not isinstance(outro, KahanAccumulator):
+            raise TypeError("Erro: só é possível combinar com outro KahanAccumulator.")
+        self._acumular(outro._soma, outro._erro)
+        self.quantidade += outro.quantidade
+
+    @property
+    def value(self):
+        """
+        float: Valor atual da soma compensada.
+        """
+
+        total = self._soma + self._erro
+        if total != total or total in (float("inf"), float("-inf")):
+            # Com inf ou NaN a compensação não tem significado.
+            return float(self._soma)
+        return float(total)
+
+    def _acumular(self, soma, erro):
+        """
+        Soma o par (soma, erro) de uma soma parcial ao estado atual.
+        """
+
+        self._soma, e = _two_sum(self._soma, soma)
+        self._erro += e + erro
+
+
+def _two_sum(a, b):
+    """
+    Transformação sem erro TwoSum: retorna s = fl(a + b) e e tal que a + b = s + e.
+    """
+
+    s = a + b
+    z = s - a
+    e = (a - (s - z)) + (b - z)
+    return s, e
+
+
+def _soma_dupla(valores):
+    """
+    Soma compensada ao longo do último eixo de um array de floats.
+
+    Args:
+        valores (np.ndarray): Array float64 de formato (..., n).
+
+    Returns:
+        tuple (np.ndarray, np.ndarray): soma e termo de correção, ambos com
+        formato valores.shape[:-1]. A soma exata é aproximada por soma + erro.
+    """
+
+    n = valores.shape[-1]
+    k = n // _LARGURA_BLOCO
+    erro = np.zeros(valores.shape[:-1])
+
+    if k > 0:
+        corpo = valores[..., :k * _LARGURA_BLOCO]
+        corpo = corpo.reshape(valores.shape[:-1] + (k, _LARGURA_BLOCO))
+        formato = valores.shape[:-1] + (_LARGURA_BLOCO,)
+        soma = np.zeros(formato)
+        comp = np.zeros(formato)
+        t = np.empty(formato)
+        z = np.empty(formato)
+        w = np.empty(formato)
+
+        # Cada linha do bloco é somada aos acumuladores com TwoSum, sem
+        # alocar arrays temporários.
+        for j in range(k):
+            linha = corpo[..., j, :]
+            np.add(soma, linha, out=t)
+            np.subtract(t, soma, out=z)
+            np.subtract(t, z, out=w)
+            np.subtract(soma, w, out=w)
+            np.subtract(linha, z, out=z)
+            np.add(w, z, out=w)
+            comp += w
+            soma, t = t, soma
+
+        erro += np.sum(comp, axis=-1)
+        resto = np.concatenate([soma, valores[..., k * _LARGURA_BLOCO:]], axis=-1)
+    else:
+        resto = valores
+
+    if resto.shape[-1] == 0:
+        return np.zeros(valores.shape[:-1]), erro
+
+    # Redução em árvore das parcelas restantes. Em uma dimensão, as últimas
+    # parcelas são somadas em laço escalar, que é mais barato que vários
+    # níveis de operações vetorizadas em arrays pequenos.
+    parada = 1 if resto.ndim > 1 else _LIMITE_ARVORE
+    while resto.shape[-1] > parada:
+        m = resto.shape[-1] // 2
+        s, e = _two_sum(resto[..., :m], resto[..., m:2 * m])
+        erro += np.sum(e, axis=-1)
+        if resto.shape[-1] % 2:
+            s = np.concatenate([s, resto[..., -1:]], axis=-1)
+        resto = s
+
+    if resto.ndim > 1:
+        return resto[..., 0], erro
+
+    soma = 0.0
+    erro = float(erro)
+    for valor in resto.tolist():
+        soma, e = _two_sum(soma, valor)
+        erro += e
+    return soma, erro
+
+
+def _soma_parte(valores):
+    """
+    Soma compensada de uma parte do array, retornando o par (soma, erro).
+    """
+
+    valores = np.asarray(valores, dtype=float).ravel()
+    with np.errstate(invalid="ignore", over="ignore"):
+        soma, erro = _soma_dupla(valores)
+    return float(soma), float(erro)
+
+
+def _soma_parte_arquivo(tarefa):
+    """
+    Abre uma parte de um arquivo mapeado em memória e a soma.
+
+    Args:
+        tarefa (tuple): (arquivo, dtype, deslocamento, inicio, fim).
+    """
+
+    arquivo, dtype, deslocamento, inicio, fim = tarefa
+    dtype = np.dtype(dtype)
+    parte = np.memmap(arquivo, dtype=dtype, mode="r",
+                      offset=deslocamento + inicio * dtype.itemsize,
+                      shape=(fim - inicio,))
+    return _soma_parte(parte)
+
+
+def _origem_memmap(valores):
+    """
+    Identifica um np.memmap criado diretamente sobre um arquivo.
+
+    Returns:
+        tuple or None: (arquivo, dtype, deslocamento) ou None se o array não
+        puder ser reaberto pelos processos a partir do arquivo.
+    """
+
+    if (isinstance(valores, np.memmap) and valores.filename is not None
+            and isinstance(valores.base, mmap.mmap)
+            and valores.flags.c_contiguous):
+        return (valores.filename, valores.dtype.str, valores.offset)
+    return None
+
+
+def _combinar_em_arvore(parciais):
+    """
+    Combina pares (soma, erro) aos pares, em uma ordem fixa.
+    """
+
+    while len(parciais) > 1:
+        proximos = []
+        for i in range(0, len(parciais) - 1, 2):
+            (s1, e1), (s2, e2) = parciais[i], parciais[i + 1]
+            s, e = _two_sum(s1, s2)
+            proximos.append((s, e + e1 + e2))
+        if len(parciais) % 2:
+            proximos.append(parciais[-1])
+        parciais = proximos
+    return parciais[0]
@@ -0,0 +1,98 @@
+import numpy as np
+from cb2325numericag8.utils.kahan import _soma_dupla, _two_sum
+
+# Constante de Veltkamp para dividir um float64 em duas metades de 26 bits.
+_FATOR_DIVISAO = 134217729.0  # 2**27 + 1
+
+# Número de elementos processados por vez, para manter os temporários em cache.
+_TAMANHO_PARTE = 2 ** 16
+
+
+def produto_escalar_compensado(x, y):
+    """
+    Calcula o produto escalar de dois vetores com o algoritmo Dot2
+    (Ogita, Rump e Oishi).
+
+    Cada produto x_i * y_i é separado em parte arredondada e erro exato
+    (TwoProduct) e as partes arredondadas são somadas com compensação.
+    O resultado é tão preciso quanto se o produto escalar fosse calculado
+    com o dobro da precisão e então arredondado.
+
+    Args:
+        x (array_like): Primeiro vetor.
+        y (array_like): Segundo vetor.
+
+    Raises:
+        ValueError: Se os vetores não possuírem o mesmo tamanho.
+
+    Returns:
+        float: Valor do produto escalar.
+    """
+
+    x = np.asarray(x, dtype=float).ravel()
+    y = np.asarray(y, dtype=float).ravel()
+    if x.size != y.size:
+        raise ValueError("Erro: os vetores devem possuir a mesma quantidade de elementos.")
+    return _dot2(x, y)
+
+
+def soma_quadrados_compensada(x):
+    """
+    Calcula a soma dos quadrados dos elementos de um vetor com o algoritmo Dot2.
+
+    Args:
+        x (array_like): Vetor de valores.
+
+    Returns:
+        float: Valor da soma dos quadrados.
+    """
+
+    x = np.asarray(x, dtype=float).ravel()
+    return _dot2(x, x)
+
+
+def _dot2(x, y):
+    """
+    Produto escalar compensado de dois arrays float64 unidimensionais.
+    """
+
+    soma = 0.0
+    erro = 0.0
+    with np.errstate(invalid="ignore", over="ignore"):
+        for inicio in range(0, x.size, _TAMANHO_PARTE):
+            parte_x = x[inicio:inicio + _TAMANHO_PARTE]
+            parte_y = y[inicio:inicio + _TAMANHO_PARTE]
+            produtos, erros_produtos = _two_product(parte_x, parte_y)
+            soma_parte, erro_parte = _soma_dupla(produtos)
+            soma, e = _two_sum(soma, float(soma_parte))
+            erro += e + float(erro_parte) + float(np.sum(erros_produtos))
+
+    total = soma + erro
+    if not np.isfinite(total):
+        # Valores muito grandes estouram a divisão de Veltkamp; nesse caso
+        # o produto comum já é inf ou NaN.
+        return float(np.dot(x, y))
+    return float(total)
+
+
+def _dividir(a):
+    """
+    Divide a em duas partes, a = alto + baixo, cada uma com no máximo 26 bits.
+    """
+
+    c = _FATOR_DIVISAO * a
+    alto = c - (c - a)
+    baixo = a - alto
+    return alto, baixo
+
+
+def _two_product(a, b):
+    """
+    Transformação sem erro TwoProduct: retorna p = fl(a * b) e e tal que a * b = p + e.
+    """
+
+    p = a * b
+    a1, a2 = _dividir(a)
+    b1, b2 = _dividir(b)
+    e = a2 * b2 - (((p - a1 * b1) - a2 * b1) - a1 * b2)
+    return p, e
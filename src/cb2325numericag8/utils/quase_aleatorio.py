@@ -0,0 +1,153 @@
+import numpy as np
+
+# Parâmetros de Joe e Kuo (new-joe-kuo-6.21201) para as dimensões 2 a 10 da
+# sequência de Sobol: grau s do polinômio primitivo, coeficientes a e
+# números de direção iniciais m_1, ..., m_s. A dimensão 1 usa m_k = 1.
+_JOE_KUO = (
+    (1, 0, (1,)),
+    (2, 1, (1, 3)),
+    (3, 1, (1, 3, 1)),
+    (3, 2, (1, 1, 1)),
+    (4, 1, (1, 1, 3, 3)),
+    (4, 4, (1, 3, 5, 13)),
+    (5, 2, (1, 1, 5, 5, 17)),
+    (5, 4, (1, 1, 5, 5, 5)),
+    (5, 7, (1, 1, 7, 11, 19)),
+)
+
+# Número máximo de dimensões da sequência de Sobol.
+MAX_DIMENSAO_SOBOL = len(_JOE_KUO) + 1
+
+# Número de bits dos pontos de Sobol (até 2**32 pontos por sequência).
+_BITS = 32
+
+
+def halton(n, dimensao, inicio=0):
+    """
+    Gera pontos da sequência de Halton em [0, 1)^dimensao.
+
+    A coordenada k do ponto i é o inverso radical de i na base do k-ésimo
+    número primo. Todos os pontos de uma coordenada são calculados juntos,
+    um dígito por vez.
+
+    Args:
+        n (int): Número de pontos.
+        dimensao (int): Número de coordenadas de cada ponto.
+        inicio (int, optional): Índice do primeiro ponto. Padrão é 0.
+
+    Raises:
+        ValueError: Se n, dimensao ou inicio forem inválidos.
+
+    Returns:
+        np.ndarray: Array de formato (n, dimensao).
+    """
+
+    _validar(n, dimensao, inicio)
+    indices = np.arange(inicio, inicio + n, dtype=np.int64)
+    pontos = np.empty((n, dimensao))
+
+    for k, base in enumerate(_primos(dimensao)):
+        resto = indices.copy()
+        coordenada = np.zeros(n)
+        fator = 1.0 / base
+        while np.any(resto > 0):
+            coordenada += fator * (resto % base)
+            resto //= base
+            fator /= base
+        pontos[:, k] = coordenada
+    return pontos
+
+
+def sobol(n, dimensao, inicio=0):
+    """
+    Gera pontos da sequência de Sobol em [0, 1)^dimensao.
+
+    Usa os números de direção de Joe e Kuo e a ordem do código de Gray
+    (Antonov e Saleev): o ponto i é o XOR dos números de direção dos bits
+    de i ^ (i >> 1). Os 2^m primeiros pontos de cada coordenada caem um em
+    cada intervalo de comprimento 2^-m.
+
+    Args:
+        n (int): Número de pontos.
+        dimensao (int): Número de coordenadas de cada ponto (até MAX_DIMENSAO_SOBOL).
+        inicio (int, optional): Índice do primeiro ponto. Padrão é 0.
+
+    Raises:
+        ValueError: Se n, dimensao ou inicio forem inválidos.
+
+    Returns:
+        np.ndarray: Array de formato (n, dimensao).
+    """
+
+    _validar(n, dimensao, inicio)
+    if dimensao > MAX_DIMENSAO_SOBOL:
+        raise ValueError(
+            f"Erro: a sequência de Sobol está disponível até {MAX_DIMENSAO_SOBOL} dimensões; "
+            f"use a sequência de Halton para mais dimensões."
+        )
+    if inicio + n > 2 ** _BITS:
+        raise ValueError(f"Erro: a sequência de Sobol tem no máximo 2^{_BITS} pontos.")
+
+    indices = np.arange(inicio, inicio + n, dtype=np.uint64)
+    gray = indices ^ (indices >> np.uint64(1))
+    direcoes = _numeros_direcao(dimensao)
+    inteiros = np.zeros((n, dimensao), dtype=np.uint64)
+
+    for bit in range(int(inicio + n).bit_length()):
+        ligado = ((gray >> np.uint64(bit)) & np.uint64(1)).astype(bool)
+        inteiros[ligado] ^= direcoes[:, bit]
+    return inteiros / float(2 ** _BITS)
+
+
+def _numeros_direcao(dimensao):
+    """
+    Calcula os números de direção v_1, ..., v_32 (já deslocados) de cada dimensão.
+
+    Returns:
+        np.ndarray: Array uint64 de formato (dimensao, 32).
+    """
+
+    direcoes = np.zeros((dimensao, _BITS), dtype=np.uint64)
+    direcoes[0] = [1 << (_BITS - 1 - k) for k in range(_BITS)]
+
+    for d in range(1, dimensao):
+        s, a, m = _JOE_KUO[d - 1]
+        v = [0] * _BITS
+        for k in range(_BITS):
+            if k < s:
+                v[k] = m[k] << (_BITS - 1 - k)
+            else:
+                novo = v[k - s] ^ (v[k - s] >> s)
+                for j in range(1, s):
+                    if (a >> (s - 1 - j)) & 1:
+                        novo ^= v[k - j]
+                v[k] = novo
+        direcoes[d] = v
+    return direcoes
+
+
+def _primos(quantidade):
+    """
+    Retorna os `quantidade` primeiros números primos.
+    """
+
+    primos = []
+    candidato = 2
+    while len(primos) < quantidade:
+        if all(candidato % p for p in primos if p * p <= candidato):
+            primos.append(candidato)
+        candidato += 1
+    return primos
+
+
+def _validar(n, dimensao, inicio):
+    """
+    Valida os parâmetros comuns das sequências.
+    """
+
+    if not isinstance(n, (int, np.integer)) or n < 0:
+        raise ValueError("Erro: n deve ser um inteiro não negativo.")
+    if not isinstance(dimensao, (int, np.integer)) or dimensao < 1:
+        raise ValueError("Erro: a dimensão deve ser um inteiro positivo.")
+    if not isinstance(inicio, (int, np.integer)) or inicio < 0:
+        raise ValueError("Erro: inicio deve ser um inteiro não negativo.")
@@ -0,0 +1,41 @@
+def validar_metodo(metodo, metodos):
+    """
+    Normaliza o nome do método (capitalize) e verifica se ele está entre os disponíveis.
+
+    Args:
+        metodo (str): Nome do método informado pelo usuário.
+        metodos (dict or iterable of str): Métodos disponíveis.
+
+    Raises:
+        ValueError: Se o método não for uma string ou não estiver disponível.
+
+    Returns:
+        str: Nome normalizado do método.
+    """
+
+    try:
+        metodo = metodo.capitalize()
+    except AttributeError:
+        raise ValueError(
+            f"Erro: o método informado deve ser uma string. "
+            f"Recebido tipo {type(metodo).__name__}."
+        )
+    if metodo not in metodos:
+        raise ValueError(
+            f"Erro: o método escolhido é inválido. "
+            f"Os métodos válidos são {', '.join(metodos)}"
+        )
+    return metodo
+
+
+def validar_precisao(precisao):
+    """
+    Verifica se a precisão é None ou um inteiro não negativo.
+
+    Raises:
+        ValueError: Se a precisão não for None nem um inteiro não negativo.
+    """
+
+    if precisao is not None:
+        if not isinstance(precisao, int) or precisao < 0:
+            raise ValueError("Erro: precisão deve ser um inteiro não negativo.")
@@ -0,0 +1,88 @@
+import math
+
+import numpy as np
+import pytest
+
+from cb2325numericag8.utils.dual import (
+    Dual, derivada_central, derivada_dual, derivada_passo_complexo, valor_e_derivada
+)
+
+
+def test_derivada_dual_exata():
+    """
+    Testa se os números duais propagam derivadas exatas pela aritmética do
+    Python e pelas ufuncs do NumPy, com escalares e arrays.
+    """
+
+    def f(x):
+        return np.sin(x) * np.exp(x) / (1 + x**2) + 2**x - np.sqrt(x)
+
+    def df(x):
+        g = np.sin(x) * np.exp(x)
+        dg = (np.cos(x) + np.sin(x)) * np.exp(x)
+        return (dg * (1 + x**2) - g * 2 * x) / (1 + x**2)**2 + 2**x * math.log(2) - 0.5 / np.sqrt(x)
+
+    valor, derivada = derivada_dual(f, 0.7)
+    assert isinstance(valor, float) and isinstance(derivada, float)
+    assert valor == pytest.approx(f(0.7), rel=1e-15)
+    assert derivada == pytest.approx(df(0.7), rel=1e-14)
+
+    x = np.linspace(0.1, 3.0, 50)
+    valores, derivadas = derivada_dual(f, x)
+    np.testing.assert_allclose(valores, f(x), rtol=1e-15)
+    np.testing.assert_allclose(derivadas, df(x), rtol=1e-13)
+
+    # Parâmetros extras e funções que não dependem de x.
+    assert derivada_dual(lambda x, c: c * x**3, 2.0, 5.0) == (40.0, 60.0)
+    assert derivada_dual(lambda x: 3.0, 1.0) == (3.0, 0.0)
+
+    # Ramificações comparam apenas o valor.
+    assert derivada_dual(lambda x: -x if x < 0 else x**2, -2.0) == (2.0, -1.0)
+
+
+def test_dual_conversao_para_float():
+    """
+    Testa se funções do módulo math falham com TypeError ao receber um dual.
+    """
+
+    with pytest.raises(TypeError):
+        float(Dual(1.0, 1.0))
+    with pytest.raises(TypeError):
+        derivada_dual(math.exp, 1.0)
+
+
+def test_passo_complexo_e_central():
+    """
+    Testa as derivadas por passo complexo e por diferenças centrais.
+    """
+
+    assert derivada_passo_complexo(np.exp, 1.0)[1] == pytest.approx(math.e, rel=1e-15)
+    with pytest.raises(TypeError):
+        derivada_passo_complexo(math.exp, 1.0)
+    assert derivada_central(math.exp, 1.0)[1] == pytest.approx(math.e, rel=1e-9)
+
+
+def test_valor_e_derivada_ordem_das_estrategias():
+    """
+    Testa se a estratégia que funcionou é mantida nas chamadas seguintes.
+    """
+
+    chamadas = []
+
+    def f(x):
+        chamadas.append(type(x))
+        return math.exp(x) - 2
+
+    calcular = valor_e_derivada(f)
+    valor, derivada = calcular(1.0)
+    assert valor == pytest.approx(math.e - 2) and derivada == pytest.approx(math.e, rel=1e-9)
+    assert chamadas == [Dual, complex, float, float, float]
+
+    chamadas.clear()
+    calcular(1.0)
+    assert chamadas == [float, float, float]
+
+    chamadas.clear()
+    calcular = valor_e_derivada(lambda x: chamadas.append(type(x)) or x**2)
+    assert calcular(3.0) == (9.0, 6.0)
+    assert chamadas == [Dual]
@@ -1,5 +1,7 @@
 import pytest
+import numpy as np
 from cb2325numericag8.erros.erros import erro_absoluto 
+from cb2325numericag8.erros.erros import erro_absoluto_lote, erro_relativo_lote, relatorio_erros
 from cb2325numericag8.erros.erros import erro_relativo
 from cb2325numericag8.erros.erros import erro_quadratico_medio
 
@@ -68,6 +70,23 @@ def test_erro_quadratico_medio_nao_numerico():
         lista_aproximada = [1,"x"]
         erro_quadratico_medio(lista_real, lista_aproximada)
 
+def test_erro_quadratico_medio_none_e_lista_aninhada():
+    """
+    Verifica se 'erro_quadratico_medio' rejeita None e listas aninhadas, em vez
+    de retornar NaN ou dividir pela quantidade de linhas.
+    """
+    mensagem_erro = "Erro: todos os valores das listas devem ser numéricos."
+
+    with pytest.raises(ValueError, match=mensagem_erro):
+        erro_quadratico_medio([1, None], [1, 2])
+    with pytest.raises(ValueError, match=mensagem_erro):
+        erro_quadratico_medio([[1, 2], [3, 4]], [[0, 0], [0, 0]])
+
+    # Valores convertíveis com float() continuam aceitos.
+    from decimal import Decimal
+    from fractions import Fraction
+    assert erro_quadratico_medio(['1.5', Fraction(1, 2)], [Decimal('0.5'), 0]) == 0.625
+
 def test_precisao_valores_invalidos():
     """
     Testa o comportamento do parâmetro 'precisao' nas funções de cálculo de erros.
@@ -129,4 +148,145 @@ def test_precisao_valores_invalidos():
     with pytest.raises(
         ValueError, match="precisão deve ser um inteiro não negativo"
     ):
-        erro_quadratico_medio([3, 3.5], [4, 3.4], precisao=-7)
\ No newline at end of file
+        erro_quadratico_medio([3, 3.5], [4, 3.4], precisao=-7)
+
+def test_erros_lote_iguais_aos_escalares():
+    """
+    Verifica se as versões em lote coincidem com as funções escalares,
+    inclusive com arredondamento e broadcasting.
+    """
+    reais = np.array([3.1415926, 2.7182818, -1.5, 10.0])
+    aproximados = np.array([3.14, 2.72, -1.4, 9.0])
+
+    for p in (None, 0, 3):
+        ea = erro_absoluto_lote(reais, aproximados, precisao=p)
+        er = erro_relativo_lote(reais, aproximados, precisao=p)
+        for i in range(reais.size):
+            assert ea[i] == pytest.approx(erro_absoluto(reais[i], aproximados[i], precisao=p))
+            assert er[i] == pytest.approx(erro_relativo(reais[i], aproximados[i], precisao=p))
+
+    np.testing.assert_allclose(erro_absoluto_lote(reais, 1.0), np.abs(reais - 1.0))
+
+def test_erro_relativo_lote_valor_real_zero():
+    """
+    Verifica se valores reais nulos resultam em NaN sem interromper o lote.
+    """
+    er = erro_relativo_lote([0.0, 2.0, 0.0], [1.0, 1.0, 0.0])
+    assert np.isnan(er[0]) and np.isnan(er[2])
+    assert er[1] == 0.5
+
+def test_erros_lote_out_e_invalidos():
+    """
+    Verifica o uso do parâmetro 'out' e os erros de entrada das versões em lote.
+    """
+    saida = np.empty(3)
+    resultado = erro_absoluto_lote([1, 2, 3], [1, 1, 1], out=saida)
+    assert resultado is saida
+    np.testing.assert_array_equal(saida, [0, 1, 2])
+
+    # out pode ser o próprio array de valores reais ou aproximados.
+    reais, aproximados = np.array([2.0, 4.0, 0.0]), np.array([1.0, 3.0, 1.0])
+    for alvo in ("reais", "aproximados"):
+        r, a = reais.copy(), aproximados.copy()
+        saida = r if alvo == "reais" else a
+        np.testing.assert_array_equal(erro_relativo_lote(r, a, out=saida), [0.5, 0.25, np.nan])
+        r, a = reais.copy(), aproximados.copy()
+        saida = r if alvo == "reais" else a
+        np.testing.assert_array_equal(erro_absoluto_lote(r, a, out=saida), [1, 1, 1])
+
+    with pytest.raises(ValueError, match="out deve ser um array float64"):
+        erro_absoluto_lote([1, 2, 3], [1, 1, 1], out=np.empty(2))
+    with pytest.raises(ValueError, match="devem ser numéricos"):
+        erro_relativo_lote(["a", 2], [1, 1])
+    with pytest.raises(ValueError, match="precisão deve ser um inteiro não negativo"):
+        erro_relativo_lote([1, 2], [1, 1], precisao=-1)
+
+def test_erro_quadratico_medio_fluxo():
+    """
+    Verifica se o cálculo em fluxo (geradores, blocos e memmap) coincide
+    com o cálculo sobre listas.
+    """
+    reais = np.linspace(0, 1, 1001)
+    aproximados = reais + np.sin(reais) * 1e-3
+    esperado = erro_quadratico_medio(list(reais), list(aproximados))
+
+    gerador_reais = (v for v in reais)
+    gerador_blocos = (aproximados[i:i + 77] for i in range(0, 1001, 77))
+    assert erro_quadratico_medio(gerador_reais, gerador_blocos, tamanho_bloco=64) == pytest.approx(esperado, rel=1e-14)
+    assert erro_quadratico_medio(reais, aproximados, tamanho_bloco=100) == pytest.approx(esperado, rel=1e-14)
+
+def test_erro_quadratico_medio_fluxo_memmap(tmp_path):
+    """
+    Verifica o cálculo em fluxo sobre arquivos mapeados em memória.
+    """
+    caminho = tmp_path / "reais.bin"
+    np.arange(5000, dtype=float).tofile(caminho)
+    reais = np.memmap(caminho, dtype=float, mode="r")
+    aproximados = np.arange(5000, dtype=float) + 2.0
+    assert erro_quadratico_medio(reais, aproximados, tamanho_bloco=512) == 4.0
+
+def test_erro_quadratico_medio_fluxo_erros():
+    """
+    Verifica se o cálculo em fluxo levanta os mesmos erros das listas.
+    """
+    with pytest.raises(ValueError, match="mesma quantidade de elementos"):
+        erro_quadratico_medio(iter([1, 2, 3]), iter([1, 2]))
+    with pytest.raises(ValueError, match="não podem ser vazias"):
+        erro_quadratico_medio(iter([]), iter([]))
+    with pytest.raises(ValueError, match="devem ser numéricos"):
+        erro_quadratico_medio(iter([1, 2]), iter([1, "x"]))
+    with pytest.raises(ValueError, match="devem ser numéricos"):
+        erro_quadratico_medio(iter([1, None]), iter([1, 2]))
+    with pytest.raises(ValueError, match="devem ser numéricos"):
+        erro_quadratico_medio(iter([np.arange(3.0), [1, None]]), iter(range(5)), tamanho_bloco=2)
+
+def test_relatorio_erros():
+    """
+    Verifica se o relatório calcula as métricas iguais às das funções
+    individuais e às fórmulas diretas.
+    """
+    rng = np.random.default_rng(4)
+    reais = rng.standard_normal(3000)
+    aproximados = reais + rng.standard_normal(3000) * 1e-2
+    reais[10] = 0.0
+
+    relatorio = relatorio_erros(reais, aproximados, tamanho_bloco=256)
+    diferenca = np.abs(reais - aproximados)
+    validos = reais != 0
+
+    assert relatorio["eqm"] == pytest.approx(erro_quadratico_medio(reais, aproximados), rel=1e-14)
+    assert relatorio["reqm"] == pytest.approx(np.sqrt(np.mean(diferenca**2)), rel=1e-12)
+    assert relatorio["eam"] == pytest.approx(np.mean(diferenca), rel=1e-12)
+    assert relatorio["erro_maximo"] == np.max(diferenca)
+    assert relatorio["erro_relativo_medio"] == pytest.approx(
+        np.mean(diferenca[validos] / np.abs(reais[validos])), rel=1e-12)
+
+    parcial = relatorio_erros(reais, aproximados, metricas=["eam"], precisao=2)
+    assert list(parcial) == ["eam"]
+    assert parcial["eam"] == round(relatorio["eam"], 2)
+
+def test_relatorio_erros_axis():
+    """
+    Verifica o cálculo de várias séries de um array 2D em uma chamada.
+    """
+    reais = np.array([[1.0, 2.0, 3.0], [0.0, 0.0, 0.0]])
+    aproximados = np.array([[1.0, 2.5, 2.0], [1.0, -1.0, 1.0]])
+
+    relatorio = relatorio_erros(reais, aproximados, axis=1)
+    np.testing.assert_allclose(relatorio["eqm"], [1.25 / 3, 1.0])
+    np.testing.assert_allclose(relatorio["erro_maximo"], [1.0, 1.0])
+    assert np.isnan(relatorio["erro_relativo_medio"][1])
+
+    por_coluna = relatorio_erros(reais, aproximados, metricas=["eam"], axis=0)
+    np.testing.assert_allclose(por_coluna["eam"], [0.5, 0.75, 1.0])
+
+def test_relatorio_erros_invalidos():
+    """
+    Verifica os erros de entrada do relatório.
+    """
+    with pytest.raises(ValueError, match="métricas inválidas"):
+        relatorio_erros([1, 2], [1, 2], metricas=["mape"])
+    with pytest.raises(ValueError, match="mesma quantidade de elementos"):
+        relatorio_erros([1, 2], [1, 2, 3])
+    with pytest.raises(ValueError, match="não podem ser vazias"):
+        relatorio_erros([], [])
@@ -0,0 +1,54 @@
+import numpy as np
+import pytest
+from cb2325numericag8.utils import gauss_legendre
+from cb2325numericag8.utils.gauss_legendre import (
+    nos_pesos_gauss_legendre, salvar_tabela_gauss_legendre,
+    carregar_tabela_gauss_legendre, limpar_cache_gauss_legendre
+)
+
+
+def test_nos_pesos_iguais_ao_leggauss():
+    """
+    Testa se a tabela distribuída e o cálculo direto coincidem com o leggauss.
+    """
+
+    limpar_cache_gauss_legendre()
+    for ordem in (1, 5, 20, 64, 100):
+        nos, pesos = nos_pesos_gauss_legendre(ordem)
+        esperado_nos, esperado_pesos = np.polynomial.legendre.leggauss(ordem)
+        np.testing.assert_allclose(nos, esperado_nos, rtol=0, atol=1e-15)
+        np.testing.assert_allclose(pesos, esperado_pesos, rtol=0, atol=1e-15)
+        assert not nos.flags.writeable
+
+    assert nos_pesos_gauss_legendre(20)[0] is nos_pesos_gauss_legendre(20)[0]
+    with pytest.raises(ValueError, match="ordem"):
+        nos_pesos_gauss_legendre(0)
+
+
+def test_cache_lru(monkeypatch):
+    """
+    Testa se a ordem menos usada é removida quando o cache enche.
+    """
+
+    monkeypatch.setattr(gauss_legendre, "TAMANHO_CACHE", 2)
+    limpar_cache_gauss_legendre()
+    nos_pesos_gauss_legendre(3)
+    nos_pesos_gauss_legendre(4)
+    nos_pesos_gauss_legendre(3)
+    nos_pesos_gauss_legendre(5)
+    assert list(gauss_legendre._cache) == [3, 5]
+    limpar_cache_gauss_legendre()
+
+
+def test_salvar_e_carregar_tabela(tmp_path):
+    """
+    Testa se uma tabela salva pode ser carregada de volta no cache.
+    """
+
+    caminho = tmp_path / "tabela.npz"
+    salvar_tabela_gauss_legendre(caminho, ordens=[7, 80])
+    limpar_cache_gauss_legendre()
+    assert carregar_tabela_gauss_legendre(caminho) == [7, 80]
+    assert list(gauss_legendre._cache) == [7, 80]
+    np.testing.assert_allclose(nos_pesos_gauss_legendre(80)[1],
+                               np.polynomial.legendre.leggauss(80)[1], atol=1e-15)
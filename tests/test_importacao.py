@@ -0,0 +1,57 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+import pytest
+
+SRC = Path(__file__).resolve().parents[1] / "src"
+
+MODULOS_NUMERICOS = [
+    "cb2325numericag8",
+    "cb2325numericag8.integracao.integracao",
+    "cb2325numericag8.raizes.raizes",
+    "cb2325numericag8.erros.erros",
+    "cb2325numericag8.aproximacao.regressao_linear",
+    "cb2325numericag8.aproximacao.minimos_quadrados",
+    "cb2325numericag8.interpolacao.interpolador_hermite",
+    "cb2325numericag8.interpolacao.interpolador_linear_por_partes",
+    "cb2325numericag8.interpolacao.interpolador_polinomial",
+]
+
+
+def _executar(codigo):
+    """
+    Executa um trecho de código em um interpretador novo e retorna a saída.
+    """
+
+    ambiente = dict(os.environ, PYTHONPATH=str(SRC))
+    resultado = subprocess.run([sys.executable, "-c", codigo], env=ambiente,
+                               capture_output=True, text=True, check=True)
+    return resultado.stdout.strip()
+
+
+@pytest.mark.parametrize("modulo", MODULOS_NUMERICOS)
+def test_importacao_nao_carrega_matplotlib(modulo):
+    """
+    Testa se importar os módulos numéricos não importa o matplotlib.
+    """
+
+    saida = _executar(f"import sys, {modulo}; print('matplotlib' in sys.modules)")
+    assert saida == "False"
+
+
+def test_graficos_carregados_sob_demanda():
+    """
+    Testa se os subpacotes e as funções de gráfico continuam acessíveis
+    pelos nomes antigos, carregando o matplotlib só nesse momento.
+    """
+
+    saida = _executar(
+        "import sys, cb2325numericag8 as pacote\n"
+        "from cb2325numericag8.integracao import integracao\n"
+        "print('matplotlib' in sys.modules)\n"
+        "print(callable(integracao.grafico_trapezoidal))\n"
+        "print(pacote.grafico.__name__)\n"
+        "print('matplotlib' in sys.modules)\n"
+    )
+    assert saida.split() == ["False", "True", "cb2325numericag8.grafico", "True"]
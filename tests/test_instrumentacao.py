@@ -0,0 +1,62 @@
+import json
+import numpy as np
+from cb2325numericag8.utils.instrumentacao import instrumentar
+from cb2325numericag8.integracao.integracao import integral
+from cb2325numericag8.raizes.raizes import raiz
+from cb2325numericag8.interpolacao.interpolador_polinomial import InterpoladorPolinomial
+
+
+def test_contagem_integral():
+    """
+    Testa se a integral registra uma chamada (a mais externa) com
+    n + 1 avaliações da função.
+    """
+
+    with instrumentar() as stats:
+        integral(np.sin, 0, np.pi, n=40, metodo="Simpson")
+
+    dados = stats.como_dict()["funcoes"]
+    assert list(dados) == ["integracao.integral"]
+    assert dados["integracao.integral"]["chamadas"] == 1
+    assert dados["integracao.integral"]["avaliacoes"] == 41
+    assert dados["integracao.integral"]["tempo"]["total"] >= dados["integracao.integral"]["tempo"]["soma"]
+    assert dados["integracao.integral"]["memoria_pico"] >= 0
+
+
+def test_contagem_raiz():
+    """
+    Testa a contagem de avaliações, de avaliações da derivada e de iterações
+    no método de Newton-Raphson.
+    """
+
+    chamadas = []
+
+    def f(x):
+        chamadas.append(x)
+        return x**2 - 2
+
+    with instrumentar(memoria=False) as stats:
+        _, iteracoes = raiz(f, 1.0, f_prime=lambda x: 2 * x, method="newton_raphson")
+
+    dados = stats.como_dict()["funcoes"]["raizes.raiz"]
+    assert dados["avaliacoes"] == len(chamadas)
+    assert dados["avaliacoes_derivada"] == len(iteracoes)
+    assert dados["iteracoes"] == len(iteracoes)
+    assert dados["memoria_pico"] is None
+
+
+def test_agregacao_e_json():
+    """
+    Testa se chamadas repetidas são agregadas e se a exportação em JSON
+    funciona, e se nada é registrado fora do bloco.
+    """
+
+    p = InterpoladorPolinomial([0, 1, 2], [1, 3, 2])
+    with instrumentar() as stats:
+        for x in (0.5, 1.5, 2.5):
+            p(x)
+    p(0.0)
+
+    dados = json.loads(stats.como_json())
+    assert dados["funcoes"]["interpolador_polinomial.InterpoladorPolinomial.__call__"]["chamadas"] == 3
+    assert dados["totais"]["chamadas"] == 3
@@ -1,6 +1,11 @@
+import math
 import pytest
 import numpy as np
-from cb2325numericag8.integracao.integracao import integral, integral_trapezoidal, integral_simpson
+from cb2325numericag8.integracao.integracao import (
+    integral, integral_trapezoidal, integral_simpson, integral_adaptativa, integral_romberg,
+    integral_gauss, integral_lote, integral_amostras, integral_cumulativa,
+    integral_com_tolerancia
+)
 
 
 funcao1 = lambda x: np.sin(x)
@@ -183,4 +188,401 @@ def test_precisao_valores_invalidos():
     with pytest.raises(
         ValueError, match="precisão deve ser um inteiro não negativo"
     ):
-        integral_simpson(funcao3, 0, 1, n=50, precisao=-5)
\ No newline at end of file
+        integral_simpson(funcao3, 0, 1, n=50, precisao=-5)
+
+def test_modos_de_avaliacao():
+    """
+    Testa se os três modos de avaliação dão o mesmo resultado e se o modo
+    'auto' faz uma única chamada para funções vetorizáveis.
+    """
+
+    chamadas = []
+
+    def f(x):
+        chamadas.append(np.size(x))
+        return np.exp(x)
+
+    resultados = [integral_simpson(f, 0, 1, n=100, avaliacao=modo)
+                  for modo in ("auto", "vetorizado", "escalar")]
+    assert resultados[0] == resultados[1] == pytest.approx(resultados[2], rel=1e-14)
+    assert chamadas[:2] == [101, 101]
+    assert len(chamadas) == 2 + 101
+
+
+def test_avaliacao_auto_volta_para_escalar():
+    """
+    Testa se o modo 'auto' volta para a avaliação ponto a ponto quando a
+    função não aceita arrays, e se o modo 'vetorizado' falha nesse caso.
+    """
+
+    def degrau(x):
+        return 1.0 if x > 0.5 else 0.0
+
+    assert integral_trapezoidal(math.sin, 0, np.pi, n=100) == pytest.approx(2.0, rel=1e-3)
+    assert integral(degrau, 0, 1, n=1000) == pytest.approx(0.5, abs=1e-3)
+    assert integral(lambda x: 3.0, 0, 2, n=10) == pytest.approx(6.0)
+
+    with pytest.raises(ValueError, match="vetorizada"):
+        integral(degrau, 0, 1, avaliacao="vetorizado")
+    with pytest.raises(ValueError, match="modo de avaliação é inválido"):
+        integral(degrau, 0, 1, avaliacao="paralelo")
+
+
+def test_adaptativo_funcao_com_pico():
+    """
+    Testa o método adaptativo em uma função com pico estreito: o resultado
+    deve respeitar a tolerância com muito menos avaliações que o Simpson
+    composto de mesma precisão.
+    """
+
+    def f(x):
+        return 1 / (1e-8 + x ** 2)
+
+    exato = 2e4 * math.atan(1e4)
+    valor, info = integral_adaptativa(f, -1, 1, tol=1e-6, detalhes=True)
+    assert valor == pytest.approx(exato, abs=1e-6)
+    assert info['erro_estimado'] <= 1e-6
+    assert info['avaliacoes'] < 30000
+    n_simpson = 2 * (info['avaliacoes'] // 2)
+    assert abs(integral_simpson(f, -1, 1, n=n_simpson) - exato) > 1.0
+
+    assert integral(f, -1, 1, metodo='adaptativo', tol=1e-6) == valor
+    assert integral(np.exp, 0, 1, metodo='Adaptativo', precisao=10) == round(math.e - 1, 10)
+
+
+def test_adaptativo_avaliacao_escalar_e_erros(capsys):
+    """
+    Testa o método adaptativo com funções escalares, o aviso ao atingir o
+    limite de níveis e a validação dos parâmetros.
+    """
+
+    assert integral_adaptativa(math.sin, 0, np.pi) == pytest.approx(2.0, abs=1e-8)
+
+    integral_adaptativa(lambda x: abs(x) ** 0.5, -1, 1, tol=1e-15, max_niveis=3)
+    assert "Aviso" in capsys.readouterr().out
+
+    # Tolerância abaixo do arredondamento: para no limite de avaliações.
+    _, info = integral_adaptativa(np.sin, 0, 1, tol=1e-20, max_avaliacoes=5000, detalhes=True)
+    assert info['avaliacoes'] <= 5000
+    assert "Aviso" in capsys.readouterr().out
+
+    # Intervalo degenerado.
+    assert integral_adaptativa(np.exp, 1, 1) == 0.0
+    assert integral(np.exp, 1, 1, metodo='Adaptativo', detalhes=True) == (
+        0.0, {'erro_estimado': 0.0, 'avaliacoes': 0, 'n': 0})
+
+    with pytest.raises(ValueError, match="tol"):
+        integral_adaptativa(np.exp, 0, 1, tol=0)
+    with pytest.raises(ValueError, match="max_avaliacoes"):
+        integral_adaptativa(np.exp, 0, 1, max_avaliacoes=0)
+    with pytest.raises(ValueError, match="n deve"):
+        integral_adaptativa(np.exp, 0, 1, n=0)
+    with pytest.raises(ValueError, match="Função não definida"), np.errstate(divide="ignore"):
+        integral_adaptativa(lambda x: 1 / x, 0, 1)
+
+
+def test_romberg_nao_reavalia_nos():
+    """
+    Testa se o método de Romberg converge e avalia cada nó uma única vez.
+    """
+
+    pontos = []
+
+    def f(x):
+        pontos.extend(np.atleast_1d(x).tolist())
+        return np.exp(x)
+
+    valor, info = integral_romberg(f, 0, 1, tol=1e-12, detalhes=True)
+    assert valor == pytest.approx(math.e - 1, abs=1e-12)
+    assert info['avaliacoes'] == len(pontos) == len(set(pontos)) == info['n'] + 1
+    assert info['erro_estimado'] <= 1e-12
+    assert type(valor) is float
+
+    assert integral(math.sin, 0, np.pi, metodo='romberg', precisao=8) == 2.0
+
+
+def test_romberg_instrumentado_e_aviso(capsys):
+    """
+    Testa a contagem de avaliações instrumentada e o aviso quando a
+    tolerância não é atingida.
+    """
+
+    from cb2325numericag8.utils.instrumentacao import instrumentar
+
+    with instrumentar(memoria=False) as stats:
+        _, info = integral_romberg(np.cos, 0, 2, detalhes=True)
+    assert stats.como_dict()['funcoes']['integracao.integral_romberg']['avaliacoes'] == info['avaliacoes']
+
+    integral_romberg(np.sqrt, 0, 1, tol=1e-15, max_niveis=4)
+    assert "Aviso" in capsys.readouterr().out
+
+
+def test_gauss_legendre():
+    """
+    Testa a quadratura de Gauss-Legendre simples e composta: com 20 nós,
+    funções suaves atingem a precisão da máquina.
+    """
+
+    chamadas = []
+
+    def f(x):
+        chamadas.append(np.size(x))
+        return np.exp(x)
+
+    assert integral_gauss(f, 0, 1) == pytest.approx(math.e - 1, rel=1e-15)
+    assert chamadas == [20]
+
+    # Polinômio de grau 2n - 1 integrado exatamente com n nós.
+    assert integral_gauss(lambda x: x ** 7, 0, 2, n=4) == pytest.approx(32.0, rel=1e-15)
+
+    composta = integral(math.cos, 0, 20, n=10, metodo='gauss', subintervalos=8)
+    assert composta == pytest.approx(math.sin(20), abs=1e-13)
+
+    with pytest.raises(ValueError, match="subintervalos"):
+        integral_gauss(np.exp, 0, 1, subintervalos=0)
+
+
+def test_integral_lote_intervalos():
+    """
+    Testa se a integração em lote coincide com as chamadas individuais, com
+    uma avaliação por bloco, e se os blocos limitam o tamanho da grade.
+    """
+
+    a = np.linspace(0, 1, 50)
+    b = a + np.linspace(0.5, 3, 50)
+    for metodo in ('Trapezoidal', 'Simpson', 'Gauss'):
+        esperado = [integral(np.sin, ai, bi, metodo=metodo) for ai, bi in zip(a, b)]
+        np.testing.assert_allclose(integral_lote(np.sin, a, b, metodo=metodo),
+                                   esperado, rtol=1e-13, atol=1e-15)
+
+    tamanhos = []
+
+    def f(x):
+        tamanhos.append(x.shape)
+        return np.cos(x)
+
+    valores = integral_lote(f, 0, b, n=10, metodo='gauss', tamanho_bloco=200)
+    np.testing.assert_allclose(valores, np.sin(b), rtol=1e-13, atol=1e-15)
+    assert tamanhos == [(20, 10), (20, 10), (10, 10)]
+
+
+def test_integral_lote_parametros():
+    """
+    Testa a varredura de parâmetros, o formato do resultado e a avaliação
+    ponto a ponto de funções escalares com parâmetros.
+    """
+
+    k = np.arange(1.0, 7.0).reshape(2, 3)
+    valores = integral_lote(lambda x, k: np.exp(k * x), 0, 1, metodo='Gauss', parametros=k)
+    assert valores.shape == (2, 3)
+    np.testing.assert_allclose(valores, np.expm1(k) / k, rtol=1e-14)
+
+    escalar = integral_lote(lambda x, k: math.exp(k * x), 0, 1, n=8, metodo='Gauss',
+                            parametros=k, precisao=8)
+    np.testing.assert_array_equal(escalar, np.round(np.expm1(k) / k, 8))
+
+    with pytest.raises(ValueError, match="formatos compatíveis"):
+        integral_lote(np.sin, [0, 1], [1, 2, 3])
+    with pytest.raises(ValueError, match="método escolhido é inválido"):
+        integral_lote(np.sin, 0, 1, metodo='Romberg')
+
+
+def test_integral_amostras_nao_uniformes():
+    """
+    Testa a integração de amostras com espaçamento irregular: o trapézio
+    coincide com o da NumPy e o Simpson é exato para parábolas, com número
+    par ou ímpar de intervalos.
+    """
+
+    rng = np.random.default_rng(3)
+    for quantidade in (2, 3, 4, 101, 102):
+        x = np.sort(rng.uniform(0, 2, quantidade))
+        y = 3 * x ** 2 - x + 1
+        exato = (x[-1] ** 3 - x[0] ** 3) - (x[-1] ** 2 - x[0] ** 2) / 2 + (x[-1] - x[0])
+        trapezio = np.sum(np.diff(x) * (y[:-1] + y[1:]) / 2)
+        assert integral_amostras(x, y) == pytest.approx(trapezio, rel=1e-13)
+        if quantidade > 2:
+            assert integral_amostras(list(x), list(y), metodo='simpson') == pytest.approx(exato, rel=1e-12)
+
+    with pytest.raises(ValueError, match="mesma quantidade"):
+        integral_amostras([0, 1, 2], [1, 2])
+    with pytest.raises(ValueError, match="pelo menos duas"):
+        integral_amostras([0], [1])
+    with pytest.raises(ValueError, match="repetir"):
+        integral_amostras([0, 1, 1], [1, 2, 3], metodo='Simpson')
+
+
+def test_integral_amostras_em_blocos(tmp_path):
+    """
+    Testa se a leitura em blocos (arrays, np.memmap e iteráveis de blocos)
+    dá o mesmo resultado que a leitura de uma vez só.
+    """
+
+    x = np.cumsum(np.random.default_rng(4).uniform(0.01, 0.02, 1001))
+    y = np.sin(x)
+    caminho_x, caminho_y = tmp_path / "x.dat", tmp_path / "y.dat"
+    x.tofile(caminho_x)
+    y.tofile(caminho_y)
+    mx = np.memmap(caminho_x, dtype=float, mode="r")
+    my = np.memmap(caminho_y, dtype=float, mode="r")
+
+    for metodo in ('Trapezoidal', 'Simpson'):
+        esperado = integral_amostras(x, y, metodo=metodo)
+        for tamanho_bloco in (1, 2, 3, 64):
+            assert integral_amostras(mx, my, metodo=metodo,
+                                     tamanho_bloco=tamanho_bloco) == pytest.approx(esperado, rel=1e-14)
+        blocos_x = (x[i:i + 100] for i in range(0, x.size, 100))
+        blocos_y = (y[i:i + 70] for i in range(0, y.size, 70))
+        assert integral_amostras(blocos_x, blocos_y, metodo=metodo,
+                                 tamanho_bloco=50) == pytest.approx(esperado, rel=1e-14)
+    assert integral_amostras(x, y, metodo='Simpson') == pytest.approx(
+        math.cos(x[0]) - math.cos(x[-1]), rel=1e-7)
+
+
+def test_avaliacao_paralela():
+    """
+    Testa se a avaliação em paralelo (executor próprio ou pool de processos)
+    dá exatamente o mesmo resultado da avaliação sequencial.
+    """
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    sequencial = integral_simpson(np.exp, 0, 1, n=1000)
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        assert integral_simpson(np.exp, 0, 1, n=1000, executor=executor) == sequencial
+        assert integral(math.exp, 0, 1, n=1000, metodo='Simpson', executor=executor) == sequencial
+    assert integral_trapezoidal(math.exp, 0, 1, n=1000, workers=2) == \
+        integral_trapezoidal(math.exp, 0, 1, n=1000)
+
+    with pytest.raises(ValueError, match="workers"):
+        integral_trapezoidal(np.exp, 0, 1, workers=0)
+
+
+def test_erro_indica_o_no():
+    """
+    Testa se os erros de avaliação informam o nó em que ocorreram, também
+    na avaliação em paralelo.
+    """
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    def f(x):
+        return np.where(x > 0.25, np.nan, x)
+
+    with pytest.raises(ValueError, match=r"não definida.*nó 26, x = 0\.26"):
+        integral_trapezoidal(f, 0, 1, n=100)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        with pytest.raises(ValueError, match=r"não definida.*nó 26"):
+            integral_trapezoidal(f, 0, 1, n=100, executor=executor)
+
+    def g(x):
+        return math.log(x - 0.45)
+
+    with pytest.raises(ValueError, match=r"math domain error \(em x = 0\.0\)"):
+        integral_trapezoidal(g, 0, 1, n=10, avaliacao='escalar')
+
+
+def test_integral_cumulativa():
+    """
+    Testa a integral acumulada: nos nós pares do Simpson coincide com a regra
+    composta, e com amostras irregulares segue a primitiva exata de parábolas.
+    """
+
+    avaliacoes = []
+
+    def f(x):
+        avaliacoes.append(np.size(x))
+        return np.exp(x)
+
+    x, F = integral_cumulativa(f, 0, 2, n=200, metodo='Simpson')
+    assert avaliacoes == [201]
+    assert F[0] == 0.0
+    np.testing.assert_allclose(F, np.expm1(x), rtol=0, atol=1e-8)
+    assert F[100] == pytest.approx(integral_simpson(np.exp, 0, 1, n=100), rel=1e-14)
+
+    _, F_trap = integral_cumulativa(np.exp, 0, 2, n=200)
+    assert F_trap[-1] == pytest.approx(integral_trapezoidal(np.exp, 0, 2, n=200), rel=1e-14)
+
+    amostras_x = np.sort(np.random.default_rng(5).uniform(0, 3, 40))
+    for quantidade in (39, 40):
+        xs = amostras_x[:quantidade]
+        _, G = integral_cumulativa((xs, xs ** 2), metodo='simpson')
+        np.testing.assert_allclose(G, (xs ** 3 - xs[0] ** 3) / 3, rtol=1e-12, atol=1e-14)
+
+    with pytest.raises(ValueError, match="limites"):
+        integral_cumulativa(np.exp)
+
+
+def test_integral_cumulativa_inversa():
+    """
+    Testa o uso da integral acumulada com o interpolador linear por partes
+    para inverter uma função de distribuição acumulada.
+    """
+
+    from cb2325numericag8.interpolacao.interpolador_linear_por_partes import (
+        InterpolacaoLinearPorPartes
+    )
+
+    x, F = integral_cumulativa(lambda t: np.exp(-t), 0, 10, n=4000, metodo='Simpson')
+    inversa = InterpolacaoLinearPorPartes(F, x)
+    inversa.calcular_retas()
+    probabilidades = np.array([0.1, 0.5, 0.9])
+    np.testing.assert_allclose(inversa.interpolar_muitos_pontos(probabilidades),
+                               -np.log1p(-probabilidades), rtol=1e-5)
+
+
+def test_integral_com_tolerancia():
+    """
+    Testa a escolha automática de n: o erro real fica abaixo da tolerância,
+    cada nó é avaliado uma vez e o valor coincide com a regra de n fixo.
+    """
+
+    pontos = []
+
+    def f(x):
+        pontos.extend(np.atleast_1d(x).tolist())
+        return np.exp(x)
+
+    for metodo in ('Trapezoidal', 'Simpson'):
+        pontos.clear()
+        valor, info = integral(f, 0, 1, metodo=metodo, tol=1e-9, detalhes=True)
+        assert abs(valor - (math.e - 1)) < 1e-9
+        assert info['erro_estimado'] <= 1e-9
+        assert info['avaliacoes'] == len(pontos) == len(set(pontos)) == info['n'] + 1
+        assert type(valor) is float
+        fixo = integral(np.exp, 0, 1, n=info['n'], metodo=metodo)
+        assert valor == pytest.approx(fixo, rel=1e-15)
+
+
+def test_integral_com_tolerancia_limite(capsys):
+    """
+    Testa o aviso quando n_max é atingido e a validação dos parâmetros.
+    """
+
+    valor, info = integral_com_tolerancia(np.sqrt, 0, 1, tol=1e-14, n_max=256, detalhes=True)
+    assert "Aviso" in capsys.readouterr().out
+    assert info['n'] == 256
+    assert valor == pytest.approx(2 / 3, abs=1e-3)
+
+    # n_max próximo de n: o limite vale desde a primeira duplicação.
+    for metodo in ('Trapezoidal', 'Simpson'):
+        for n, n_max in ((16, 32), (16, 63), (15, 40)):
+            _, info = integral_com_tolerancia(np.sqrt, 0, 1, n=n, metodo=metodo, tol=1e-14,
+                                              n_max=n_max, detalhes=True)
+            assert info['n'] <= n_max
+            assert info['avaliacoes'] <= n_max + 1
+    assert "Aviso" in capsys.readouterr().out
+
+    with pytest.raises(ValueError, match="n_max"):
+        integral(np.exp, 0, 1, n=100, n_max=150)
+    with pytest.raises(ValueError, match="tol"):
+        integral(np.exp, 0, 1, metodo='Simpson', tol=-1)
+
+    # Nome do método sem capitalização e repasse das opções de paralelismo.
+    from concurrent.futures import ThreadPoolExecutor
+    esperado = integral(np.exp, 0, 1, metodo='Simpson', tol=1e-10)
+    assert integral_com_tolerancia(np.exp, 0, 1, metodo='simpson', tol=1e-10) == esperado
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        assert integral(np.exp, 0, 1, metodo='simpson', tol=1e-10, executor=executor) == esperado
+    with pytest.raises(ValueError, match="opções não reconhecidas.*max_niveis"):
+        integral(np.exp, 0, 1, tol=1e-10, max_niveis=3)
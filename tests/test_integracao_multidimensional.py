@@ -0,0 +1,64 @@
+import math
+import numpy as np
+import pytest
+from cb2325numericag8.integracao.integracao_multidimensional import (
+    integral_multidimensional, integral_produto_tensorial, integral_quase_monte_carlo
+)
+
+
+def test_produto_tensorial():
+    """
+    Testa as regras produto em duas e três variáveis, com avaliação em blocos.
+    """
+
+    def f(x, y, z):
+        return np.exp(x) * np.cos(y) * z ** 2
+
+    exato = (math.e - 1) * math.sin(1) * (8 / 3)
+    limites = [(0, 1), (0, 1), (0, 2)]
+    assert integral_produto_tensorial(f, limites, n=20, metodo='Simpson') == pytest.approx(exato, rel=1e-7)
+    assert integral_multidimensional(f, limites, metodo='gauss', n=8) == pytest.approx(exato, rel=1e-13)
+    assert integral_multidimensional(f, limites, n=[40, 40, 10], tamanho_bloco=1000) == \
+        pytest.approx(exato, rel=1e-2)
+
+    # Funções escalares são avaliadas ponto a ponto.
+    valor = integral_multidimensional(lambda x, y: math.sin(x + y), [(0, 1), (0, 1)],
+                                      metodo='Gauss', n=6)
+    assert valor == pytest.approx(2 * math.sin(1) - math.sin(2), rel=1e-12)
+
+    with pytest.raises(ValueError, match="limites"):
+        integral_produto_tensorial(f, [0, 1])
+    with pytest.raises(ValueError, match="um número de divisões"):
+        integral_produto_tensorial(f, limites, n=[10, 10])
+
+
+def test_quase_monte_carlo():
+    """
+    Testa o quase Monte Carlo em seis variáveis: o erro estimado deve
+    ficar abaixo da tolerância e ser compatível com o erro real.
+    """
+
+    def f(*x):
+        return np.exp(-sum(xi ** 2 for xi in x))
+
+    exato = (math.sqrt(math.pi) / 2 * math.erf(1)) ** 6
+    limites = [(0, 1)] * 6
+    for metodo in ('Sobol', 'Halton'):
+        valor, info = integral_quase_monte_carlo(f, limites, metodo=metodo, tol=1e-5,
+                                                 semente=1, detalhes=True)
+        assert info['erro_estimado'] <= 1e-5
+        assert abs(valor - exato) < 1e-4
+        assert info['avaliacoes'] == 8 * info['n']
+
+    assert integral_multidimensional(f, limites, metodo='sobol', semente=1) == \
+        integral_quase_monte_carlo(f, limites, semente=1)
+
+
+def test_quase_monte_carlo_aviso(capsys):
+    """
+    Testa o aviso quando n_max é atingido antes da tolerância.
+    """
+
+    integral_quase_monte_carlo(lambda x, y: np.sign(x - y), [(0, 1), (0, 1)],
+                               tol=1e-12, n_min=64, n_max=256, semente=0)
+    assert "Aviso" in capsys.readouterr().out
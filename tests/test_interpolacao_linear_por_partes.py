@@ -63,3 +63,16 @@ def test_extrapolacao2():
 a,b = objeto3.reta(0)
 t = (a,b)
 assert t == pytest.approx((2,0))
+
+#Teste 8 - 'interpolar_muitos_pontos' com um array de abscissas:
+
+def test_interpolar_array():
+
+    objeto = InterpolacaoLinearPorPartes(X_3,Y_3)
+    objeto.calcular_retas()
+    pontos = np.array([1, 2, 2.5, 3, 3.5, 4, 5])
+    esperado = [objeto(p) for p in pontos]
+    np.testing.assert_allclose(objeto.interpolar_muitos_pontos(pontos), esperado)
+
+    with pytest.raises(ValueError, match = 'Erro de Extrapolação'):
+        objeto.interpolar_muitos_pontos(np.array([2, 6]))
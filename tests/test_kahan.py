@@ -0,0 +1,135 @@
+import math
+import pytest
+import numpy as np
+from cb2325numericag8.utils.kahan import (
+    soma_kahan, soma_kahan_vetorizada, soma_kahan_paralela, soma_acumulada_compensada, KahanAccumulator
+)
+
+
+def test_lista_usa_laco():
+    """
+    Testa se a soma de uma lista simples continua correta.
+    """
+
+    assert soma_kahan([0.1] * 10) == 1.0
+    assert soma_kahan([]) == 0.0
+
+
+def test_array_mal_condicionado():
+    """
+    Testa se a soma vetorizada recupera parcelas pequenas que a soma
+    ingênua perderia por cancelamento.
+    """
+
+    valores = np.array([1e16, 1.0, -1e16] * 5000 + [3.0])
+    assert soma_kahan(valores) == math.fsum(valores)
+    assert np.sum(valores) != math.fsum(valores)
+
+
+def test_vetorizada_igual_ao_laco():
+    """
+    Testa se a versão vetorizada concorda com o laço de Kahan em arrays
+    grandes, que passam pelos acumuladores em bloco.
+    """
+
+    rng = np.random.default_rng(0)
+    valores = rng.standard_normal(100_003) * 10.0 ** rng.integers(-8, 8, 100_003)
+    esperado = math.fsum(valores)
+    assert soma_kahan_vetorizada(valores) == esperado
+    assert abs(soma_kahan(list(valores)) - esperado) <= 1e-12 * abs(esperado)
+
+
+def test_vetorizada_tipos_e_infinitos():
+    """
+    Testa arrays inteiros, vazios e com valores não finitos.
+    """
+
+    assert soma_kahan(np.arange(10)) == 45.0
+    assert isinstance(soma_kahan(np.arange(10)), float)
+    assert soma_kahan(np.array([])) == 0.0
+    assert soma_kahan(np.array([1.0, np.inf, 2.0])) == np.inf
+    assert math.isnan(soma_kahan(np.array([1.0, np.nan])))
+
+
+def test_acumulador_em_blocos():
+    """
+    Testa se somar em blocos com o acumulador dá o mesmo resultado
+    de uma única passada.
+    """
+
+    rng = np.random.default_rng(1)
+    valores = rng.standard_normal(50_000) * 10.0 ** rng.integers(-10, 10, 50_000)
+
+    acumulador = KahanAccumulator()
+    for bloco in np.array_split(valores, 7):
+        acumulador.extend(bloco)
+    acumulador.extend(v for v in valores[:3])
+    acumulador.add(-valores[0])
+    acumulador.add(-valores[1])
+    acumulador.add(-valores[2])
+
+    assert acumulador.value == math.fsum(valores)
+    assert acumulador.quantidade == valores.size + 6
+
+
+def test_acumulador_merge():
+    """
+    Testa se a combinação de acumuladores parciais preserva a precisão.
+    """
+
+    partes = [KahanAccumulator() for _ in range(3)]
+    partes[0].extend([1e16, 1.0])
+    partes[1].extend([1.0, -1e16])
+    partes[2].add(1.0)
+
+    total = KahanAccumulator()
+    for parte in partes:
+        total.merge(parte)
+
+    assert total.value == 3.0
+    assert total.quantidade == 5
+    with pytest.raises(TypeError):
+        total.merge(3.0)
+
+
+def test_paralela_deterministica():
+    """
+    Testa se a soma paralela dá o mesmo resultado, bit a bit, para
+    diferentes números de processos.
+    """
+
+    rng = np.random.default_rng(2)
+    valores = rng.standard_normal(30_001) * 10.0 ** rng.integers(-6, 6, 30_001)
+
+    resultados = {soma_kahan_paralela(valores, workers=w, tamanho_bloco=4_000)
+                  for w in (None, 2, 3)}
+    assert len(resultados) == 1
+    assert abs(resultados.pop() - math.fsum(valores)) <= 1e-15 * np.sum(np.abs(valores))
+
+
+def test_paralela_memmap(tmp_path):
+    """
+    Testa a soma paralela de um arquivo mapeado em memória.
+    """
+
+    caminho = tmp_path / "valores.bin"
+    dados = np.arange(10_000, dtype=np.float32)
+    dados.tofile(caminho)
+    mapa = np.memmap(caminho, dtype=np.float32, mode="r")
+
+    assert soma_kahan_paralela(mapa, workers=2, tamanho_bloco=3_000) == math.fsum(dados)
+    with pytest.raises(ValueError, match="workers"):
+        soma_kahan_paralela(mapa, workers=0)
+
+
+def test_soma_acumulada_compensada():
+    """
+    Testa se cada prefixo da soma acumulada tem a precisão da soma compensada.
+    """
+
+    valores = np.array([1e16, 1.0, -1e16, 0.1] * 50)
+    acumulada = soma_acumulada_compensada(valores)
+    esperado = [math.fsum(valores[:i + 1]) for i in range(valores.size)]
+    np.testing.assert_allclose(acumulada, esperado, rtol=1e-15, atol=1e-15)
+    assert not np.allclose(np.cumsum(valores), esperado, rtol=1e-15, atol=1e-15)
+    assert soma_acumulada_compensada([]).size == 0
@@ -0,0 +1,45 @@
+import pytest
+import numpy as np
+from fractions import Fraction
+from cb2325numericag8.utils.produto_compensado import produto_escalar_compensado, soma_quadrados_compensada
+
+
+def _produto_exato(x, y):
+    return float(sum(Fraction(a) * Fraction(b) for a, b in zip(x, y)))
+
+
+def test_produto_escalar_mal_condicionado():
+    """
+    Testa se o produto escalar compensado recupera o resultado exato
+    onde o produto comum perde todos os dígitos por cancelamento.
+    """
+
+    x = np.array([1e8 + 1, 1.0, -(1e8 - 1)] * 1000)
+    y = np.array([1e8 - 1, 1.0, 1e8 + 1] * 1000)
+
+    assert produto_escalar_compensado(x, y) == _produto_exato(x, y)
+    assert np.dot(x, y) != _produto_exato(x, y)
+
+
+def test_produto_escalar_aleatorio():
+    """
+    Testa vetores grandes, que passam por várias partes do laço interno.
+    """
+
+    rng = np.random.default_rng(3)
+    x = rng.standard_normal(70_000) * 10.0 ** rng.integers(-5, 5, 70_000)
+    y = rng.standard_normal(70_000)
+
+    assert produto_escalar_compensado(x, y) == _produto_exato(x, y)
+    assert soma_quadrados_compensada(x[:1000]) == _produto_exato(x[:1000], x[:1000])
+
+
+def test_produto_escalar_tamanhos_diferentes():
+    """
+    Testa se vetores de tamanhos diferentes levantam ValueError.
+    """
+
+    with pytest.raises(ValueError, match="mesma quantidade de elementos"):
+        produto_escalar_compensado([1, 2, 3], [1, 2])
+    with pytest.warns(RuntimeWarning, match="overflow"):
+        assert np.isinf(soma_quadrados_compensada([1e300, 1.0]))
@@ -0,0 +1,34 @@
+import numpy as np
+import pytest
+from cb2325numericag8.utils.quase_aleatorio import sobol, halton, MAX_DIMENSAO_SOBOL
+
+
+def test_sobol_primeiros_pontos():
+    """
+    Testa os primeiros pontos da sequência de Sobol e a estratificação dos
+    2^m primeiros pontos em cada coordenada.
+    """
+
+    esperado = [[0, 0, 0], [0.5, 0.5, 0.5], [0.75, 0.25, 0.25], [0.25, 0.75, 0.75],
+                [0.375, 0.375, 0.625], [0.875, 0.875, 0.125]]
+    np.testing.assert_array_equal(sobol(6, 3), esperado)
+
+    pontos = sobol(1024, MAX_DIMENSAO_SOBOL)
+    for k in range(MAX_DIMENSAO_SOBOL):
+        assert np.unique(np.floor(pontos[:, k] * 1024)).size == 1024
+
+    np.testing.assert_array_equal(sobol(4, 2, inicio=100), sobol(104, 2)[100:])
+    with pytest.raises(ValueError, match="Halton"):
+        sobol(4, MAX_DIMENSAO_SOBOL + 1)
+
+
+def test_halton():
+    """
+    Testa os primeiros pontos da sequência de Halton (bases 2, 3 e 5).
+    """
+
+    esperado = [[0, 0, 0], [1 / 2, 1 / 3, 1 / 5], [1 / 4, 2 / 3, 2 / 5], [3 / 4, 1 / 9, 3 / 5]]
+    np.testing.assert_allclose(halton(4, 3), esperado)
+    np.testing.assert_allclose(halton(3, 20, inicio=7), halton(10, 20)[7:])
+    with pytest.raises(ValueError, match="dimensão"):
+        halton(4, 0)
@@ -3,7 +3,12 @@
 import pytest
 import math
 import numpy as np
-from cb2325numericag8.raizes.raizes import raiz 
+from cb2325numericag8.raizes.raizes import (
+    raiz, raiz_lote, bissecao_lote, secante_lote, newton_lote, todas_raizes,
+    raizes_polinomio
+)
+from cb2325numericag8.interpolacao.interpolador_polinomial import InterpoladorPolinomial
+from cb2325numericag8.interpolacao.interpolador_hermite import InterpoladorHermite
 
 # Exemplos de funções
 def funcao1(x):
@@ -82,6 +87,31 @@ def test_newton_sem_derivada():
     r, _ = raiz(funcao3, 2, tol=1e-6, method="newton_raphson")
     assert pytest.approx(r, rel=1e-5) == 5**0.1
 
+def test_newton_derivada_automatica():
+    """
+    Testa se, sem f_prime, Newton-Raphson usa uma avaliação por iteração
+    (números duais) e converge como com a derivada exata.
+    """
+    chamadas = []
+
+    def f(x):
+        chamadas.append(x)
+        return x**10 - 5
+
+    r, it = raiz(f, 2, tol=1e-12, method="newton_raphson")
+    _, it_exata = raiz(funcao3, 2, tol=1e-12, f_prime=derivada_funcao3, method="newton_raphson")
+    assert r == pytest.approx(5**0.1, rel=1e-14)
+    assert len(it) == len(it_exata)
+    assert len(chamadas) <= len(it) + 2
+
+    # Funções do módulo math não aceitam duais: usa diferenças centrais.
+    r, _ = raiz(funcao2, 0, tol=1e-12, method="newton_raphson")
+    assert r == pytest.approx(math.log(2), rel=1e-12)
+
+    raizes, _, convergiu = newton_lote(lambda x: np.cos(x) - x, [0.5, 1.0], tol=1e-12)
+    assert np.all(convergiu)
+    np.testing.assert_allclose(raizes, 0.7390851332151607, rtol=1e-14)
+
 def test_sem_convergencia():
     """
     Testa se a secante levanta RuntimeError quando não converge.
@@ -99,3 +129,156 @@ def test_iteracoes_retorno_lista():
     assert isinstance(it1, list)
     assert isinstance(it2, list)
     assert isinstance(it3, list)
+
+
+def test_lote_parametros():
+    """
+    Testa os métodos em lote resolvendo x^3 = c para vários valores de c,
+    com uma chamada da função por iteração.
+    """
+    c = np.linspace(1.0, 8.0, 1000).reshape(10, 100)
+    chamadas = []
+
+    def f(x, c):
+        chamadas.append(x.size)
+        return x**3 - c
+
+    esperado = np.cbrt(c)
+    for metodo, a, b in (("bissecao", 0.0, 3.0), ("secante", 1.0, 2.0), ("newton_raphson", 1.5, None)):
+        chamadas.clear()
+        raizes, iteracoes, convergiu = raiz_lote(f, a, b, tol=1e-10, method=metodo, args=(c,))
+        assert raizes.shape == iteracoes.shape == convergiu.shape == (10, 100)
+        assert np.all(convergiu)
+        np.testing.assert_allclose(raizes, esperado, atol=1e-9)
+        assert len(chamadas) <= iteracoes.max() * 2 + 3
+        assert sum(chamadas) < 3 * c.size * (iteracoes.max() + 2)
+
+    raizes, _, convergiu = newton_lote(lambda x, c: x**3 - c, 1.5, lambda x, c: 3 * x**2,
+                                       tol=1e-12, args=(c,))
+    assert np.all(convergiu)
+    np.testing.assert_allclose(raizes, esperado, rtol=1e-12)
+
+def test_lote_falhas_por_elemento():
+    """
+    Testa se falhas em alguns elementos não interrompem os demais.
+    """
+    raizes, _, convergiu = bissecao_lote(lambda x: x**2 - 1, [0, 2, -2], [2, 3, 0])
+    np.testing.assert_array_equal(convergiu, [True, False, True])
+    assert np.isnan(raizes[1])
+    np.testing.assert_allclose(raizes[[0, 2]], [1, -1], atol=1e-6)
+
+    # Secante com f(a) = f(b) no segundo elemento e função escalar.
+    raizes, iteracoes, convergiu = secante_lote(funcao1, [1.5, 0.0], [2.5, 2.0])
+    np.testing.assert_array_equal(convergiu, [True, False])
+    assert raizes[0] == pytest.approx(2.0, abs=1e-6)
+    assert iteracoes[1] == 0
+
+    # Newton com derivada nula no ponto inicial.
+    _, _, convergiu = newton_lote(lambda x: x**2 - 2, [0.0, 1.0], lambda x: 2 * x)
+    np.testing.assert_array_equal(convergiu, [False, True])
+
+    with pytest.raises(ValueError, match="Método não reconhecido"):
+        raiz_lote(funcao1, 0, 1, method="nao_existe")
+
+
+def test_brent():
+    """
+    Testa se o método de Brent encontra a raiz com menos avaliações que a bisseção.
+    """
+    chamadas = []
+
+    def f(x):
+        chamadas.append(x)
+        return x**3 - 2*x - 5
+
+    r, iteracoes = raiz(f, 2, 3, tol=1e-10, method="brent")
+    assert r == pytest.approx(2.0945514815423265, abs=1e-10)
+    assert len(chamadas) == len(iteracoes) + 2 <= 12
+
+    chamadas.clear()
+    raiz(f, 2, 3, tol=1e-10, method="bissecao")
+    assert len(chamadas) > 30
+
+    assert raiz(funcao2, 0, 2, method="brent")[0] == pytest.approx(math.log(2), abs=1e-6)
+    r, iteracoes = raiz(funcao2, 0, 2, tol=1e-12, method="brent")
+    assert type(r) is float and all(type(x) is float for x in iteracoes)
+    assert raiz(funcao1, 1, 2, method="brent") == (2, [2])
+    with pytest.raises(ValueError, match="mesmo sinal"):
+        raiz(funcao1, a=3, b=4, method="brent")
+    with pytest.raises(RuntimeError, match="Número máximo"):
+        raiz(f, 2, 3, tol=1e-14, max_iter=2, method="brent")
+
+
+def test_todas_raizes():
+    """
+    Testa a busca de todas as raízes: simples, dupla, exata na amostragem e
+    descarte de polos.
+    """
+    chamadas = []
+
+    def f(x):
+        chamadas.append(np.size(x))
+        return np.sin(x)
+
+    raizes = todas_raizes(f, -1, 10)
+    np.testing.assert_allclose(raizes, [0, np.pi, 2*np.pi, 3*np.pi], atol=1e-9)
+    assert chamadas[0] == 1001
+
+    # Raiz dupla em 0.3 (sem mudança de sinal) e raiz simples em -0.5.
+    raizes = todas_raizes(lambda x: (x - 0.3)**2 * (x + 0.5), -1, 1, n=100)
+    np.testing.assert_allclose(raizes, [-0.5, 0.3], atol=1e-6)
+
+    # Raiz exatamente sobre uma amostra e polo em x = 0.25.
+    np.testing.assert_allclose(todas_raizes(lambda x: x, -1, 1, n=10), [0.0])
+    assert todas_raizes(lambda x: 1/(x - 0.25), 0, 1, n=10).size == 0
+
+    with pytest.raises(ValueError, match="a < b"):
+        todas_raizes(np.sin, 1, 0)
+
+
+def test_todas_raizes_executor():
+    """
+    Testa o refinamento dos intervalos distribuído por um executor.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    esperado = todas_raizes(np.cos, 0, 50)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        np.testing.assert_array_equal(todas_raizes(np.cos, 0, 50, executor=executor), esperado)
+    assert esperado.size == 16
+
+
+def test_raizes_polinomio_coeficientes():
+    """
+    Testa as raízes de polinômios dados pelos coeficientes (maior grau primeiro).
+    """
+    np.testing.assert_allclose(raizes_polinomio([1, -6, 11, -6]), [1, 2, 3], atol=1e-12)
+    np.testing.assert_allclose(raizes_polinomio([1, 0, 1]), [-1j, 1j], atol=1e-12)
+    np.testing.assert_allclose(raizes_polinomio([1, 0, 1, 0], reais=True), [0.0], atol=1e-12)
+
+    # Coeficientes líderes nulos e polinômio constante.
+    np.testing.assert_allclose(raizes_polinomio([0, 0, 2, -4]), [2])
+    assert raizes_polinomio([3]).size == 0
+
+    # O refinamento de Newton reduz o resíduo nas raízes.
+    coef = np.poly(np.arange(1, 16))
+    residuo = lambda z: np.abs(np.polyval(coef, z)).max()
+    assert residuo(raizes_polinomio(coef)) <= residuo(raizes_polinomio(coef, polir=False))
+
+    with pytest.raises(ValueError, match="nulo"):
+        raizes_polinomio([0, 0])
+    with pytest.raises(ValueError, match="coeficientes"):
+        raizes_polinomio([1, np.nan])
+
+
+def test_raizes_polinomio_interpoladores():
+    """
+    Testa as raízes de interpoladores, usados diretamente na forma de Newton.
+    """
+    x = [0.0, 1.0, 2.0, 3.0, 4.0, 5.0]
+    p = InterpoladorPolinomial(x, [(t - 0.5)*(t - 2.5)*(t + 1)*(t**2 + 1) for t in x])
+    np.testing.assert_allclose(raizes_polinomio(p), [-1, -1j, 1j, 0.5, 2.5], atol=1e-10)
+    np.testing.assert_allclose(raizes_polinomio(p, reais=True), [-1, 0.5, 2.5], atol=1e-10)
+
+    h = InterpoladorHermite([0.0, 1.0, 2.0], [-2.0, -1.0, 2.0], [0.0, 2.0, 4.0])
+    np.testing.assert_allclose(raizes_polinomio(h), [-math.sqrt(2), math.sqrt(2)], atol=1e-12)
@@ -0,0 +1,29 @@
+import pytest
+
+from cb2325numericag8.utils.validacao import validar_metodo, validar_precisao
+
+
+def test_validar_metodo():
+    """
+    Testa a normalização do nome do método e as mensagens de erro.
+    """
+
+    metodos = {'Trapezoidal': None, 'Simpson': None}
+    assert validar_metodo('simpson', metodos) == 'Simpson'
+    assert validar_metodo('TRAPEZOIDAL', ('Trapezoidal',)) == 'Trapezoidal'
+    with pytest.raises(ValueError, match="Os métodos válidos são Trapezoidal, Simpson"):
+        validar_metodo('Gauss', metodos)
+    with pytest.raises(ValueError, match="deve ser uma string"):
+        validar_metodo(3, metodos)
+
+
+def test_validar_precisao():
+    """
+    Testa se apenas None e inteiros não negativos são aceitos.
+    """
+
+    for precisao in (None, 0, 7):
+        validar_precisao(precisao)
+    for precisao in (-1, 2.0, "3"):
+        with pytest.raises(ValueError, match="precisão deve ser um inteiro não negativo"):
+            validar_precisao(precisao)